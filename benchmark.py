@@ -0,0 +1,263 @@
+"""
+Benchmarks of the Maven Build Manager on a synthetic workspace.
+
+Creates root projects with modules, excluded directories and a fake mvn that prints a
+configurable amount of output, measures discovery, pom parsing, table population and
+the console throughput of a build and writes the results to a JSON file, so the
+results of two versions can be compared:
+
+    python benchmark.py --output before.json
+    python benchmark.py --output after.json --compare before.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import threading
+import statistics
+
+import maven_build_manager
+from maven_build_manager import TRACER, VERSION, MavenBuild, MavenProject, ProjectDiscovery, ProjectIndex
+
+# Prints lines_out lines of line_length characters like Maven, every 100th line carries the
+# time it was written, so the benchmark can measure the latency until it reaches the console
+FAKE_MVN = r'''
+import sys, time
+lines_out = int(sys.argv[1])
+line_length = int(sys.argv[2])
+padding = "x" * max(0, line_length - 40)
+for i in range(lines_out):
+    if i % 100 == 0:
+        sys.stdout.write(f"[INFO] @{time.time():.6f} {padding}\n")
+    else:
+        sys.stdout.write(f"[INFO] line {i} {padding}\n")
+sys.stdout.write("[INFO] Reactor Summary for fake 1.0:\n")
+sys.stdout.write("[INFO] fake ............................................. SUCCESS [  1.000 s]\n")
+sys.stdout.write("[INFO] BUILD SUCCESS\n")
+sys.stdout.write("[INFO] Total time:  1.000 s\n")
+'''
+
+def pom_xml(artifact_id, dependencies, parent=None, modules=()):
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<project xmlns="http://maven.apache.org/POM/4.0.0">',
+             '  <modelVersion>4.0.0</modelVersion>']
+    if parent:
+        lines += ['  <parent>', '    <groupId>bench</groupId>', f'    <artifactId>{parent}</artifactId>',
+                  '    <version>1.0</version>', '  </parent>']
+    lines += ['  <groupId>bench</groupId>', f'  <artifactId>{artifact_id}</artifactId>', '  <version>1.0</version>',
+              '  <properties>', '    <maven.compiler.release>17</maven.compiler.release>', '  </properties>']
+    if modules:
+        lines += ['  <modules>'] + [f'    <module>{module}</module>' for module in modules] + ['  </modules>']
+    # Large poms are mostly dependencies and plugin configuration
+    lines.append('  <dependencies>')
+    for i in range(dependencies):
+        lines += ['    <dependency>', '      <groupId>org.example</groupId>', f'      <artifactId>lib-{i}</artifactId>',
+                  '      <version>1.0</version>', '    </dependency>']
+    lines += ['  </dependencies>', '</project>']
+    return "\n".join(lines) + "\n"
+
+def create_workspace(directory, args):
+    """Creates the projects, returns the list of all pom.xml files (roots and modules)."""
+    base_dir = os.path.join(directory, "projects")
+    poms = []
+    for i in range(args.projects):
+        # Some projects are grouped in folders, like checkouts of several teams
+        group = os.path.join(base_dir, f"group-{i % args.groups}") if args.groups else base_dir
+        root = os.path.join(group, f"project-{i}")
+        modules = [f"module-{j}" for j in range(args.modules)]
+        os.makedirs(os.path.join(root, "src", "main", "java"), exist_ok=True)
+        poms.append(os.path.join(root, "pom.xml"))
+        with open(poms[-1], "w", encoding="utf-8") as f:
+            f.write(pom_xml(f"project-{i}", args.dependencies, modules=modules))
+        for module in modules:
+            os.makedirs(os.path.join(root, module, "src", "main", "java"), exist_ok=True)
+            poms.append(os.path.join(root, module, "pom.xml"))
+            with open(poms[-1], "w", encoding="utf-8") as f:
+                f.write(pom_xml(f"project-{i}-{module}", args.dependencies, parent=f"project-{i}"))
+    for i in range(args.excluded):
+        excluded = os.path.join(base_dir, f"excluded-{i}", "old-project")
+        os.makedirs(excluded, exist_ok=True)
+        with open(os.path.join(excluded, "pom.xml"), "w", encoding="utf-8") as f:
+            f.write(pom_xml(f"excluded-{i}", args.dependencies))
+    with open(os.path.join(directory, "config.ini"), "w", encoding="utf-8") as f:
+        f.write(f"[maven]\nprojects_directory = {base_dir}\nexclude_dirs = excluded-*\n")
+    with open(os.path.join(directory, "fake_mvn.py"), "w", encoding="utf-8") as f:
+        f.write(FAKE_MVN)
+    return base_dir, poms
+
+def measure(repeat, function, setup=None):
+    """Runs function repeat times, returns the durations in seconds and the last result."""
+    durations = []
+    result = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start)
+    return durations, result
+
+def timing(durations, **extra):
+    result = {"median": statistics.median(durations), "min": min(durations), "runs": durations}
+    result.update(extra)
+    return result
+
+def bench_discovery(directory, base_dir, args):
+    index_file = os.path.join(directory, "project_index.json")
+
+    def remove_index():
+        if os.path.exists(index_file):
+            os.remove(index_file)
+
+    def discover():
+        index = ProjectIndex(index_file, base_dir)
+        index.load()
+        found = []
+        ProjectDiscovery(base_dir, index, found.extend).run()
+        return found
+
+    cold, found = measure(args.repeat, discover, remove_index)
+    warm, _ = measure(args.repeat, discover)
+    return {
+        "discovery_cold": timing(cold, projects=len(found)),
+        "discovery_warm": timing(warm, projects=len(found)),
+    }
+
+def bench_pom_parsing(poms, args):
+    project_dirs = [os.path.dirname(path) for path in poms]
+    durations, projects = measure(args.repeat, lambda: [MavenProject(path) for path in project_dirs])
+    if any(project.artifactId is None for project in projects):
+        raise RuntimeError("pom.xml konnte nicht gelesen werden")
+    return {"pom_parsing": timing(durations, poms=len(poms), per_pom_us=statistics.median(durations) / len(poms) * 1e6)}
+
+def bench_table(projects, args):
+    try:
+        from PyQt5 import QtCore
+        from maven_build_gui import ProjectTreeModel
+    except ImportError:
+        return {"table_population": {"skipped": "PyQt5 nicht installiert"}}
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication(sys.argv[:1])
+    model = ProjectTreeModel()
+
+    def populate():
+        # In batches like ProjectLoaderWorker delivers them
+        for start in range(0, len(projects), 50):
+            model.addProjects(projects[start:start + 50])
+
+    durations, _ = measure(args.repeat, populate, model.clear)
+    app.processEvents()
+    return {"table_population": timing(durations, rows=model.rowCount())}
+
+def bench_console(directory, args):
+    command = [sys.executable, os.path.join(directory, "fake_mvn.py"), str(args.output_lines), str(args.line_length)]
+
+    def run_build():
+        # MavenBuildWorker only runs MavenBuild in a QThread, the console is read on a timer like in the GUI
+        build = MavenBuild(command, directory, os.path.join(directory, "logs", "bench.log.gz"))
+        thread = threading.Thread(target=build.run)
+        latencies = []
+        received = 0
+        thread.start()
+        while True:
+            alive = thread.is_alive()
+            text = build.console.take()
+            now = time.time()
+            received += len(text)
+            for line in text.splitlines():
+                if line.startswith("[INFO] @"):
+                    latencies.append(now - float(line[8:].split(" ", 1)[0]))
+            if not alive:
+                break
+            time.sleep(args.console_interval / 1000)
+        thread.join()
+        return build, latencies, received
+
+    durations, (build, latencies, received) = measure(args.repeat, run_build)
+    latencies.sort()
+    return {"console": timing(
+        durations,
+        lines=build.line_count,
+        lines_per_second=build.line_count / statistics.median(durations),
+        characters=received,
+        latency_p50_ms=latencies[len(latencies) // 2] * 1000 if latencies else None,
+        latency_p95_ms=latencies[int(len(latencies) * 0.95)] * 1000 if latencies else None,
+        latency_max_ms=latencies[-1] * 1000 if latencies else None,
+    )}
+
+def compare(results, previous_file):
+    with open(previous_file, "r", encoding="utf-8") as f:
+        previous = json.load(f)
+    print(f"\nVergleich mit {previous_file} (Version {previous.get('version')}):")
+    for name, result in results["results"].items():
+        before = previous.get("results", {}).get(name, {})
+        if "median" in result and "median" in before and before["median"] > 0:
+            ratio = result["median"] / before["median"]
+            print(f"  {name:20} {before['median']:.3f} s -> {result['median']:.3f} s ({ratio:.2f}x)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks des Maven Build Managers mit einem synthetischen Workspace")
+    parser.add_argument("--projects", type=int, default=200, help="Anzahl Root-Projekte (Standard: 200)")
+    parser.add_argument("--modules", type=int, default=3, help="Module je Projekt (Standard: 3)")
+    parser.add_argument("--groups", type=int, default=10, help="Verzeichnisse, auf die die Projekte verteilt werden (0 = keine)")
+    parser.add_argument("--excluded", type=int, default=20, help="Anzahl ausgeschlossener Verzeichnisse (Standard: 20)")
+    parser.add_argument("--dependencies", type=int, default=30, help="Dependencies je pom.xml, bestimmt die Größe (Standard: 30)")
+    parser.add_argument("--output-lines", type=int, default=200000, help="Ausgabezeilen des Fake-Maven (Standard: 200000)")
+    parser.add_argument("--line-length", type=int, default=120, help="Länge einer Ausgabezeile (Standard: 120)")
+    parser.add_argument("--console-interval", type=int, default=100, help="Millisekunden zwischen zwei Konsolen-Updates (Standard: 100)")
+    parser.add_argument("--repeat", type=int, default=3, help="Wiederholungen je Messung (Standard: 3)")
+    parser.add_argument("--workspace", help="Verzeichnis für den Workspace (Standard: temporär, wird gelöscht)")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON-Datei für die Ergebnisse")
+    parser.add_argument("--compare", help="Ergebnisse einer früheren Messung zum Vergleich")
+    parser.add_argument("--trace", help="Zusätzlich einen Chrome-Trace der Messungen speichern (verfälscht die Zeiten leicht)")
+    args = parser.parse_args(argv)
+    TRACER.enabled = bool(args.trace)
+
+    directory = args.workspace or tempfile.mkdtemp(prefix="mbm-bench-")
+    os.makedirs(directory, exist_ok=True)
+    # ProjectDiscovery reads the exclude patterns from the config file
+    maven_build_manager.CONFIG_FILE = os.path.join(directory, "config.ini")
+    try:
+        base_dir, poms = create_workspace(directory, args)
+        results = {}
+        results.update(bench_discovery(directory, base_dir, args))
+        index = ProjectIndex(os.path.join(directory, "project_index.json"), base_dir)
+        index.load()
+        results.update(bench_pom_parsing(poms, args))
+        results.update(bench_table(index.projects(), args))
+        results.update(bench_console(directory, args))
+    finally:
+        if not args.workspace:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    output = {
+        "version": VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "workspace", "trace")},
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2)
+    for name, result in results.items():
+        if "median" in result:
+            extra = ", ".join(f"{key}={value:.1f}" if isinstance(value, float) else f"{key}={value}"
+                              for key, value in result.items() if key not in ("median", "min", "runs"))
+            print(f"{name:20} {result['median']:.3f} s  {extra}")
+        else:
+            print(f"{name:20} {result.get('skipped')}")
+    print(f"Ergebnisse gespeichert in {args.output}")
+    if args.trace:
+        TRACER.export(args.trace)
+        print(f"Trace gespeichert in {args.trace}")
+    if args.compare:
+        compare(output, args.compare)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
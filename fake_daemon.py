@@ -0,0 +1,65 @@
+"""
+Reference implementation of the build daemon protocol of the executor "daemon".
+
+Reads one JSON line {"cwd": ..., "args": [...]} per build from stdin, writes the output of
+the build to stdout and ends every build with the line "@@MBM-EXIT <exit code>". The daemon
+stays alive between the builds until stdin is closed. Instead of Maven it only prints a few
+lines like Maven, so the executor can be tried out and checked without a JVM:
+
+    [maven]
+    daemon_command = python fake_daemon.py
+
+    python maven_build_manager.py daemon-check
+
+With -Dfake.exit=<code> in the arguments the build ends with that exit code, with
+-Dfake.lines=<n> it prints n additional lines.
+"""
+import os
+import sys
+import json
+import time
+
+EXIT_MARKER = "@@MBM-EXIT"
+
+def property_value(args, name, default):
+    prefix = f"-D{name}="
+    for arg in args:
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return default
+
+def run_build(number, request):
+    args = request.get("args", [])
+    cwd = request.get("cwd", "")
+    start = time.time()
+    # The pid and the number of the build show that the daemon is reused
+    print(f"[INFO] Fake-Daemon {os.getpid()}, Build {number} in {cwd}")
+    print(f"[INFO] Argumente: {' '.join(args)}")
+    if not os.path.isdir(cwd):
+        print(f"[ERROR] Verzeichnis {cwd} existiert nicht")
+        return 1
+    for i in range(int(property_value(args, "fake.lines", "0"))):
+        print(f"[INFO] line {i}")
+    exit_code = int(property_value(args, "fake.exit", "0"))
+    print("[INFO] ------------------------------------------------------------------------")
+    print("[INFO] BUILD SUCCESS" if exit_code == 0 else "[INFO] BUILD FAILURE")
+    print("[INFO] ------------------------------------------------------------------------")
+    print(f"[INFO] Total time:  {time.time() - start:.3f} s")
+    return exit_code
+
+def main():
+    number = 0
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            exit_code = run_build(number, json.loads(line))
+        except Exception as e:
+            print(f"[ERROR] Ungültige Anfrage: {e}")
+            exit_code = 1
+        print(f"{EXIT_MARKER} {exit_code}", flush=True)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,1607 @@
+import os
+import sys
+import time
+import queue
+from PyQt5 import QtWidgets, QtCore, QtGui
+
+from maven_build_manager import (
+    HISTORY_DATABASE,
+    PROJECT_INDEX_FILE,
+    TRACER,
+    VERSION,
+    BuildHistory,
+    BuildJob,
+    DependencyGraph,
+    ExecutorRegistry,
+    JdkDiscovery,
+    LogArchive,
+    MavenProject,
+    ProjectDiscovery,
+    ProjectIndex,
+    ProjectModule,
+    ProjectWatcher,
+    build_command,
+    build_environment,
+    build_limits,
+    build_log_path,
+    create_build_cache,
+    create_offline_resolver,
+    create_snapshot_store,
+    max_parallel_builds,
+    module_build_options,
+    take_ready_job,
+    format_cache_stats,
+    thread_advice,
+    format_bytes,
+    archived_logs,
+    log_directory,
+    BatchJob,
+    create_batch_job,
+    test_run_plan,
+    test_shard_count,
+    final_runs,
+)
+
+class MavenBuildWorker(QtCore.QThread):
+    """Runs a MavenBuild in its own thread."""
+
+    def __init__(self, build, parent=None):
+        super().__init__(parent)
+        self.build = build
+
+    def run(self):
+        self.build.run()
+
+    def cancel(self):
+        self.build.cancel()
+
+class BuildScheduler(QtCore.QObject):
+    """
+    Runs the queued build jobs, at most max_parallel at the same time. A job only starts
+    once all jobs it depends on were successful, it is skipped if one of them failed.
+    """
+    job_started = QtCore.pyqtSignal(object)
+    job_finished = QtCore.pyqtSignal(object)
+
+    def __init__(self, max_parallel=1, parent=None):
+        super().__init__(parent)
+        self.max_parallel = max_parallel
+        # SnapshotStore for the change detection, None disables it
+        self.snapshot_store = None
+        # OfflineResolver for automatic offline builds, None disables them
+        self.offline_resolver = None
+        # BuildLimits (time limits, grace period on cancel), None means the defaults
+        self.limits = None
+        # BuildCache restoring the outputs of unchanged builds, None disables it
+        self.build_cache = None
+        self.queue = []
+        self.running = []
+
+    def submit(self, job):
+        self.queue.append(job)
+        self._startNext()
+
+    def cancel(self, job):
+        if job in self.queue:
+            self.queue.remove(job)
+            job.status = BuildJob.CANCELED
+            self.job_finished.emit(job)
+        elif job in self.running and job.worker:
+            job.worker.cancel()
+
+    def cancelAll(self):
+        for job in list(self.queue) + list(self.running):
+            self.cancel(job)
+
+    def _startNext(self):
+        while self.queue and len(self.running) < self.max_parallel:
+            job, skipped = take_ready_job(self.queue)
+            for skipped_job in skipped:
+                self.job_finished.emit(skipped_job)
+            if job is None:
+                break
+            job.worker = MavenBuildWorker(job.start(self.snapshot_store, self.offline_resolver, self.limits,
+                                                     self.build_cache))
+            job.worker.finished.connect(lambda job=job: self._jobFinished(job))
+            self.running.append(job)
+            job.worker.start()
+            self.job_started.emit(job)
+
+    def _jobFinished(self, job):
+        job.finish()
+        if job in self.running:
+            self.running.remove(job)
+        self.job_finished.emit(job)
+        self._startNext()
+
+class JdkDiscoveryWorker(QtCore.QThread):
+    jdks_found = QtCore.pyqtSignal(list)
+    discovery_failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, install_dir, force=False, parent=None):
+        super().__init__(parent)
+        self.install_dir = install_dir
+        self.force = force
+
+    def run(self):
+        try:
+            with TRACER.span("JdkDiscoveryWorker.run", "jdk"):
+                jdks = JdkDiscovery(self.install_dir).discover(self.force)
+            self.jdks_found.emit(jdks)
+        except FileNotFoundError:
+            self.discovery_failed.emit(f"Java-Installationsverzeichnis '{self.install_dir}' existiert nicht.")
+        except Exception as e:
+            self.discovery_failed.emit(f"Fehler beim Ermitteln der Java-Versionen: {e}")
+
+class ProjectLoaderWorker(QtCore.QThread):
+    # Found projects are delivered in batches (list of MavenProject) instead of one signal per project
+    projects_found = QtCore.pyqtSignal(list)
+    project_updated = QtCore.pyqtSignal(object)
+    project_removed = QtCore.pyqtSignal(str)
+    
+    def __init__(self, base_dir, index=None, parent=None):
+        super().__init__(parent)
+        self.base_dir = base_dir
+        self.index = index
+        self.directories = None
+        self.emitTimes = queue.Queue()
+
+    def run(self):
+        discovery = ProjectDiscovery(self.base_dir, self.index, self._emitFound,
+                                     self.project_updated.emit, self.project_removed.emit)
+        with TRACER.span("ProjectLoaderWorker.run", "scan"):
+            discovery.run()
+        # Starting point for the ProjectWatcher
+        self.directories = discovery.directories
+
+    def _emitFound(self, projects):
+        if TRACER.enabled:
+            # Taken by the GUI thread to measure the delivery of the queued signal
+            self.emitTimes.put(time.perf_counter())
+        self.projects_found.emit(projects)
+
+class ProjectWatcherWorker(QtCore.QThread):
+    projects_found = QtCore.pyqtSignal(list)
+    project_updated = QtCore.pyqtSignal(object)
+    project_removed = QtCore.pyqtSignal(str)
+    # New list of paths to watch after a change
+    watch_paths_changed = QtCore.pyqtSignal(list)
+
+    def __init__(self, base_dir, index, directories, debounce, poll_interval, parent=None):
+        super().__init__(parent)
+        self.watcher = ProjectWatcher(base_dir, index, directories, self.projects_found.emit,
+                                      self.project_updated.emit, self.project_removed.emit, debounce, poll_interval)
+
+    def run(self):
+        self.watcher.run(self.watch_paths_changed.emit)
+
+    def stop(self):
+        self.watcher.stop()
+
+class ProjectTreeModel(QtCore.QAbstractItemModel):
+    """
+    Tree model holding the MavenProject records, rows are appended in batches. The modules
+    of an aggregator are its children. The internal pointer of an index is its parent
+    (None for the projects), so the model needs no extra node objects.
+    """
+    HEADERS = ["Projektname (ArtifactId)", "Name (GroupId)", "Java-Version", "Pfad"]
+    COLUMNS = ("artifactId", "groupId", "java_version", "path")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._projects = []
+        # Project path -> row
+        self._rows = {}
+        # id of a ProjectModule -> (parent project or module, row)
+        self._parents = {}
+
+    def _node(self, index):
+        parent = index.internalPointer()
+        if parent is None:
+            return self._projects[index.row()]
+        return parent.modules[index.row()]
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        return self.createIndex(row, column, self._node(parent))
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        node = index.internalPointer()
+        if node is None:
+            return QtCore.QModelIndex()
+        if isinstance(node, ProjectModule):
+            parent, row = self._parents[id(node)]
+            return self.createIndex(row, 0, parent)
+        return self.createIndex(self._rows[node.path], 0)
+
+    def _registerModules(self, node):
+        # Parent and row of every module, for parent()
+        for row, module in enumerate(node.modules):
+            self._parents[id(module)] = (node, row)
+            self._registerModules(module)
+
+    def _unregisterModules(self, node):
+        for module in node.modules:
+            self._parents.pop(id(module), None)
+            self._unregisterModules(module)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            return len(self._projects)
+        if parent.column() != 0:
+            return 0
+        return len(self._node(parent).modules)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.COLUMNS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = self._node(index)
+        column = self.COLUMNS[index.column()]
+        if role == QtCore.Qt.DisplayRole:
+            if isinstance(node, ProjectModule) and column == "java_version":
+                return f"Profil {node.profile}" if node.profile else ""
+            return getattr(node, column)
+        if role == QtCore.Qt.ToolTipRole and column == "path":
+            # Tooltip for the full path
+            return node.path
+        if role == QtCore.Qt.UserRole:
+            return node
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def projects(self):
+        return list(self._projects)
+
+    def project(self, row):
+        return self._projects[row]
+
+    def rootProject(self, index):
+        """The root project of the row at index (a project or one of its modules)."""
+        while index.parent().isValid():
+            index = index.parent()
+        return self._projects[index.row()]
+
+    def clear(self):
+        self.beginResetModel()
+        self._projects = []
+        self._rows = {}
+        self._parents = {}
+        self.endResetModel()
+
+    def addProjects(self, projects):
+        new_projects = []
+        for project in projects:
+            if project.path in self._rows:
+                self.updateProject(project)
+            else:
+                new_projects.append(project)
+        if not new_projects:
+            return
+        first = len(self._projects)
+        # One insert for the whole batch
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(new_projects) - 1)
+        for row, project in enumerate(new_projects, first):
+            self._projects.append(project)
+            self._rows[project.path] = row
+            self._registerModules(project)
+        self.endInsertRows()
+
+    def updateProject(self, project):
+        row = self._rows.get(project.path)
+        if row is None:
+            self.addProjects([project])
+            return
+        old = self._projects[row]
+        parent = self.index(row, 0)
+        if old.modules:
+            # The indexes of the modules point to the old record, so its children are replaced
+            self.beginRemoveRows(parent, 0, len(old.modules) - 1)
+            self._unregisterModules(old)
+            self._projects[row] = MavenProject.from_dict(dict(old.to_dict(), modules=[]))
+            self.endRemoveRows()
+        if project.modules:
+            self.beginInsertRows(parent, 0, len(project.modules) - 1)
+            self._projects[row] = project
+            self._registerModules(project)
+            self.endInsertRows()
+        self._projects[row] = project
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+    def removeProject(self, path):
+        row = self._rows.get(path)
+        if row is None:
+            return
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self._unregisterModules(self._projects[row])
+        del self._projects[row]
+        self._rows = {project.path: i for i, project in enumerate(self._projects)}
+        self.endRemoveRows()
+
+class LogViewerDialog(QtWidgets.QDialog):
+    """Shows an archived build log page by page, only the visible page is read."""
+
+    PAGE_SIZE = 1000
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.archive = LogArchive(path)
+        self.pageStart = 0
+        self.setWindowTitle(f"Build-Log: {os.path.basename(path)}")
+        self.resize(1100, 700)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        splitter = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
+
+        self.entryList = QtWidgets.QListWidget()
+        self.entryList.itemActivated.connect(self._jumpToEntry)
+        self.entryList.itemClicked.connect(self._jumpToEntry)
+        index = self.archive.index
+        entries = [(number, f"Modul fehlgeschlagen: {name}") for number, name in index["failed_modules"]]
+        entries += [(number, text) for number, text in index["test_failures"]]
+        entries += [(number, "ERROR") for number in index["errors"]]
+        entries += [(number, "WARNING") for number in index["warnings"]]
+        for number, text in sorted(entries):
+            item = QtWidgets.QListWidgetItem(f"Zeile {number + 1}: {text}")
+            item.setData(QtCore.Qt.UserRole, number)
+            self.entryList.addItem(item)
+        splitter.addWidget(self.entryList)
+
+        self.logView = QtWidgets.QPlainTextEdit()
+        self.logView.setReadOnly(True)
+        self.logView.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        splitter.addWidget(self.logView)
+        splitter.setSizes([300, 800])
+        layout.addWidget(splitter, 1)
+
+        navigationLayout = QtWidgets.QHBoxLayout()
+        for text, slot in (("|<", self._firstPage), ("<", self._previousPage), (">", self._nextPage), (">|", self._lastPage)):
+            button = QtWidgets.QPushButton(text)
+            button.clicked.connect(slot)
+            navigationLayout.addWidget(button)
+        self.firstErrorButton = QtWidgets.QPushButton("Erster Fehler")
+        self.firstErrorButton.setEnabled(self.archive.first_error() is not None)
+        self.firstErrorButton.clicked.connect(lambda: self._showLine(self.archive.first_error()))
+        navigationLayout.addWidget(self.firstErrorButton)
+        self.searchInput = QtWidgets.QLineEdit()
+        self.searchInput.setPlaceholderText("Suchen...")
+        self.searchInput.returnPressed.connect(self._search)
+        navigationLayout.addWidget(self.searchInput, 1)
+        self.pageLabel = QtWidgets.QLabel()
+        navigationLayout.addWidget(self.pageLabel)
+        layout.addLayout(navigationLayout)
+
+        self._showPage(0)
+
+    def _showPage(self, start, line=None):
+        last_start = max(0, self.archive.line_count - self.PAGE_SIZE)
+        self.pageStart = max(0, min(start, last_start))
+        # A carriage return would start a new block and shift the line numbers
+        text = "\n".join(self.archive.lines(self.pageStart, self.PAGE_SIZE)).replace("\r", "")
+        self.logView.setPlainText(text)
+        end = min(self.archive.line_count, self.pageStart + self.PAGE_SIZE)
+        self.pageLabel.setText(f"Zeilen {self.pageStart + 1}-{end} von {self.archive.line_count}")
+        if line is not None:
+            block = self.logView.document().findBlockByNumber(line - self.pageStart)
+            cursor = QtGui.QTextCursor(block)
+            cursor.select(QtGui.QTextCursor.LineUnderCursor)
+            self.logView.setTextCursor(cursor)
+            self.logView.centerCursor()
+
+    def _showLine(self, line):
+        if line is None:
+            return
+        if not self.pageStart <= line < self.pageStart + self.PAGE_SIZE:
+            # The line is shown in the upper part of the page
+            self._showPage(line - self.PAGE_SIZE // 4, line)
+        else:
+            self._showPage(self.pageStart, line)
+
+    def _jumpToEntry(self, item):
+        self._showLine(item.data(QtCore.Qt.UserRole))
+
+    def _firstPage(self):
+        self._showPage(0)
+
+    def _previousPage(self):
+        self._showPage(self.pageStart - self.PAGE_SIZE)
+
+    def _nextPage(self):
+        self._showPage(self.pageStart + self.PAGE_SIZE)
+
+    def _lastPage(self):
+        self._showPage(self.archive.line_count)
+
+    def _search(self):
+        text = self.searchInput.text()
+        if not text:
+            return
+        current = self.pageStart + self.logView.textCursor().blockNumber()
+        line = self.archive.find(text, current + 1)
+        if line is None:
+            self.pageLabel.setText(f"'{text}' nicht gefunden")
+            return
+        self._showLine(line)
+
+    def done(self, result):
+        self.archive.close()
+        super().done(result)
+
+class MavenBuildGUI(QtWidgets.QWidget):
+    def __init__(self, config):
+        super().__init__()
+        self.config = config
+        # Saved maven projects
+        self.projectModel = ProjectTreeModel(self)
+        # Queue of the build jobs
+        self.scheduler = BuildScheduler(parent=self)
+        self.scheduler.snapshot_store = create_snapshot_store(self.config)
+        self.scheduler.offline_resolver = create_offline_resolver(self.config)
+        self.scheduler.limits = build_limits(self.config)
+        self.scheduler.build_cache = create_build_cache(self.config)
+        self.scheduler.job_started.connect(self._buildStarted)
+        self.scheduler.job_finished.connect(self._buildFinished)
+        self.jobs = []
+        # Build job -> console of the job
+        self.jobConsoles = {}
+        # Durations of the finished builds
+        self.history = BuildHistory(HISTORY_DATABASE)
+        # Keeps the project list current after the first scan
+        self.projectWatcherWorker = None
+        self.fileSystemWatcher = None
+        self.watchLimitReported = False
+        # Paths of the rows in the build log table
+        self.logPaths = []
+        # Executors (mvn, mvnd, warm daemon) per project
+        self.executors = ExecutorRegistry(self.config)
+        # Installed JDKs, determined in the background
+        self.jdks = None
+        self.jdkWorker = None
+        # Changes of the last build options are saved while the application runs
+        self.lastStateLoaded = False
+        self.configGeneration = self.config.generation
+        self._initUI()
+        # Load last build options
+        self._loadLastState()
+
+    def _initUI(self):
+        self.setWindowTitle(f"Maven Build Manager | v.{VERSION} © 2025 by magicmarcy")
+        self.resize(900, 900)
+        
+        tab_widget = QtWidgets.QTabWidget()
+        
+        # --- Tab 1: maven projects & build optionen ---
+        tab_projects = QtWidgets.QWidget()
+        projects_layout = QtWidgets.QVBoxLayout(tab_projects)
+        
+        lbl_projects = QtWidgets.QLabel("Gefundene Maven Projekte:")
+        projects_layout.addWidget(lbl_projects)
+        
+        # Filter for the projects (filters all columns while typing)
+        self.projectFilterInput = QtWidgets.QLineEdit()
+        self.projectFilterInput.setPlaceholderText("Projekte filtern...")
+        self.projectFilterInput.setClearButtonEnabled(True)
+        projects_layout.addWidget(self.projectFilterInput)
+        
+        # Tree of the projects and their modules (4 columns), sorting and filtering is done by the proxy model
+        self.projectProxyModel = QtCore.QSortFilterProxyModel(self)
+        self.projectProxyModel.setSourceModel(self.projectModel)
+        self.projectProxyModel.setFilterKeyColumn(-1)
+        # A project stays visible if one of its modules matches the filter
+        self.projectProxyModel.setRecursiveFilteringEnabled(True)
+        self.projectProxyModel.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.projectProxyModel.setSortCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.projectFilterInput.textChanged.connect(self.projectProxyModel.setFilterFixedString)
+        self.projectTable = QtWidgets.QTreeView()
+        self.projectTable.setModel(self.projectProxyModel)
+        self.projectTable.setSortingEnabled(True)
+        self.projectTable.sortByColumn(0, QtCore.Qt.AscendingOrder)
+        self.projectTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.projectTable.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.projectTable.header().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        # Same row heights, otherwise every inserted row would be measured
+        self.projectTable.setUniformRowHeights(True)
+        projects_layout.addWidget(self.projectTable)
+        
+        # Dropdown for maven-goals ("clean install", "clean", "test", "package")
+        goalOptionsLayout = QtWidgets.QHBoxLayout()
+        goalOptionsLabel = QtWidgets.QLabel("Maven Ziel:")
+        self.goalComboBox = QtWidgets.QComboBox()
+        self._fillGoalOptions()
+        goalOptionsLayout.addWidget(goalOptionsLabel)
+        goalOptionsLayout.addWidget(self.goalComboBox)
+        projects_layout.addLayout(goalOptionsLayout)
+        
+        # dynamic generated cheboxes (from "checkbox_options" in config-file)
+        optionsGroup = QtWidgets.QGroupBox("Maven Optionen")
+        self.optionsGroupLayout = QtWidgets.QHBoxLayout()
+        self.dynamicCheckboxes = []
+        self._fillCheckboxOptions()
+        optionsGroup.setLayout(self.optionsGroupLayout)
+        projects_layout.addWidget(optionsGroup)
+        
+        # Inputfield for further maven options
+        additionalOptionsLayout = QtWidgets.QHBoxLayout()
+        additionalOptionsLabel = QtWidgets.QLabel("Manuelle Maven Optionen:")
+        self.optionsInput = QtWidgets.QLineEdit(self.config.get("maven", "user_options", fallback=""))
+        additionalOptionsLayout.addWidget(additionalOptionsLabel)
+        additionalOptionsLayout.addWidget(self.optionsInput)
+        projects_layout.addLayout(additionalOptionsLayout)
+        
+        # Change detection: skip projects without changes since their last successful build
+        self.onlyChangedCheckbox = QtWidgets.QCheckBox("Nur geänderte Projekte bauen")
+        self.onlyChangedCheckbox.setToolTip("Projekte, deren Quellen sich seit dem letzten erfolgreichen Build nicht geändert haben, werden übersprungen")
+        projects_layout.addWidget(self.onlyChangedCheckbox)
+        
+        # Selected modules of an aggregator are built with -pl and -am/-amd in its reactor
+        moduleModeLayout = QtWidgets.QHBoxLayout()
+        moduleModeLayout.addWidget(QtWidgets.QLabel("Ausgewählte Module bauen:"))
+        self.moduleModeComboBox = QtWidgets.QComboBox()
+        self.moduleModeComboBox.addItem("mit ihren Abhängigkeiten (-am)", "am")
+        self.moduleModeComboBox.addItem("mit den abhängigen Modulen (-amd)", "amd")
+        self.moduleModeComboBox.addItem("nur die Module", "none")
+        moduleModeLayout.addWidget(self.moduleModeComboBox, 1)
+        projects_layout.addLayout(moduleModeLayout)
+        
+        # Test modes from the durations and results of the surefire/failsafe reports of earlier builds
+        testModeLayout = QtWidgets.QHBoxLayout()
+        testModeLayout.addWidget(QtWidgets.QLabel("Tests:"))
+        self.testModeComboBox = QtWidgets.QComboBox()
+        self.testModeComboBox.addItem("alle Tests", "all")
+        self.testModeComboBox.addItem("nur die zuletzt fehlgeschlagenen", "failed")
+        self.testModeComboBox.addItem("fehlgeschlagene zuerst, dann alle", "failed_first")
+        self.testModeComboBox.addItem("nach Dauer auf parallele Shards verteilen", "shards")
+        self.testModeComboBox.setToolTip("Verwendet die Testklassen und Dauern aus der Build-Historie des Projekts")
+        testModeLayout.addWidget(self.testModeComboBox, 1)
+        projects_layout.addLayout(testModeLayout)
+        
+        # Several projects in one reactor: one JVM, plugins and repository metadata are loaded once
+        self.batchCheckbox = QtWidgets.QCheckBox("Mehrere Projekte in einem Maven-Aufruf bauen (Batch)")
+        self.batchCheckbox.setToolTip("Baut die Projekte über einen generierten Aggregator mit -T und -fae, "
+                                      "die Ausgabe und der Status werden je Projekt angezeigt")
+        projects_layout.addWidget(self.batchCheckbox)
+        
+        # Build-Button (builds all selected projects)
+        self.buildButton = QtWidgets.QPushButton("Projekt bauen")
+        self.buildButton.setStyleSheet("background-color: #007d8f; color: #FFFFFF; font-weight: bold; font-size: 12px;")
+        self.buildButton.clicked.connect(self._buildProject)
+        projects_layout.addWidget(self.buildButton)
+        
+        # Build-Buttons with the dependencies between the projects (in topological order)
+        dependencyButtonsLayout = QtWidgets.QHBoxLayout()
+        self.buildUpstreamButton = QtWidgets.QPushButton("Mit Abhängigkeiten bauen (upstream)")
+        self.buildUpstreamButton.setStyleSheet("background-color: #007d8f; color: #FFFFFF; font-weight: bold; font-size: 12px;")
+        self.buildUpstreamButton.setToolTip("Baut die ausgewählten Projekte und alle Projekte, von denen sie abhängen")
+        self.buildUpstreamButton.clicked.connect(self._buildWithUpstream)
+        dependencyButtonsLayout.addWidget(self.buildUpstreamButton)
+        self.buildDownstreamButton = QtWidgets.QPushButton("Mit abhängigen Projekten bauen (downstream)")
+        self.buildDownstreamButton.setStyleSheet("background-color: #007d8f; color: #FFFFFF; font-weight: bold; font-size: 12px;")
+        self.buildDownstreamButton.setToolTip("Baut die ausgewählten Projekte und alle Projekte, die von ihnen abhängen")
+        self.buildDownstreamButton.clicked.connect(self._buildWithDownstream)
+        dependencyButtonsLayout.addWidget(self.buildDownstreamButton)
+        projects_layout.addLayout(dependencyButtonsLayout)
+        
+        # Cancel-Button (cancels the build of the current console tab)
+        self.cancelButton = QtWidgets.QPushButton("Build abbrechen")
+        self.cancelButton.setStyleSheet("background-color: #ff8c73; color: #000000; font-weight: bold; font-size: 12px;")
+        self.cancelButton.clicked.connect(self._cancelBuild)
+        self.cancelButton.setVisible(True)
+        projects_layout.addWidget(self.cancelButton)
+        
+        # Table of the queued and running builds
+        self.buildTable = QtWidgets.QTableWidget()
+        self.buildTable.setColumnCount(4)
+        self.buildTable.setHorizontalHeaderLabels(["Projekt", "Status", "Dauer", "CPU / Speicher"])
+        self.buildTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.buildTable.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.buildTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.buildTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.buildTable.setFixedHeight(120)
+        self.buildTable.itemSelectionChanged.connect(self._showSelectedBuildConsole)
+        projects_layout.addWidget(self.buildTable)
+        
+        # Log (Console), plain text with a limited number of lines, the full output is written to the log file
+        # The first tab holds the general messages, every build gets its own tab
+        self.consoleTabs = QtWidgets.QTabWidget()
+        self.consoleTabs.setFixedHeight(220)
+        self.consoleTabs.setTabsClosable(True)
+        self.consoleTabs.tabCloseRequested.connect(self._closeConsoleTab)
+        self.outputLog = self._createConsole()
+        self.consoleTabs.addTab(self.outputLog, "Allgemein")
+        self.consoleTabs.tabBar().setTabButton(0, QtWidgets.QTabBar.RightSide, None)
+        projects_layout.addWidget(self.consoleTabs)
+        
+        # Throughput of the running builds
+        self.throughputLabel = QtWidgets.QLabel("")
+        projects_layout.addWidget(self.throughputLabel)
+        
+        # The output of the builds is taken from the workers in chunks
+        self.consoleTimer = QtCore.QTimer(self)
+        self.consoleTimer.setInterval(100)
+        self.consoleTimer.timeout.connect(self._flushConsole)
+        
+        # Button to clear the console
+        self.clearConsoleButton = QtWidgets.QPushButton("Konsole leeren")
+        self.clearConsoleButton.setStyleSheet("background-color: #ff8c73; color: #00000; font-weight: bold; font-size: 12px;")
+        self.clearConsoleButton.clicked.connect(self._clearConsole)
+        projects_layout.addWidget(self.clearConsoleButton)
+        
+        tab_widget.addTab(tab_projects, "Maven Projekte")
+        
+        # --- Tab 2: Java Installations ---
+        tab_java = QtWidgets.QWidget()
+        java_layout = QtWidgets.QVBoxLayout(tab_java)
+        java_label = QtWidgets.QLabel("Installierte Java-Versionen (Installationsverzeichnis):")
+        java_layout.addWidget(java_label)
+        
+        # Table for the Java-Installations (4 columns)
+        self.javaTable = QtWidgets.QTableWidget()
+        self.javaTable.setColumnCount(4)
+        self.javaTable.setHorizontalHeaderLabels(["Name", "Version", "Pfad", "Java-Bin"])
+        self.javaTable.setSortingEnabled(True)
+        self.javaTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.javaTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        java_layout.addWidget(self.javaTable)
+        
+        self.refreshJavaButton = QtWidgets.QPushButton("Java Versionen aktualisieren")
+        self.refreshJavaButton.setStyleSheet("background-color: #007d8f; color: #FFFFFF; font-weight: bold; font-size: 12px;")
+        self.refreshJavaButton.clicked.connect(lambda: self._refreshJavaList(force=True))
+        java_layout.addWidget(self.refreshJavaButton)
+        
+        tab_widget.addTab(tab_java, "Java Installationen")
+
+        # --- Tab 3: Build history ---
+        tab_history = QtWidgets.QWidget()
+        history_layout = QtWidgets.QVBoxLayout(tab_history)
+        
+        history_layout.addWidget(QtWidgets.QLabel("Langsamste Module (erfolgreiche Builds):"))
+        self.slowestModulesTable = self._createHistoryTable(["Projekt", "Modul", "Ø Dauer", "Max. Dauer", "Builds"])
+        history_layout.addWidget(self.slowestModulesTable)
+        
+        history_layout.addWidget(QtWidgets.QLabel("Langsamste Testklassen (aus den Surefire-/Failsafe-Reports):"))
+        self.slowestTestsTable = self._createHistoryTable(["Projekt", "Testklasse", "Ø Dauer", "Max. Dauer", "Läufe", "Fehlgeschlagen"])
+        history_layout.addWidget(self.slowestTestsTable)
+        
+        history_layout.addWidget(QtWidgets.QLabel("Regressionen (letzte Dauer gegenüber dem Median der vorherigen Builds):"))
+        self.regressionsTable = self._createHistoryTable(["Projekt", "Modul", "Letzte Dauer", "Median", "Faktor"])
+        history_layout.addWidget(self.regressionsTable)
+        
+        trendLayout = QtWidgets.QHBoxLayout()
+        trendLayout.addWidget(QtWidgets.QLabel("Verlauf der Build-Dauer:"))
+        self.trendProjectComboBox = QtWidgets.QComboBox()
+        self.trendProjectComboBox.currentIndexChanged.connect(self._refreshTrend)
+        trendLayout.addWidget(self.trendProjectComboBox, 1)
+        history_layout.addLayout(trendLayout)
+        self.trendTable = self._createHistoryTable(["Datum", "Dauer", "Status", "Verlauf"])
+        history_layout.addWidget(self.trendTable)
+        
+        history_layout.addWidget(QtWidgets.QLabel("Build-Logs (Doppelklick öffnet das Log):"))
+        self.logTable = self._createHistoryTable(["Datei", "Datum", "Zeilen", "Fehler", "Warnungen", "Fehlgeschlagene Module"])
+        self.logTable.cellDoubleClicked.connect(self._openBuildLog)
+        history_layout.addWidget(self.logTable)
+        
+        buildCacheLayout = QtWidgets.QHBoxLayout()
+        self.buildCacheLabel = QtWidgets.QLabel("Build-Cache: ausgeschaltet (build_cache)")
+        buildCacheLayout.addWidget(self.buildCacheLabel, 1)
+        self.clearBuildCacheButton = QtWidgets.QPushButton("Build-Cache leeren")
+        self.clearBuildCacheButton.setEnabled(self.scheduler.build_cache is not None)
+        self.clearBuildCacheButton.clicked.connect(self._clearBuildCache)
+        buildCacheLayout.addWidget(self.clearBuildCacheButton)
+        history_layout.addLayout(buildCacheLayout)
+        
+        self.refreshHistoryButton = QtWidgets.QPushButton("Historie aktualisieren")
+        self.refreshHistoryButton.setStyleSheet("background-color: #007d8f; color: #FFFFFF; font-weight: bold; font-size: 12px;")
+        self.refreshHistoryButton.clicked.connect(self._refreshHistory)
+        history_layout.addWidget(self.refreshHistoryButton)
+        
+        tab_widget.addTab(tab_history, "Build-Historie")
+
+        # --- Tab 4: Tracing ---
+        tab_tracing = QtWidgets.QWidget()
+        tracing_layout = QtWidgets.QVBoxLayout(tab_tracing)
+        
+        tracingButtonLayout = QtWidgets.QHBoxLayout()
+        self.tracingCheckbox = QtWidgets.QCheckBox("Tracing aktiv")
+        self.tracingCheckbox.setChecked(TRACER.enabled)
+        self.tracingCheckbox.toggled.connect(self._toggleTracing)
+        tracingButtonLayout.addWidget(self.tracingCheckbox)
+        tracingButtonLayout.addStretch(1)
+        self.resetTracingButton = QtWidgets.QPushButton("Zurücksetzen")
+        self.resetTracingButton.clicked.connect(self._resetTracing)
+        tracingButtonLayout.addWidget(self.resetTracingButton)
+        self.exportTracingButton = QtWidgets.QPushButton("Als Chrome-Trace exportieren")
+        self.exportTracingButton.setStyleSheet("background-color: #007d8f; color: #FFFFFF; font-weight: bold; font-size: 12px;")
+        self.exportTracingButton.clicked.connect(self._exportTrace)
+        tracingButtonLayout.addWidget(self.exportTracingButton)
+        tracing_layout.addLayout(tracingButtonLayout)
+        
+        tracing_layout.addWidget(QtWidgets.QLabel("Messpunkte:"))
+        self.traceSpanTable = self._createHistoryTable(["Name", "Anzahl", "Gesamt", "Ø", "Max."])
+        tracing_layout.addWidget(self.traceSpanTable)
+        tracing_layout.addWidget(QtWidgets.QLabel("Zähler:"))
+        self.traceCounterTable = self._createHistoryTable(["Name", "Wert"])
+        tracing_layout.addWidget(self.traceCounterTable)
+        
+        # The totals are only refreshed while tracing is on
+        self.tracingTimer = QtCore.QTimer(self)
+        self.tracingTimer.setInterval(1000)
+        self.tracingTimer.timeout.connect(self._refreshTracing)
+        if TRACER.enabled:
+            self.tracingTimer.start()
+        
+        tab_widget.addTab(tab_tracing, "Tracing")
+        
+        # config.ini is checked for changes in the background of the event loop
+        self.configTimer = QtCore.QTimer(self)
+        self.configTimer.setInterval(2000)
+        self.configTimer.timeout.connect(self._checkConfig)
+        self.configTimer.start()
+
+        # --- Tab 5: Info-Tab ---
+        tab_hinweise = QtWidgets.QWidget()
+        hinweise_layout = QtWidgets.QVBoxLayout(tab_hinweise)
+
+        self.hinweisTextBox = QtWidgets.QTextBrowser()
+        self.hinweisTextBox.setOpenExternalLinks(True)
+        
+        html_content = """
+        <style>
+        p {
+         font-size: 12px;
+        }
+        </style>
+        <h2>Maven Build Manager</h2>
+        <p>Der Maven Build Manager ist ein reines Freizeitprojekt von mir.</p>
+        <p>Solltest du Fragen, Hinweise oder Anregungen haben oder weitere Information zum Projekt benötigen, bitte kontaktiere mich einfach über die GitHub-Projektseite.</p>
+        <h2>ChangeLog</h2>
+        <p>
+          <b>0.41a</b><br/>
+          - Die config.ini wird nur noch einmal eingelesen, Goals, Optionen und ausgeschlossene Verzeichnisse liegen fertig aufbereitet im Speicher<br/>
+          - Änderungen an der config.ini werden ohne Neustart übernommen<br/>
+          - Die zuletzt gewählten Einstellungen werden gesammelt und atomar gespeichert, nicht erst beim Beenden<br/>
+        </p>
+        <p>
+          <b>0.40a</b><br/>
+          - Batch: mehrere Projekte werden über einen generierten Aggregator in einem Maven-Aufruf mit -T und -fae gebaut (eine JVM für alle)<br/>
+          - Die Ausgabe des Batch-Builds wird den Projekten zugeordnet, jedes Projekt erhält eine eigene Konsole und einen eigenen Status<br/>
+        </p>
+        <p>
+          <b>0.39a</b><br/>
+          - Nach jedem Build werden die Surefire- und Failsafe-Reports gelesen, Dauer und Ergebnis jeder Testklasse stehen in der Build-Historie<br/>
+          - Test-Modi: nur die zuletzt fehlgeschlagenen Tests, fehlgeschlagene Tests zuerst oder die Testklassen nach Dauer auf parallele Shards verteilt<br/>
+          - Neue Tabelle "Langsamste Testklassen" im Tab "Build-Historie"<br/>
+        </p>
+        <p>
+          <b>0.38a</b><br/>
+          - Die Module der Aggregatoren werden rekursiv gelesen (auch Module aus Profilen) und als aufklappbarer Baum unter dem Projekt angezeigt<br/>
+          - Ausgewählte Module werden mit -pl und wahlweise -am oder -amd im Reactor des Projekts gebaut, Module aus Profilen aktivieren das Profil (-P)<br/>
+          - Auf der Kommandozeile: list --modules, build --modules ... --module-mode am|amd|none
+        </p>
+        <p>
+          <b>0.37a</b><br/>
+          - Optionaler Build-Cache (build_cache): target/*.jar und installierte Artefakte werden anhand eines Hashs aller Eingaben, des JDKs und der Maven-Optionen gespeichert<br/>
+          - Bei unveränderten Eingaben werden die Dateien wiederhergestellt statt zu bauen, auch in einem anderen Klon oder nach einem Branch-Wechsel<br/>
+          - Größenbegrenzung mit LRU-Verdrängung (build_cache_size_mb), Statistik im Tab "Build-Historie" und mit "cache" auf der Kommandozeile
+        </p>
+        <p>
+          <b>0.36a</b><br/>
+          - CPU und Speicher (RSS) von Maven und allen gestarteten Prozessen werden während des Builds gemessen (/proc, sonst psutil)<br/>
+          - Anzeige in der Build-Liste, Spitze, CPU-Sekunden und Ø genutzte Kerne in der Zusammenfassung und der Build-Historie<br/>
+          - Aus der Historie wird je Projekt ein -T Wert empfohlen oder automatisch verwendet (adaptive_threads)
+        </p>
+        <p>
+          <b>0.35a</b><br/>
+          - "Abbrechen" beendet Maven mit allen gestarteten Prozessen (Surefire-Forks, ...), nach cancel_grace_period Sekunden hart<br/>
+          - Die Ausgabe wird ohne Blockieren gelesen, ein Abbruch wirkt auch ohne neue Ausgabe sofort<br/>
+          - Optionale Zeitlimits für Builds (build_timeout_minutes) und Builds ohne Ausgabe (stall_timeout_minutes)
+        </p>
+        <p>
+          <b>0.34a</b><br/>
+          - Vor jedem Build wird geprüft, ob Parent, Abhängigkeiten, BOMs und Plugins aller Module im lokalen Repository liegen, dann wird automatisch offline (-o) gebaut (auto_offline)<br/>
+          - Fehlende Koordinaten werden vor dem Build in der Konsole angezeigt, der Inhalt des lokalen Repositorys wird anhand der Änderungszeit der Verzeichnisse zwischengespeichert
+        </p>
+        <p>
+          <b>0.33a</b><br/>
+          - Optionales Tracing (Option tracing oder Tab "Tracing"): Messpunkte für Projektsuche, pom.xml, Signale, Prozessstart, Konsole und Log sowie Zähler<br/>
+          - Export als Chrome-Trace (chrome://tracing, ui.perfetto.dev), auf der Kommandozeile mit --trace
+        </p>
+        <p>
+          <b>0.32a</b><br/>
+          - Neues Skript benchmark.py: misst Projektsuche, Einlesen der pom.xml, Befüllen der Tabelle und Konsolen-Durchsatz mit einem synthetischen Workspace und einem Fake-Maven, Ergebnisse als JSON
+        </p>
+        <p>
+          <b>0.31a</b><br/>
+          - Neue, geänderte und gelöschte Projekte werden nach dem Start automatisch erkannt, ohne Neustart und ohne komplette Suche (watch_mode)<br/>
+          - Überwacht werden nur die Projektverzeichnisse, ihre pom.xml und die Verzeichnisse darüber, Netzlaufwerke können per Polling geprüft werden
+        </p>
+        <p>
+          <b>0.30a</b><br/>
+          - Die Build-Logs werden blockweise komprimiert gespeichert (.log.gz) mit einem Index der ERROR/WARNING-Zeilen, fehlgeschlagenen Module und Tests<br/>
+          - Build-Logs im Tab "Build-Historie", der Log-Viewer liest nur die angezeigte Seite und springt direkt zum ersten Fehler<br/>
+          - Neuer Befehl "logs" auf der Kommandozeile
+        </p>
+        <p>
+          <b>0.29a</b><br/>
+          - Die Java-Versionen werden im Hintergrund ermittelt und zwischengespeichert (jdk_cache.json), ohne release-Datei über java -version<br/>
+          - Jeder Build erhält automatisch JAVA_HOME und PATH des passenden JDK für die Java-Version des Projekts (auto_java_home)
+        </p>
+        <p>
+          <b>0.28a</b><br/>
+          - Builds können je Projekt über mvn, den Maven Daemon (mvnd) oder einen warmen Daemon pro JDK laufen (Abschnitt [executors])<br/>
+          - Ist mvnd oder der Daemon nicht konfiguriert, wird automatisch mvn verwendet
+        </p>
+        <p>
+          <b>0.27a</b><br/>
+          - Die Dauer der Module wird aus der Reactor Summary gelesen und mit Gesamtzeit und Ergebnis in einer Historie (build_history.db) gespeichert<br/>
+          - Der Exit-Code von Maven wird ausgewertet (erfolgreich/fehlgeschlagen)<br/>
+          - Neuer Tab "Build-Historie" mit den langsamsten Modulen, Regressionen gegenüber dem Median und dem Verlauf je Projekt
+        </p>
+        <p>
+          <b>0.26a</b><br/>
+          - Kommandozeilen-Modus ohne Oberfläche: scan, list --json und build &lt;artifactId&gt;... --jobs N<br/>
+          - Die Oberfläche liegt nun in maven_build_gui.py, PyQt wird nur noch für die GUI geladen
+        </p>
+        <p>
+          <b>0.25a</b><br/>
+          - Nach jedem erfolgreichen Build wird ein Snapshot der Quellen (pom.xml, src) gespeichert<br/>
+          - Neue Option "Nur geänderte Projekte bauen", unveränderte Projekte werden übersprungen (change_detection_paths, change_detection_hash)
+        </p>
+        <p>
+          <b>0.24a</b><br/>
+          - Abhängigkeiten zwischen den gefundenen Projekten werden aus dependencies und parent ermittelt<br/>
+          - Neue Buttons, um die ausgewählten Projekte mit allen Abhängigkeiten (upstream) oder allen abhängigen Projekten (downstream) in der richtigen Reihenfolge zu bauen<br/>
+          - Voneinander unabhängige Projekte werden dabei parallel gebaut, schlägt ein Build fehl, werden die abhängigen Projekte übersprungen
+        </p>
+        <p>
+          <b>0.23a</b><br/>
+          - Mehrere ausgewählte Projekte können gleichzeitig gebaut werden (max_parallel_builds, Standard: CPU-Kerne geteilt durch -T)<br/>
+          - Jeder Build hat einen eigenen Konsolen-Tab sowie Status und Dauer in der Build-Liste<br/>
+          - Builds können einzeln abgebrochen werden, die Oberfläche bleibt während der Builds bedienbar
+        </p>
+        <p>
+          <b>0.22a</b><br/>
+          - Die Build-Ausgabe wird gesammelt und alle 100 ms in die Konsole übernommen<br/>
+          - Die Konsole behält nur die letzten Zeilen (console_max_lines), die vollständige Ausgabe wird als Log-Datei gespeichert (log_directory)<br/>
+          - Anzeige des Durchsatzes der Ausgabe in Zeilen pro Sekunde
+        </p>
+        <p>
+          <b>0.21a</b><br/>
+          - Projekttabelle auf Model/View umgestellt, gefundene Projekte werden gesammelt eingefügt<br/>
+          - Filterfeld über der Projekttabelle hinzugefügt
+        </p>
+        <p>
+          <b>0.20a</b><br/>
+          - Jede pom.xml wird nur noch einmal gelesen (streamend, große Abschnitte wie dependencies werden übersprungen)<br/>
+          - Die Java-Version wird aus maven.compiler.release, maven.compiler.target, maven.compiler.source und der Konfiguration des maven-compiler-plugin ermittelt, inklusive ${...}-Properties
+        </p>
+        <p>
+          <b>0.19a</b><br/>
+          - Die Projektsuche nutzt os.scandir und durchsucht mehrere Verzeichnisse parallel (Option scan_threads)<br/>
+          - exclude_dirs unterstützt nun Platzhalter (z. B. *-backup oder archiv/*)<br/>
+          - Die config.ini wird pro Suche nur noch einmal gelesen
+        </p>
+        <p>
+          <b>0.18a</b><br/>
+          - Gefundene Projekte werden in einem Index (project_index.json) neben der config.ini gespeichert und beim Start sofort angezeigt<br/>
+          - Beim Start werden nur noch neue, geänderte oder gelöschte pom.xml neu eingelesen
+        </p>
+        <p>
+          <b>0.17a</b><br/>
+          - Es wird nun nach dem ersten Fund nicht weiter im Verzeichnis gesucht<br/>
+          - Neue Eingeschft exclude_dirs um Verzeichnisse auszuschliessen
+        </p>
+        <p>
+          <b>0.16a</b><br/>
+          - Texte und Infos überarbeitet<br/>
+          - Projekt auf GitHub veröffentlicht
+        </p>
+        <p>
+          <b>0.15a</b><br/>
+          - Vollständig lauffähige Alpha-Version<br/>
+          - Info Tab hinzugefügt
+          - Beschreibungen aktualisiert
+        </p>
+        <p>
+          <b>0.14a</b><br/>
+          - Korrektur der Speicherung der gewählten Einstellunge damit auch nur diese Settings überschrieben werden<br/>
+          - Dynamische Ausgabe der Projekte damit der Anwendungsstart nicht unnötig verzögert wird
+        </p>
+        <p>
+          <b>0.13a</b><br/>
+          - Änderunge der Farben der Buttons<br/>
+          - Größerverhältnise der Anwendung sowie der Konsole angepasst<br/>
+          - Button zum Abbrechen des Builds hinzugefügt<br/>
+          - Anwendungssperre während des Builds hinzugefügt
+        </p>
+        <p>
+          <b>0.12a</b><br/>
+          - Speicherung der gewählten Einstellungen hinzugefügt, damit beim Starten der Anwendung vorgeblendet werden kann<br/>
+        </p>
+        <p>
+          <b>0.11</b><br/>
+          - Dynamische Ausgabe des Build-Outputs hinzugefügt damit nicht erst beim Build-Ende alles angezeigt wird<br/>
+          - Abbrechen Button hinzugefügt um den laufenden Build zu beenden
+        </p>
+        <p>
+          <b>0.10a</b><br/>
+          - Tooltips für die Pfade der Projekte hinzugefügt falls der Platz des Feldes nicht ausreicht<br/>
+          - Anpassung der Ergebnisse (Tabelle statt Liste)
+        </p>
+        <p>
+          <b>0.9a</b><br/>
+          - Anzeige der installierten Java-Versionen aktualisiert<br/>
+        </p>
+        <p>
+          <b>0.8a</b><br/>
+          - Rekursives Einlesen der Projekte und nicht nur auf Base-Path Ebene damit auch Unterprojekte erkannt werden. Hinweis: Es werden nur pom.xml berücksichtigt, die KEIN parent definiert haben!<br/>
+        </p>
+        <p>
+          <b>0.7a</b><br/>
+          - Weitere Informationen zum Projekt hinzugefügt<br/>
+          - Weitere Informationen zu den installierten Java-Versionen hinzugefügt<br/>
+        </p>
+        <p>
+          <b>0.6a</b><br/>
+          - Fefhlerbehebungen
+        </p>
+        <p>
+          <b>0.5a</b><br/>
+          - Dynamische Checkbox-Optionen aus der Config-Datei<br/>
+          - DropeDown Menu für die Maven-Goals<br/>
+          - Kombination der Optionen
+        </p>
+        <p>
+          <b>0.4a</b><br/>
+          - Über eine Config-Datei ist es nun möglich Optionen für die Oberfläche sowie die Pfade der Projekte und installierten Java-Versionen festzulegen
+        </p>
+        <p>
+          <b>0.3a</b><br/>
+          - Fehlerbehebungen
+        </p>
+        <p>
+          <b>0.2a</b><br/>
+          - Anpassung der Maven-/Build-Befehle
+        </p>
+        <p>
+          <b>0.1a</b><br/>
+          - Erstellung des Projekts, erste Blaupause
+        </p>
+        """
+        self.hinweisTextBox.setHtml(html_content)
+        hinweise_layout.addWidget(self.hinweisTextBox)
+
+        # Adding the new tab
+        tab_widget.addTab(tab_hinweise, "Hinweise")
+        
+        main_layout = QtWidgets.QVBoxLayout()
+        main_layout.addWidget(tab_widget)
+        self.setLayout(main_layout)
+        
+        self._loadProjectsAsync()
+        self._refreshJavaList()
+        self._refreshHistory()
+
+        QtCore.QTimer.singleShot(0, self.set_interactive_mode)
+
+    def set_interactive_mode(self):
+        header = self.projectTable.header()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+
+    def _loadProjectsAsync(self):
+        self.projectModel.clear()
+        base_dir = self.config.get("maven", "projects_directory", fallback=".")
+        # Fill the table from the index right away, the worker only reports the differences
+        self.projectIndex = ProjectIndex(PROJECT_INDEX_FILE, base_dir)
+        self.projectIndex.load()
+        self.projectModel.addProjects(self.projectIndex.projects())
+        self.projectLoaderWorker = ProjectLoaderWorker(base_dir, self.projectIndex)
+        self.projectLoaderWorker.projects_found.connect(self._addProjects)
+        self.projectLoaderWorker.project_updated.connect(self._updateProject)
+        self.projectLoaderWorker.project_removed.connect(self._removeProject)
+        self.projectLoaderWorker.finished.connect(self._startProjectWatcher)
+        self.projectLoaderWorker.start()
+
+    def _startProjectWatcher(self):
+        mode = self.config.get("maven", "watch_mode", fallback="auto").strip().lower()
+        if mode == "off" or self.projectLoaderWorker.directories is None:
+            return
+        base_dir = self.config.get("maven", "projects_directory", fallback=".")
+        debounce = self.config.getint("maven", "watch_debounce_ms", fallback=1000) / 1000
+        poll_interval = self.config.getfloat("maven", "watch_poll_interval", fallback=5)
+        self.projectWatcherWorker = ProjectWatcherWorker(base_dir, self.projectIndex, self.projectLoaderWorker.directories,
+                                                         debounce, poll_interval)
+        self.projectWatcherWorker.projects_found.connect(self._addProjects)
+        self.projectWatcherWorker.project_updated.connect(self._updateProject)
+        self.projectWatcherWorker.project_removed.connect(self._removeProject)
+        self.projectWatcherWorker.watch_paths_changed.connect(self._updateWatchPaths)
+        if mode != "polling":
+            # QFileSystemWatcher uses inotify, ReadDirectoryChangesW or kqueue
+            self.fileSystemWatcher = QtCore.QFileSystemWatcher(self)
+            self.fileSystemWatcher.directoryChanged.connect(self.projectWatcherWorker.watcher.changed)
+            self.fileSystemWatcher.fileChanged.connect(self.projectWatcherWorker.watcher.changed)
+        self._updateWatchPaths(self.projectWatcherWorker.watcher.watch_paths())
+        self.projectWatcherWorker.start()
+
+    def _updateWatchPaths(self, paths):
+        watcher = self.projectWatcherWorker.watcher
+        if self.fileSystemWatcher is None:
+            watcher.set_polled(paths)
+            return
+        # Paths beyond the limit or rejected by the system (e.g. no watches left) are polled
+        limit = self.config.getint("maven", "watch_limit", fallback=4000)
+        native = paths[:limit]
+        wanted = set(native)
+        current = set(self.fileSystemWatcher.files()) | set(self.fileSystemWatcher.directories())
+        obsolete = [path for path in current if path not in wanted]
+        if obsolete:
+            self.fileSystemWatcher.removePaths(obsolete)
+        added = [path for path in native if path not in current]
+        failed = self.fileSystemWatcher.addPaths(added) if added else []
+        polled = paths[limit:] + list(failed)
+        if polled and not self.watchLimitReported:
+            self.watchLimitReported = True
+            self.outputLog.appendPlainText(f"{len(polled)} Pfade werden alle {watcher.poll_interval:g} s geprüft statt überwacht (watch_limit)")
+        watcher.set_polled(polled)
+
+    def _addProjects(self, projects):
+        if self.sender() is self.projectLoaderWorker:
+            try:
+                TRACER.record("signal delivery", self.projectLoaderWorker.emitTimes.get_nowait(), "scan")
+            except queue.Empty:
+                pass
+        with TRACER.span("_addProjects", "gui", projects=len(projects)):
+            self.projectModel.addProjects(projects)
+
+    def _updateProject(self, project):
+        self.projectModel.updateProject(project)
+
+    def _removeProject(self, path):
+        self.projectModel.removeProject(path)
+
+    def _selectedProjects(self):
+        """The selected root projects, for selected modules their root project."""
+        projects, modules = self._selectedProjectsAndModules()
+        return projects + [project for project in modules if project not in projects]
+
+    def _selectedProjectsAndModules(self):
+        # Returns the selected projects and {project: selected modules} of the other projects
+        projects = []
+        modules = {}
+        for index in self.projectTable.selectionModel().selectedRows():
+            source_index = self.projectProxyModel.mapToSource(index)
+            node = self.projectModel.data(source_index, QtCore.Qt.UserRole)
+            if isinstance(node, ProjectModule):
+                modules.setdefault(self.projectModel.rootProject(source_index), []).append(node)
+            elif node not in projects:
+                projects.append(node)
+        return projects, {project: selected for project, selected in modules.items() if project not in projects}
+
+    def _refreshJavaList(self, force=False):
+        TRACER.count("java list refreshes")
+        if self.jdkWorker is not None and self.jdkWorker.isRunning():
+            return
+        self.refreshJavaButton.setEnabled(False)
+        java_dir = self.config.get("java", "install_directory", fallback="")
+        self.jdkWorker = JdkDiscoveryWorker(java_dir, force, self)
+        self.jdkWorker.jdks_found.connect(self._showJavaList)
+        self.jdkWorker.discovery_failed.connect(self._javaDiscoveryFailed)
+        self.jdkWorker.finished.connect(lambda: self.refreshJavaButton.setEnabled(True))
+        self.jdkWorker.start()
+
+    def _javaDiscoveryFailed(self, message):
+        self.jdks = []
+        self.javaTable.setRowCount(0)
+        self.outputLog.appendPlainText(message)
+
+    def _showJavaList(self, jdks):
+        self.jdks = jdks
+        self.javaTable.setSortingEnabled(False)
+        self.javaTable.setRowCount(0)
+        for jdk in jdks:
+            existenz = "Vorhanden" if jdk.has_java else "Nicht gefunden"
+            row = self.javaTable.rowCount()
+            self.javaTable.insertRow(row)
+            item_name = QtWidgets.QTableWidgetItem(jdk.name)
+            self.javaTable.setItem(row, 0, item_name)
+            item_version = QtWidgets.QTableWidgetItem(jdk.version)
+            self.javaTable.setItem(row, 1, item_version)
+            item_path = QtWidgets.QTableWidgetItem(jdk.path)
+            self.javaTable.setItem(row, 2, item_path)
+            item_bin = QtWidgets.QTableWidgetItem(existenz)
+            self.javaTable.setItem(row, 3, item_bin)
+        self.javaTable.setSortingEnabled(True)
+
+    def _createHistoryTable(self, headers):
+        table = QtWidgets.QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        return table
+
+    def _fillHistoryTable(self, table, rows):
+        table.setRowCount(0)
+        for row_data in rows:
+            row = table.rowCount()
+            table.insertRow(row)
+            for column, value in enumerate(row_data):
+                table.setItem(row, column, QtWidgets.QTableWidgetItem(value))
+
+    def _refreshHistory(self):
+        window = self.config.getint("maven", "history_median_window", fallback=10)
+        factor = self.config.getfloat("maven", "history_regression_factor", fallback=1.2)
+        try:
+            slowest = self.history.slowest_modules()
+            slowest_tests = self.history.slowest_tests()
+            regressions = self.history.regressions(window, factor)
+            projects = self.history.projects()
+        except Exception as e:
+            self.outputLog.appendPlainText(f"Fehler beim Lesen der Build-Historie: {e}")
+            return
+        self._fillHistoryTable(self.slowestModulesTable, [
+            (artifact_id, name, f"{average:.1f} s", f"{maximum:.1f} s", str(count))
+            for artifact_id, name, average, maximum, count in slowest])
+        self._fillHistoryTable(self.slowestTestsTable, [
+            (artifact_id, name, f"{average:.1f} s", f"{maximum:.1f} s", str(runs), str(failed))
+            for artifact_id, name, average, maximum, runs, failed in slowest_tests])
+        self._fillHistoryTable(self.regressionsTable, [
+            (artifact_id, name, f"{last:.1f} s", f"{median:.1f} s", f"{ratio:.2f}x")
+            for artifact_id, name, last, median, ratio in regressions])
+        current = self.trendProjectComboBox.currentData()
+        self.trendProjectComboBox.blockSignals(True)
+        self.trendProjectComboBox.clear()
+        for project_path, artifact_id in projects:
+            self.trendProjectComboBox.addItem(f"{artifact_id} ({project_path})", project_path)
+        index = self.trendProjectComboBox.findData(current)
+        self.trendProjectComboBox.setCurrentIndex(index if index != -1 else 0)
+        self.trendProjectComboBox.blockSignals(False)
+        self._refreshTrend()
+        self._refreshBuildLogs()
+        self._refreshBuildCache()
+
+    def _refreshBuildCache(self):
+        if self.scheduler.build_cache is None:
+            return
+        try:
+            stats = self.scheduler.build_cache.stats()
+        except Exception as e:
+            self.outputLog.appendPlainText(f"Fehler beim Lesen des Build-Caches: {e}")
+            return
+        self.buildCacheLabel.setText("Build-Cache: " + format_cache_stats(stats))
+
+    def _clearBuildCache(self):
+        reply = QtWidgets.QMessageBox.question(self, "Build-Cache leeren", "Alle Einträge des Build-Caches löschen?")
+        if reply != QtWidgets.QMessageBox.Yes:
+            return
+        self.scheduler.build_cache.clear()
+        self._refreshBuildCache()
+
+    def _refreshBuildLogs(self):
+        # Only the small index files are read
+        rows = []
+        self.logPaths = []
+        for path, index in archived_logs(log_directory(self.config)):
+            self.logPaths.append(path)
+            date = time.strftime("%d.%m.%Y %H:%M", time.localtime(os.path.getmtime(path)))
+            if index:
+                rows.append((os.path.basename(path), date, str(index["lines"]), str(len(index["errors"])),
+                             str(len(index["warnings"])), ", ".join(name for _, name in index["failed_modules"])))
+            else:
+                rows.append((os.path.basename(path), date, "", "", "", ""))
+        self._fillHistoryTable(self.logTable, rows)
+
+    def _openBuildLog(self, row, column):
+        try:
+            dialog = LogViewerDialog(self.logPaths[row], self)
+        except Exception as e:
+            self.outputLog.appendPlainText(f"Fehler beim Öffnen des Build-Logs: {e}")
+            return
+        dialog.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        dialog.show()
+
+    def _refreshTrend(self):
+        project_path = self.trendProjectComboBox.currentData()
+        if not project_path:
+            self.trendTable.setRowCount(0)
+            return
+        builds = self.history.trend(project_path)
+        longest = max((wall_time or 0 for _, wall_time, _ in builds), default=0) or 1
+        self._fillHistoryTable(self.trendTable, [
+            (time.strftime("%d.%m.%Y %H:%M", time.localtime(started_at)), f"{wall_time:.1f} s", status,
+             "█" * max(1, round(20 * wall_time / longest)))
+            for started_at, wall_time, status in reversed(builds)])
+
+    def _toggleTracing(self, enabled):
+        TRACER.enabled = enabled
+        if enabled:
+            self.tracingTimer.start()
+        else:
+            self.tracingTimer.stop()
+        self._refreshTracing()
+
+    def _resetTracing(self):
+        TRACER.reset()
+        self._refreshTracing()
+
+    def _refreshTracing(self):
+        spans, counters, dropped = TRACER.summary()
+        self._fillHistoryTable(self.traceSpanTable, [
+            (name, str(count), f"{total * 1000:.1f} ms", f"{total / count * 1000:.2f} ms", f"{maximum * 1000:.2f} ms")
+            for name, (count, total, maximum) in sorted(spans.items(), key=lambda item: -item[1][1])])
+        rows = [(name, str(total)) for name, total in sorted(counters.items())]
+        if dropped:
+            rows.append(("Verworfene Ereignisse", str(dropped)))
+        self._fillHistoryTable(self.traceCounterTable, rows)
+
+    def _exportTrace(self):
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Chrome-Trace speichern", "trace.json", "JSON (*.json)")
+        if not filename:
+            return
+        try:
+            count = TRACER.export(filename)
+        except Exception as e:
+            self.outputLog.appendPlainText(f"Fehler beim Speichern des Traces: {e}")
+            return
+        self.outputLog.appendPlainText(f"{count} Trace-Ereignisse gespeichert in {filename} (chrome://tracing oder ui.perfetto.dev)")
+
+    def _createConsole(self):
+        console = QtWidgets.QPlainTextEdit()
+        console.setReadOnly(True)
+        console.setMaximumBlockCount(self.config.getint("maven", "console_max_lines", fallback=10000))
+        return console
+
+    def _fillGoalOptions(self):
+        current = self.goalComboBox.currentText()
+        # No signals while the list is rebuilt, the selection would be saved in between
+        self.goalComboBox.blockSignals(True)
+        self.goalComboBox.clear()
+        self.goalComboBox.addItems(self.config.goal_options())
+        index = self.goalComboBox.findText(current)
+        if index != -1:
+            self.goalComboBox.setCurrentIndex(index)
+        self.goalComboBox.blockSignals(False)
+
+    def _fillCheckboxOptions(self):
+        checked = {chk.text() for chk in self.dynamicCheckboxes if chk.isChecked()}
+        for chk in self.dynamicCheckboxes:
+            self.optionsGroupLayout.removeWidget(chk)
+            chk.deleteLater()
+        self.dynamicCheckboxes = []
+        for option in self.config.checkbox_options():
+            chk = QtWidgets.QCheckBox(option)
+            chk.setChecked(option in checked)
+            chk.toggled.connect(self._saveLastState)
+            self.dynamicCheckboxes.append(chk)
+            self.optionsGroupLayout.addWidget(chk)
+
+    def _checkConfig(self):
+        # Changes to config.ini take effect without a restart
+        self.config.reload_if_changed()
+        if self.config.generation == self.configGeneration:
+            return
+        self.configGeneration = self.config.generation
+        self.scheduler.snapshot_store = create_snapshot_store(self.config)
+        self.scheduler.offline_resolver = create_offline_resolver(self.config)
+        self.scheduler.limits = build_limits(self.config)
+        self.scheduler.build_cache = create_build_cache(self.config)
+        # Running builds keep their executor, a warm daemon is stopped after its build
+        self.executors.shutdown()
+        self.executors = ExecutorRegistry(self.config)
+        self._fillGoalOptions()
+        self._fillCheckboxOptions()
+        self.outputLog.appendPlainText("Konfiguration neu geladen.")
+
+    def _buildCommand(self):
+        checked_options = [chk.text() for chk in self.dynamicCheckboxes if chk.isChecked()]
+        return build_command(self.config, self.goalComboBox.currentText(), checked_options, self.optionsInput.text())
+
+    def _buildProject(self):
+        selected_projects, selected_modules = self._selectedProjectsAndModules()
+        if not selected_projects and not selected_modules:
+            self.outputLog.appendPlainText("Kein Projekt ausgewählt.")
+            return
+        
+        command = self._buildCommand()
+        self.scheduler.max_parallel = max_parallel_builds(self.config, command)
+        if not selected_modules and self._submitBatch(selected_projects, command):
+            self.consoleTimer.start()
+            return
+        for project in selected_projects:
+            self._submitTestRuns(project, command)
+        for project, modules in selected_modules.items():
+            self._submitTestRuns(project, command, modules=modules)
+        self.consoleTimer.start()
+
+    def _buildWithUpstream(self):
+        self._buildWithDependencies(upstream=True)
+
+    def _buildWithDownstream(self):
+        self._buildWithDependencies(upstream=False)
+
+    def _buildWithDependencies(self, upstream):
+        selected_projects = self._selectedProjects()
+        if not selected_projects:
+            self.outputLog.appendPlainText("Kein Projekt ausgewählt.")
+            return
+        
+        graph = DependencyGraph(self.projectModel.projects())
+        selected_paths = [project.path for project in selected_projects]
+        paths = graph.with_upstream(selected_paths) if upstream else graph.with_downstream(selected_paths)
+        try:
+            order = graph.build_order(paths)
+        except ValueError as e:
+            self.outputLog.appendPlainText(str(e))
+            return
+        self.outputLog.appendPlainText("Build-Reihenfolge: " + ", ".join(project.artifactId for project, _ in order))
+        
+        command = self._buildCommand()
+        self.scheduler.max_parallel = max_parallel_builds(self.config, command)
+        # The reactor orders the projects of a batch itself
+        if self._submitBatch([project for project, _ in order], command):
+            self.consoleTimer.start()
+            return
+        # Project path -> jobs the project is done with
+        jobs_by_path = {}
+        for project, dependencies in order:
+            depends_on = [job for path in dependencies for job in jobs_by_path[path]]
+            jobs_by_path[project.path] = self._submitTestRuns(project, command, depends_on)
+        self.consoleTimer.start()
+
+    def _submitBatch(self, projects, command):
+        """Builds the projects in one Maven reactor if selected, returns False if they are built one by one."""
+        if not self.batchCheckbox.isChecked() or len(projects) < 2:
+            return False
+        if self.testModeComboBox.currentData() != "all":
+            self.outputLog.appendPlainText("Test-Modi sind im Batch nicht möglich, die Projekte werden einzeln gebaut.")
+            return False
+        try:
+            batch, notes = create_batch_job(self.config, projects, command, self.executors, self.jdks or [])
+        except (OSError, ValueError) as e:
+            self.outputLog.appendPlainText(f"Batch-Build nicht möglich, die Projekte werden einzeln gebaut: {e}")
+            return False
+        self._addJob(batch, batch.project.artifactId,
+                     notes + ["Projekte: " + ", ".join(project.artifactId for project in projects),
+                              f"Ausführung ({batch.executor.describe()}): " + " ".join(batch.command)])
+        # The projects get their own row and console, they are not queued
+        for member in batch.members:
+            self._addJob(member, member.name(), [f"Wird im Batch gebaut: {batch.project.artifactId}"])
+        self.scheduler.submit(batch)
+        return True
+
+    def _submitTestRuns(self, project, command, depends_on=None, modules=None):
+        """Submits the runs of the selected test mode, returns the jobs the project is done with."""
+        mode = self.testModeComboBox.currentData()
+        tests = []
+        if mode != "all":
+            try:
+                tests = self.history.test_classes(project.path)
+            except Exception as e:
+                self.outputLog.appendPlainText(f"Fehler beim Lesen der Test-Historie: {e}")
+        runs, note = test_run_plan(command, mode, tests, test_shard_count(self.config, self.scheduler.max_parallel))
+        if note:
+            self.outputLog.appendPlainText(f"{project.artifactId}: {note}")
+        jobs = []
+        for index, (label, run_command, dependencies) in enumerate(runs):
+            jobs.append(self._submitBuild(project, run_command, list(depends_on or []) + [jobs[i] for i in dependencies],
+                                          modules, label, f"_{index + 1}" if len(runs) > 1 else ""))
+        return [jobs[index] for index in final_runs(runs)]
+
+    def _submitBuild(self, project, command, depends_on=None, modules=None, label=None, log_suffix=""):
+        command, thread_note = thread_advice(self.config, self.history, project, command, self.scheduler.max_parallel)
+        name = project.artifactId
+        if modules:
+            command = command + module_build_options(modules, self.moduleModeComboBox.currentData())
+            name += " [" + ", ".join(module.artifactId for module in modules) + "]"
+        if label:
+            name += f" ({label})"
+        executor, note = self.executors.for_project(project)
+        if self.jdks is None:
+            env, jdk_note = None, "Die Java-Versionen werden noch ermittelt, verwende das JDK aus PATH"
+        else:
+            env, jdk_note = build_environment(self.config, self.jdks, project)
+        job = BuildJob(project, command, build_log_path(self.config, project, log_suffix), depends_on,
+                       self.onlyChangedCheckbox.isChecked(), executor, env, label)
+        self._addJob(job, name, [text for text in (note, jdk_note, thread_note) if text] +
+                     [f"Ausführung ({executor.describe()}): " + " ".join(command)])
+        self.scheduler.submit(job)
+        return job
+
+    def _addJob(self, job, name, lines):
+        # Console tab and row in the build table of a job
+        console = self._createConsole()
+        console.appendPlainText(f"Baue Projekt: {name}")
+        for text in lines:
+            console.appendPlainText(text)
+        self.jobConsoles[job] = console
+        self.consoleTabs.addTab(console, name)
+        self.jobs.append(job)
+        row = self.buildTable.rowCount()
+        self.buildTable.insertRow(row)
+        self.buildTable.setItem(row, 0, QtWidgets.QTableWidgetItem(name))
+        self.buildTable.setItem(row, 1, QtWidgets.QTableWidgetItem(job.status))
+        self.buildTable.setItem(row, 2, QtWidgets.QTableWidgetItem(""))
+        self.buildTable.setItem(row, 3, QtWidgets.QTableWidgetItem(""))
+
+    def _updateBuildRow(self, job):
+        if job not in self.jobs:
+            return
+        row = self.jobs.index(job)
+        self.buildTable.item(row, 1).setText(job.status)
+        if job.start_time is not None:
+            self.buildTable.item(row, 2).setText(f"{job.elapsed():.0f} s")
+        resources = job.build.resources if job.build else None
+        if resources:
+            if job.is_done():
+                # Peak and average of the whole build
+                text = f"Ø {resources.parallelism():.1f} Kerne, max. {format_bytes(resources.peak_rss)}"
+            else:
+                text = f"{resources.current_parallelism:.1f} Kerne, {format_bytes(resources.current_rss)}"
+            self.buildTable.item(row, 3).setText(text)
+
+    def _flushJobConsole(self, job):
+        console = self.jobConsoles.get(job)
+        if console is None or job.build is None:
+            return
+        with TRACER.span("console flush", "gui") as span:
+            text = job.build.console.take()
+            if text:
+                start = time.perf_counter()
+                console.appendPlainText(text.rstrip("\n"))
+                TRACER.record("appendPlainText", start, "gui", characters=len(text))
+                TRACER.count("console lines appended", text.count("\n"))
+            span.set(characters=len(text))
+        if isinstance(job, BatchJob):
+            for member in job.members:
+                member_console = self.jobConsoles.get(member)
+                text = job.member_output(member)
+                if member_console is not None and text:
+                    member_console.appendPlainText(text.rstrip("\n"))
+                self._updateBuildRow(member)
+
+    def _flushConsole(self):
+        total_rate = 0.0
+        for job in self.scheduler.running:
+            self._flushJobConsole(job)
+            self._updateBuildRow(job)
+            total_rate += job.build.lines_per_second()
+        running = len(self.scheduler.running)
+        waiting = len(self.scheduler.queue)
+        self.throughputLabel.setText(f"Laufende Builds: {running}, wartend: {waiting}, Ausgabe: {total_rate:.0f} Zeilen/s")
+        if not running and not waiting:
+            self.consoleTimer.stop()
+
+    def _buildStarted(self, job):
+        self._updateBuildRow(job)
+
+    def _buildFinished(self, job):
+        self._flushJobConsole(job)
+        if isinstance(job, BatchJob):
+            job.update_members()
+            for member in job.members:
+                self._buildFinished(member)
+        self._updateBuildRow(job)
+        console = self.jobConsoles.get(job)
+        if console is not None:
+            console.appendPlainText(f"Status: {job.status}, Dauer: {job.elapsed():.1f} s")
+            if job.build and job.log_path:
+                console.appendPlainText(f"Log-Datei: {job.log_path}")
+        self.outputLog.appendPlainText(f"{job.name()}: {job.status}")
+        try:
+            self.history.record(job)
+        except Exception as e:
+            self.outputLog.appendPlainText(f"Fehler beim Speichern der Build-Historie: {e}")
+        if job in self.jobs and job.batch is None and not self.scheduler.running and not self.scheduler.queue:
+            self._refreshHistory()
+
+    def _currentJob(self):
+        console = self.consoleTabs.currentWidget()
+        for job, job_console in self.jobConsoles.items():
+            if job_console is console:
+                return job
+        return None
+
+    def _showSelectedBuildConsole(self):
+        rows = self.buildTable.selectionModel().selectedRows()
+        if rows:
+            console = self.jobConsoles.get(self.jobs[rows[0].row()])
+            if console is not None:
+                self.consoleTabs.setCurrentWidget(console)
+
+    def _closeConsoleTab(self, index):
+        console = self.consoleTabs.widget(index)
+        for job, job_console in list(self.jobConsoles.items()):
+            if job_console is console:
+                if not job.is_done():
+                    self.outputLog.appendPlainText(f"Der Build von {job.project.artifactId} läuft noch.")
+                    return
+                row = self.jobs.index(job)
+                self.jobs.pop(row)
+                self.buildTable.removeRow(row)
+                del self.jobConsoles[job]
+                self.consoleTabs.removeTab(index)
+                return
+
+    def _cancelBuild(self):
+        job = self._currentJob()
+        if job is None:
+            self.outputLog.appendPlainText("Bitte den Tab des Builds auswählen, der abgebrochen werden soll.")
+            return
+        # The projects of a batch can only be canceled together
+        self.scheduler.cancel(job.batch or job)
+
+    def _clearConsole(self):
+        self.consoleTabs.currentWidget().clear()
+
+    def _loadLastState(self):
+        # Load saved build options from config
+        last_goal = self.config.get("maven", "last_selected_goal", fallback="")
+        if last_goal:
+            index = self.goalComboBox.findText(last_goal)
+            if index != -1:
+                self.goalComboBox.setCurrentIndex(index)
+        last_checked = self.config.get("maven", "last_checked_options", fallback="")
+        if last_checked:
+            last_checked_list = [s.strip() for s in last_checked.split(",") if s.strip()]
+            for chk in self.dynamicCheckboxes:
+                if chk.text() in last_checked_list:
+                    chk.setChecked(True)
+        last_user_options = self.config.get("maven", "last_user_options", fallback="")
+        if last_user_options:
+            self.optionsInput.setText(last_user_options)
+        self.onlyChangedCheckbox.setChecked(self.config.getboolean("maven", "last_only_changed", fallback=False))
+        self.batchCheckbox.setChecked(self.config.getboolean("maven", "last_batch_build", fallback=False))
+        index = self.testModeComboBox.findData(self.config.get("maven", "last_test_mode", fallback="all"))
+        if index != -1:
+            self.testModeComboBox.setCurrentIndex(index)
+        # From now on every change is saved, the ConfigService collects them into one write
+        self.lastStateLoaded = True
+        self.goalComboBox.currentIndexChanged.connect(self._saveLastState)
+        self.optionsInput.textChanged.connect(self._saveLastState)
+        self.onlyChangedCheckbox.toggled.connect(self._saveLastState)
+        self.batchCheckbox.toggled.connect(self._saveLastState)
+        self.testModeComboBox.currentIndexChanged.connect(self._saveLastState)
+
+    def _saveLastState(self):
+        if not self.lastStateLoaded:
+            return
+        self.config.update("maven", {
+            "last_selected_goal": self.goalComboBox.currentText(),
+            "last_checked_options": ", ".join([chk.text() for chk in self.dynamicCheckboxes if chk.isChecked()]),
+            "last_user_options": self.optionsInput.text(),
+            "last_only_changed": "true" if self.onlyChangedCheckbox.isChecked() else "false",
+            "last_test_mode": self.testModeComboBox.currentData(),
+            "last_batch_build": "true" if self.batchCheckbox.isChecked() else "false"
+        })
+
+    def closeEvent(self, event):
+        self._saveLastState()
+        self.config.flush()
+        # Do not leave running Maven processes behind
+        self.scheduler.cancelAll()
+        for job in list(self.scheduler.running):
+            job.worker.wait(5000)
+        self.executors.shutdown()
+        if self.projectWatcherWorker:
+            self.projectWatcherWorker.stop()
+            self.projectWatcherWorker.wait(2000)
+        event.accept()
+
+def run_gui(config):
+    # Enabled before the first scan, so the start is traced as well
+    TRACER.enabled = config.getboolean("maven", "tracing", fallback=False)
+    app = QtWidgets.QApplication(sys.argv)
+    window = MavenBuildGUI(config)
+    window.show()
+    return app.exec_()
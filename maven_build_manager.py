@@ -5,15 +5,203 @@ import xml.etree.ElementTree as ET
 import configparser
 import platform
 import re
-from PyQt5 import QtWidgets, QtCore
+import json
+import threading
+import time
+import fnmatch
+import hashlib
+import argparse
+import queue
+import sqlite3
+import statistics
+import shutil
+import gzip
+import zlib
+import mmap
+import bisect
+import io
+import codecs
+import locale
+import signal
+import collections
+import math
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-def update_config_file(filename, section, updates):
-    try:
-        with open(filename, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-    except Exception:
-        lines = []
-    
+try:
+    # Optional, used for the resource usage where /proc is not available (Windows, macOS)
+    import psutil
+except ImportError:
+    psutil = None
+
+# Shown in the window title and stored with the benchmark results
+VERSION = "0.41a"
+CONFIG_FILE = "config.ini"
+# The project index is stored next to the config file
+PROJECT_INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "project_index.json")
+# Snapshots of the sources of the last successful build of each project
+SNAPSHOT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "build_snapshots")
+# Versions of the installed JDKs, invalidated by the mtime of the directories
+JDK_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "jdk_cache.json")
+# Contents of the local Maven repository, for automatic offline builds
+LOCAL_REPOSITORY_INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "local_repository_index.json")
+# Build outputs (target/*.jar, installed artifacts) by the hash of their inputs
+BUILD_CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "build_cache")
+# Durations of all builds and their modules
+HISTORY_DATABASE = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "build_history.db")
+# Generated aggregator poms of the batch builds, removed after the build
+BATCH_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), "batch_builds")
+
+class _NoSpan:
+    """Returned by Tracer.span while tracing is off, costs nothing but the call."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def set(self, **args):
+        pass
+
+class _Span:
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.tracer._finish_span(self, time.perf_counter())
+        return False
+
+    def set(self, **args):
+        """Adds arguments known only at the end of the span, e.g. the number of lines."""
+        self.args.update(args)
+
+class Tracer:
+    """
+    Opt-in tracing of the hot paths. Spans (with tracer.span("name"): ...) and counters
+    (tracer.count("name")) are collected while enabled is set; export() writes them in the
+    Chrome trace event format (chrome://tracing, Perfetto), summary() returns the running
+    totals. Disabled, span() returns a shared no-op object and count() returns at once.
+    """
+
+    def __init__(self, max_events=1000000):
+        self.enabled = False
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._no_span = _NoSpan()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._origin = time.perf_counter()
+            self._events = []
+            self._dropped = 0
+            # name -> [count, total seconds, max seconds]
+            self._spans = {}
+            self._counters = {}
+            self._counter_sampled = {}
+            self._threads = {}
+
+    def span(self, name, category="app", **args):
+        if not self.enabled:
+            return self._no_span
+        return _Span(self, name, category, args)
+
+    def _add_event(self, event):
+        # Called with the lock held
+        if len(self._events) < self.max_events:
+            self._events.append(event)
+        else:
+            self._dropped += 1
+
+    def _thread_id(self):
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident, thread.name)
+        return thread.ident
+
+    def _finish_span(self, span, end, start=None):
+        if start is not None:
+            span.start = start
+        duration = end - span.start
+        with self._lock:
+            totals = self._spans.setdefault(span.name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
+            totals[2] = max(totals[2], duration)
+            event = {"name": span.name, "cat": span.category, "ph": "X", "pid": os.getpid(), "tid": self._thread_id(),
+                     "ts": (span.start - self._origin) * 1e6, "dur": duration * 1e6}
+            if span.args:
+                event["args"] = span.args
+            self._add_event(event)
+
+    def record(self, name, start, category="app", **args):
+        """Records a span that started at start (time.perf_counter()) in another place, e.g. another thread."""
+        if self.enabled:
+            self._finish_span(_Span(self, name, category, args), time.perf_counter(), start)
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            total = self._counters.get(name, 0) + value
+            self._counters[name] = total
+            # At most one counter event per 10 ms, the totals are always exact
+            if now - self._counter_sampled.get(name, -1.0) >= 0.01:
+                self._counter_sampled[name] = now
+                self._add_event({"name": name, "ph": "C", "pid": os.getpid(), "tid": self._thread_id(),
+                                 "ts": (now - self._origin) * 1e6, "args": {name: total}})
+
+    def summary(self):
+        """Returns ({span: (count, total seconds, max seconds)}, {counter: total}, dropped events)."""
+        with self._lock:
+            spans = {name: tuple(totals) for name, totals in self._spans.items()}
+            return spans, dict(self._counters), self._dropped
+
+    def export(self, filename):
+        """Writes the trace in the Chrome trace event format."""
+        with self._lock:
+            events = list(self._events)
+            counters = dict(self._counters)
+            threads = dict(self._threads)
+            end = (time.perf_counter() - self._origin) * 1e6
+        pid = os.getpid()
+        # The final value of every counter, also the ones changed after their last sample
+        events += [{"name": name, "ph": "C", "pid": pid, "tid": 0, "ts": end, "args": {name: total}}
+                   for name, total in counters.items()]
+        events += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": ident, "args": {"name": name}}
+                   for ident, name in threads.items()]
+        tmp_file = filename + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp_file, filename)
+        return len(events)
+
+# Shared by the GUI, the command line and the benchmarks
+TRACER = Tracer()
+
+def format_trace_summary(tracer):
+    spans, counters, dropped = tracer.summary()
+    lines = ["Tracing:"]
+    for name, (count, total, maximum) in sorted(spans.items(), key=lambda item: -item[1][1]):
+        lines.append(f"  {name}: {count}x, {total * 1000:.1f} ms gesamt, Ø {total / count * 1000:.2f} ms, max {maximum * 1000:.2f} ms")
+    for name, total in sorted(counters.items()):
+        lines.append(f"  {name}: {total}")
+    if dropped:
+        lines.append(f"  {dropped} Ereignisse verworfen (max_events)")
+    return "\n".join(lines)
+
+def _config_lines_with_updates(lines, section, updates):
+    # Replaces the values of the keys in the section, keeps comments and order, appends missing keys
     new_lines = []
     in_section = False
     section_found = False
@@ -62,42 +250,132 @@ def update_config_file(filename, section, updates):
         for k, v in updates.items():
             if k not in updated_keys:
                 new_lines.append(f"{k} = {v}\n")
+    return new_lines
+
+def write_config_updates(filename, updates):
+    """
+    Writes updates ({section: {key: value}}) to the config file, comments and order are kept.
+    The file is replaced atomically, a crash while writing never leaves a truncated file.
+    """
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except Exception:
+        lines = []
+    for section, section_updates in updates.items():
+        lines = _config_lines_with_updates(lines, section, section_updates)
+    tmp_file = filename + ".tmp"
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+            # On disk before the replace, otherwise a crash can leave an empty file behind
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, filename)
     except Exception as e:
         print("Fehler beim Speichern der Konfiguration:", e)
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+# Top level sections of a pom.xml which are never needed for the project table
+POM_SKIPPED_SECTIONS = {"dependencies", "dependencyManagement", "reporting", "profiles", "repositories",
+                        "pluginRepositories", "distributionManagement", "developers", "contributors", "scm"}
+# Order in which the Java level is resolved, plugin configuration wins over the properties
+POM_JAVA_LEVEL_KEYS = ("release", "target", "source")
+POM_PROPERTY_REGEX = re.compile(r"\$\{([^}]+)\}")
+
+class ProjectModule:
+    """A module of an aggregator pom, selector is its path relative to the root project for -pl."""
+    __slots__ = ("path", "selector", "artifactId", "groupId", "profile", "modules", "dependencies")
+
+    def __init__(self, path, selector, artifactId=None, groupId=None, profile=None, modules=(), dependencies=()):
+        self.path = path
+        self.selector = selector
+        self.artifactId = artifactId
+        self.groupId = groupId
+        # Id of the profile that adds the module (or one of its parents), None if always built
+        self.profile = profile
+        self.modules = tuple(modules)
+        # Tuple of (groupId, artifactId) of the declared dependencies
+        self.dependencies = tuple(dependencies)
+
+    def to_dict(self):
+        return {"path": self.path, "selector": self.selector, "artifactId": self.artifactId, "groupId": self.groupId,
+                "profile": self.profile, "modules": [module.to_dict() for module in self.modules],
+                # "groupId:artifactId", a list per dependency makes the index slower to load
+                "dependencies": [":".join(dependency) for dependency in self.dependencies]}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["path"], data["selector"], data.get("artifactId"), data.get("groupId"), data.get("profile"),
+                   [cls.from_dict(module) for module in data.get("modules", [])],
+                   [tuple(dependency.split(":", 1)) for dependency in data.get("dependencies", [])])
+
+    def walk(self):
+        """The module and all modules below it."""
+        yield self
+        for module in self.modules:
+            yield from module.walk()
 
 class MavenProject:
-    def __init__(self, path):
+    """Compact record of the metadata of a root pom.xml."""
+    __slots__ = ("path", "artifactId", "groupId", "version", "java_version", "parent", "dependencies", "modules")
+
+    def __init__(self, path, read_pom=True):
         self.path = path
         self.artifactId = None
         self.groupId = None
+        self.version = None
         self.java_version = None
-        self._read_pom()
+        # (groupId, artifactId, version) of the parent or None
+        self.parent = None
+        # Tuple of (groupId, artifactId) of the declared dependencies
+        self.dependencies = ()
+        # Tree of ProjectModule below an aggregator, read by ProjectDiscovery
+        self.modules = ()
+        if read_pom:
+            self._read_pom()
+
+    def to_dict(self):
+        return {
+            "path": self.path,
+            "artifactId": self.artifactId,
+            "groupId": self.groupId,
+            "version": self.version,
+            "java_version": self.java_version,
+            "parent": list(self.parent) if self.parent else None,
+            "dependencies": [list(dependency) for dependency in self.dependencies],
+            "modules": [module.to_dict() for module in self.modules],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        project = cls(data["path"], read_pom=False)
+        project.artifactId = data.get("artifactId")
+        project.groupId = data.get("groupId")
+        project.version = data.get("version")
+        project.java_version = data.get("java_version")
+        project.parent = tuple(data["parent"]) if data.get("parent") else None
+        project.dependencies = tuple(tuple(dependency) for dependency in data.get("dependencies", []))
+        project.modules = tuple(ProjectModule.from_dict(module) for module in data.get("modules", []))
+        return project
+
+    def coordinates(self):
+        return (self.groupId, self.artifactId)
+
+    def all_modules(self):
+        for module in self.modules:
+            yield from module.walk()
 
     def _read_pom(self):
         pom_file = os.path.join(self.path, "pom.xml")
         if os.path.exists(pom_file):
             try:
-                tree = ET.parse(pom_file)
-                root = tree.getroot()
-                ns = ""
-                if "}" in root.tag:
-                    ns = root.tag.split("}")[0] + "}"
-                # ArtifactId (as project name)
-                artifact_elem = root.find(f"{ns}artifactId")
-                self.artifactId = artifact_elem.text.strip() if artifact_elem is not None else os.path.basename(self.path)
-                # GroupId (as name)
-                group_elem = root.find(f"{ns}groupId")
-                self.groupId = group_elem.text.strip() if group_elem is not None else "unbekannt"
-                # Java-Version from the properties (<maven.compiler.source>)
-                properties_elem = root.find(f"{ns}properties")
-                if properties_elem is not None:
-                    version_elem = properties_elem.find(f"{ns}maven.compiler.source")
-                    self.java_version = version_elem.text.strip() if version_elem is not None else "Unbekannt"
-                else:
-                    self.java_version = "Unbekannt"
+                project = read_pom(pom_file, read_dependencies=True)
+                for attr in self.__slots__:
+                    setattr(self, attr, getattr(project, attr))
             except Exception as e:
                 self.artifactId = os.path.basename(self.path)
                 self.groupId = "Fehler"
@@ -107,505 +385,3982 @@ class MavenProject:
             self.groupId = "Nicht gefunden"
             self.java_version = "Keine pom.xml gefunden"
 
-class MavenBuildWorker(QtCore.QThread):
-    build_output = QtCore.pyqtSignal(str)
+def _interpolate(value, properties, depth=0):
+    # Replaces ${property} references, unknown properties are kept as they are
+    if not value or "${" not in value or depth > 10:
+        return value
+    resolved = POM_PROPERTY_REGEX.sub(lambda m: properties.get(m.group(1), m.group(0)), value)
+    if resolved == value:
+        return value
+    return _interpolate(resolved, properties, depth + 1)
 
-    def __init__(self, command, project_path):
-        super().__init__()
-        self.command = command
-        self.project_path = project_path
-        self.process = None
-        self._isCanceled = False
+def read_pom(pom_path, stop_at_parent=False, read_dependencies=False):
+    """
+    Reads the metadata of a pom.xml in one streaming pass with iterparse.
+    Sections that are not needed are not built up as elements, and parsing stops as soon
+    as nothing relevant can follow. With stop_at_parent=True parsing already stops at a
+    <parent> tag, because such poms are not shown as projects anyway. With
+    read_dependencies=True the <dependencies> section is read as well.
+    Raises ET.ParseError for invalid files.
+    """
+    project = MavenProject(os.path.dirname(pom_path), read_pom=False)
+    properties = {}
+    compiler_config = {}
+    parent = {}
+    stack = []
+    skip_depth = None
+    plugin_artifact = None
+    plugin_config = {}
+    dependencies = []
+    dependency = {}
+    dependencies_read = not read_dependencies
 
-    def run(self):
-        try:
-            self.process = subprocess.Popen(
-                self.command,
-                cwd=self.project_path,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
-            )
-            while True:
-                line = self.process.stdout.readline()
-                if line:
-                    self.build_output.emit(line)
-                else:
+    def complete():
+        return project.artifactId and java_level_complete() and dependencies_read
+
+    def java_level_complete():
+        # Once maven.compiler.release is set, the build section is not read anymore
+        if "maven.compiler.release" in properties:
+            return True
+        configured = compiler_config.get("maven-compiler-plugin", {})
+        return any(value and "${" not in value for value in configured.values())
+
+    context = ET.iterparse(pom_path, events=("start", "end"))
+    for event, elem in context:
+        tag = elem.tag.rsplit("}", 1)[-1]
+        if event == "start":
+            stack.append(tag)
+            depth = len(stack)
+            if skip_depth is None and depth == 2:
+                if tag == "dependencies" and not dependencies_read:
+                    pass
+                elif tag in POM_SKIPPED_SECTIONS:
+                    if complete():
+                        break
+                    skip_depth = depth
+                elif tag == "build" and complete():
+                    # Everything is known, the build section does not have to be read
                     break
-                if self._isCanceled:
+            continue
+
+        # end event
+        depth = len(stack)
+        stack.pop()
+        if skip_depth is not None:
+            if depth == skip_depth:
+                skip_depth = None
+            elem.clear()
+            continue
+
+        text = (elem.text or "").strip()
+        if depth == 2:
+            if tag == "artifactId":
+                project.artifactId = text
+            elif tag == "groupId":
+                project.groupId = text
+            elif tag == "version":
+                project.version = text
+            elif tag == "parent":
+                project.parent = (parent.get("groupId"), parent.get("artifactId"), parent.get("version"))
+                if stop_at_parent:
                     break
-            self.process.stdout.close()
-            retcode = self.process.wait()
-            if self._isCanceled:
-                self.build_output.emit("Build abgebrochen.\n")
-            else:
-                self.build_output.emit("Build abgeschlossen.\n")
+            elif tag == "dependencies":
+                dependencies_read = True
+                if complete():
+                    break
+            elif tag == "build" and complete():
+                break
+            elem.clear()
+        elif depth == 3 and stack[1] == "parent":
+            parent[tag] = text
+        elif depth == 3 and stack[1] == "properties":
+            properties[tag] = text
+            elem.clear()
+        elif stack[1:2] == ["dependencies"]:
+            # <dependencies><dependency><groupId>...
+            if depth == 4 and tag in ("groupId", "artifactId"):
+                dependency[tag] = text
+            elif depth == 3:
+                if dependency.get("artifactId"):
+                    dependencies.append((dependency.get("groupId", ""), dependency["artifactId"]))
+                dependency = {}
+                elem.clear()
+        elif stack[1:3] == ["build", "plugins"] or stack[1:4] == ["build", "pluginManagement", "plugins"]:
+            # <build><plugins><plugin>... or <build><pluginManagement><plugins><plugin>...
+            plugin_depth = 4 if stack[2] == "plugins" else 5
+            if depth == plugin_depth + 1 and tag == "artifactId":
+                plugin_artifact = text
+            elif depth == plugin_depth + 2 and stack[plugin_depth] == "configuration" and tag in POM_JAVA_LEVEL_KEYS:
+                plugin_config[tag] = text
+            elif depth == plugin_depth:
+                # <plugins> wins over <pluginManagement>, because it is read later
+                if plugin_artifact and plugin_config:
+                    compiler_config.setdefault(plugin_artifact, {}).update(plugin_config)
+                plugin_artifact = None
+                plugin_config = {}
+                elem.clear()
+    del context
+
+    if not project.artifactId:
+        project.artifactId = os.path.basename(project.path)
+    if not project.groupId:
+        project.groupId = parent.get("groupId") or "unbekannt"
+    if not project.version:
+        project.version = parent.get("version")
+
+    # Built-in properties for the interpolation
+    properties.setdefault("project.groupId", project.groupId)
+    properties.setdefault("project.artifactId", project.artifactId)
+    if project.version:
+        properties.setdefault("project.version", project.version)
+
+    configured = compiler_config.get("maven-compiler-plugin", {})
+    java_version = None
+    for key in POM_JAVA_LEVEL_KEYS:
+        java_version = configured.get(key) or properties.get(f"maven.compiler.{key}")
+        if java_version:
+            break
+    java_version = _interpolate(java_version, properties)
+    project.java_version = java_version if java_version else "Unbekannt"
+    project.version = _interpolate(project.version, properties)
+    project.dependencies = tuple((_interpolate(group_id, properties), _interpolate(artifact_id, properties))
+                                 for group_id, artifact_id in dependencies)
+    return project
+
+def read_pom_modules(pom_path):
+    """
+    Returns (groupId, artifactId, [(module, profile id or None)], [(groupId, artifactId)])
+    of a pom.xml, with the modules of <modules> and of <profiles><profile><modules> and
+    the declared <dependencies>.
+    Raises ET.ParseError for invalid files.
+    """
+    with open(pom_path, "rb") as f:
+        data = f.read()
+    if b"<module" in data or b"<dependencies" in data:
+        # The tree is built by the C parser, much faster than handling the events in Python
+        root = ET.fromstring(data)
+        ns = root.tag[:root.tag.index("}") + 1] if root.tag.startswith("{") else ""
+        group_id = (root.findtext(ns + "groupId") or root.findtext(f"{ns}parent/{ns}groupId") or "").strip() or None
+        artifact_id = (root.findtext(ns + "artifactId") or "").strip() or None
+        modules = [(module.text.strip(), None) for module in root.iterfind(f"{ns}modules/{ns}module")
+                   if module.text and module.text.strip()]
+        for profile in root.iterfind(f"{ns}profiles/{ns}profile"):
+            profile_id = (profile.findtext(ns + "id") or "").strip()
+            modules.extend((module.text.strip(), profile_id or "?") for module in profile.iterfind(f"{ns}modules/{ns}module")
+                           if module.text and module.text.strip())
+        dependencies = []
+        for dependency in root.iterfind(f"{ns}dependencies/{ns}dependency"):
+            dependency_artifact = (dependency.findtext(ns + "artifactId") or "").strip()
+            if not dependency_artifact:
+                continue
+            dependency_group = (dependency.findtext(ns + "groupId") or "").strip()
+            # Dependencies on sibling modules mostly use the groupId of the project
+            if dependency_group in ("${project.groupId}", "${project.parent.groupId}"):
+                dependency_group = group_id or ""
+            dependencies.append((dependency_group, dependency_artifact))
+        return group_id, artifact_id, modules, dependencies
+
+    # Poms without modules and dependencies are fed in small pieces and only parsed up to the artifactId
+    group_id = artifact_id = parent_group_id = None
+    stack = []
+    parser = ET.XMLPullParser(events=("start", "end"))
+    done = False
+    for offset in range(0, len(data), 1024):
+        parser.feed(data[offset:offset + 1024])
+        for event, elem in parser.read_events():
+            tag = elem.tag.rsplit("}", 1)[-1]
+            if event == "start":
+                stack.append(tag)
+                continue
+            path = stack[1:]
+            stack.pop()
+            text = (elem.text or "").strip()
+            if path == ["groupId"]:
+                group_id = text
+            elif path == ["artifactId"]:
+                artifact_id = text
+            elif path == ["parent", "groupId"]:
+                parent_group_id = text
+            if len(path) <= 2:
+                elem.clear()
+            done = bool(artifact_id and (group_id or parent_group_id))
+            if done:
+                break
+        if done:
+            break
+    if not done:
+        parser.close()
+    return group_id or parent_group_id, artifact_id, [], []
+
+def read_module_tree(project_path):
+    """Returns the ProjectModule tree below the pom.xml in project_path, modules without pom.xml are left out."""
+    seen = {os.path.normpath(project_path)}
+
+    def children(directory, entries, parent_profile):
+        result = []
+        for name, profile in entries:
+            path = os.path.normpath(os.path.join(directory, name))
+            if path.endswith(".xml"):
+                # <module>sub/other-pom.xml</module>, only directories can be selected with -pl
+                path = os.path.dirname(path)
+            if path in seen or not os.path.isfile(os.path.join(path, "pom.xml")):
+                continue
+            seen.add(path)
+            try:
+                group_id, artifact_id, module_entries, dependencies = read_pom_modules(os.path.join(path, "pom.xml"))
+            except ET.ParseError:
+                group_id, artifact_id, module_entries, dependencies = None, None, [], []
+            TRACER.count("module poms parsed")
+            module_profile = profile or parent_profile
+            selector = os.path.relpath(path, project_path).replace("\\", "/")
+            result.append(ProjectModule(path, selector, artifact_id or os.path.basename(path), group_id, module_profile,
+                                        children(path, module_entries, module_profile), dependencies))
+        return result
+
+    try:
+        _, _, entries, _ = read_pom_modules(os.path.join(project_path, "pom.xml"))
+    except (OSError, ET.ParseError):
+        return ()
+    return tuple(children(project_path, entries, None))
+
+def module_build_options(modules, mode="am"):
+    """
+    Maven options that build only the selected modules: -pl with their paths, -am (also
+    the modules they depend on) or -amd (also the modules depending on them) and -P with
+    the profiles the modules need to be part of the reactor.
+    """
+    options = ["-pl", ",".join(module.selector for module in modules)]
+    if mode in ("am", "amd"):
+        options.append("-" + mode)
+    profiles = sorted({module.profile for module in modules if module.profile and module.profile != "?"})
+    if profiles:
+        options += ["-P", ",".join(profiles)]
+    return options
+
+def is_partial_command(command):
+    """True if the command only builds some modules of the reactor (-pl) or only runs some tests (-Dtest)."""
+    return any(token in ("-pl", "--projects") or token.startswith(("--projects=", "-Dtest=", "-Dit.test="))
+               for token in command)
+
+JAVA_VERSION_REGEX = re.compile(r'version "([^"]+)"')
+
+def java_feature_version(version):
+    """Returns the feature version of a Java version ("1.8.0_301" -> 8, "17.0.2" -> 17) or None."""
+    match = re.match(r"^\s*(\d+)(?:\.(\d+))?", version or "")
+    if not match:
+        return None
+    major = int(match.group(1))
+    if major == 1 and match.group(2):
+        return int(match.group(2))
+    return major
+
+class JdkInfo:
+    __slots__ = ("name", "path", "version", "has_java")
+
+    def __init__(self, name, path, version="Unbekannt", has_java=False):
+        self.name = name
+        self.path = path
+        self.version = version
+        self.has_java = has_java
+
+    def feature_version(self):
+        return java_feature_version(self.version)
+
+    def to_dict(self):
+        return {"name": self.name, "path": self.path, "version": self.version, "has_java": self.has_java}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data["path"], data.get("version", "Unbekannt"), data.get("has_java", False))
+
+class JdkDiscovery:
+    """
+    Lists the JDKs in install_directory. The version is read from the release file, or
+    if there is none by running bin/java -version (in parallel for all JDKs). The results
+    are cached in cache_file and only determined again if the mtime of the JDK changed.
+    """
+
+    def __init__(self, install_dir, cache_file=JDK_CACHE_FILE, max_workers=None):
+        self.install_dir = install_dir
+        self.cache_file = cache_file
+        self.max_workers = max_workers or min(8, (os.cpu_count() or 1) * 2)
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("install_dir") == os.path.abspath(self.install_dir):
+                return data.get("entries", {})
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            self.build_output.emit(f"Fehler beim Build: {e}")
+            print(f"Fehler beim Lesen des JDK-Cache {self.cache_file}: {e}")
+        return {}
 
-    def cancel(self):
-        self._isCanceled = True
-        if self.process:
+    def _save_cache(self, entries):
+        tmp_file = self.cache_file + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"install_dir": os.path.abspath(self.install_dir), "entries": entries}, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"Fehler beim Speichern des JDK-Cache {self.cache_file}: {e}")
+
+    @staticmethod
+    def _java_binary(path):
+        bin_path = os.path.join(path, "bin", "java")
+        for candidate in (bin_path, bin_path + ".exe"):
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    @staticmethod
+    def _read_release(path):
+        release_file = os.path.join(path, "release")
+        if not os.path.isfile(release_file):
+            return None
+        try:
+            with open(release_file, "r", encoding="utf-8") as rf:
+                for line in rf:
+                    if line.startswith("JAVA_VERSION="):
+                        parts = line.strip().split("=", 1)
+                        if len(parts) == 2:
+                            return parts[1].strip().strip('"')
+        except Exception:
+            return "Fehler beim Lesen"
+        return None
+
+    @staticmethod
+    def _probe(java_binary):
+        # java -version writes to stderr
+        try:
+            with TRACER.span("java -version", "jdk", java=java_binary):
+                result = subprocess.run([java_binary, "-version"], capture_output=True, text=True, timeout=30,
+                                        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+        except Exception:
+            return None
+        match = JAVA_VERSION_REGEX.search(result.stderr + result.stdout)
+        return match.group(1) if match else None
+
+    def _inspect(self, name, path):
+        java_binary = self._java_binary(path)
+        version = self._read_release(path)
+        if version is None and java_binary:
+            version = self._probe(java_binary)
+        return JdkInfo(name, path, version or "Unbekannt", java_binary is not None)
+
+    def discover(self, force=False):
+        """Returns the list of JdkInfo, raises FileNotFoundError if install_dir does not exist."""
+        if not os.path.isdir(self.install_dir):
+            raise FileNotFoundError(self.install_dir)
+        cache = {} if force else self._load_cache()
+        entries = {}
+        jdks = []
+        pending = []
+        with os.scandir(self.install_dir) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                cached = cache.get(entry.path)
+                if cached and cached.get("mtime") == mtime:
+                    jdks.append(JdkInfo.from_dict(cached["jdk"]))
+                    entries[entry.path] = cached
+                else:
+                    pending.append((entry.name, entry.path, mtime))
+        if pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = pool.map(lambda item: (item[2], self._inspect(item[0], item[1])), pending)
+                for mtime, jdk in results:
+                    jdks.append(jdk)
+                    entries[jdk.path] = {"mtime": mtime, "jdk": jdk.to_dict()}
+        if pending or entries.keys() != cache.keys():
+            self._save_cache(entries)
+        jdks.sort(key=lambda jdk: jdk.name.lower())
+        return jdks
+
+def select_jdk(jdks, java_version):
+    """
+    Returns the JDK that fits the Java version of a project best: the same feature version,
+    otherwise the oldest newer JDK. None if the version is unknown or no JDK fits.
+    """
+    required = java_feature_version(java_version)
+    if required is None:
+        return None
+    candidates = [(jdk.feature_version(), jdk) for jdk in jdks if jdk.has_java and jdk.feature_version()]
+    exact = [jdk for version, jdk in candidates if version == required]
+    if exact:
+        return exact[0]
+    newer = sorted(((version, jdk) for version, jdk in candidates if version > required), key=lambda item: item[0])
+    return newer[0][1] if newer else None
+
+def jdk_environment(jdk, base_env=None):
+    """Environment for a build with JAVA_HOME and PATH of the JDK."""
+    env = dict(base_env if base_env is not None else os.environ)
+    env["JAVA_HOME"] = jdk.path
+    env["PATH"] = os.path.join(jdk.path, "bin") + os.pathsep + env.get("PATH", "")
+    return env
+
+class ProjectIndex:
+    """
+    Persistent index of all pom.xml files found below projects_directory.
+    Each entry is keyed by the pom path and remembers mtime and size of the file, so
+    only added, changed or deleted poms have to be parsed again on the next start.
+    Poms with a parent tag are indexed as well (without project) to skip them quickly.
+    """
+    VERSION = 5
+
+    def __init__(self, filename, base_dir):
+        self.filename = filename
+        self.base_dir = os.path.abspath(base_dir)
+        # pom path -> {"mtime": int, "size": int, "project": dict or None}
+        self.entries = {}
+
+    def load(self):
+        self.entries = {}
+        try:
+            with open(self.filename, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Fehler beim Lesen des Projekt-Index {self.filename}: {e}")
+            return
+        # A different projects_directory or format invalidates the whole index
+        if data.get("version") != self.VERSION or data.get("base_dir") != self.base_dir:
+            return
+        self.entries = data.get("entries", {})
+
+    def save(self):
+        data = {"version": self.VERSION, "base_dir": self.base_dir, "entries": self.entries}
+        tmp_file = self.filename + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                # dumps uses the C encoder, dump writes thousands of small pieces
+                f.write(json.dumps(data))
+            os.replace(tmp_file, self.filename)
+        except Exception as e:
+            print(f"Fehler beim Speichern des Projekt-Index {self.filename}: {e}")
+
+    def projects(self):
+        return [MavenProject.from_dict(entry["project"]) for entry in self.entries.values() if entry.get("project")]
+
+    def lookup(self, pom_path, stat):
+        # Returns the cached entry if the pom is unchanged since the last scan
+        entry = self.entries.get(pom_path)
+        if not entry or entry.get("mtime") != stat.st_mtime_ns or entry.get("size") != stat.st_size:
+            return None
+        # The module poms are not visited by the scan, a changed module tree is read again
+        for module_pom, (mtime, size) in entry.get("modules", {}).items():
             try:
-                self.process.kill()
-            except Exception:
-                pass
+                module_stat = os.stat(module_pom)
+            except OSError:
+                return None
+            if module_stat.st_mtime_ns != mtime or module_stat.st_size != size:
+                return None
+        return entry
 
-class ProjectLoaderWorker(QtCore.QThread):
-    project_found = QtCore.pyqtSignal(object)
-    
-    def __init__(self, base_dir, parent=None):
-        super().__init__(parent)
+    def store(self, pom_path, stat, project):
+        entry = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "project": project.to_dict() if project else None,
+        }
+        if project and project.modules:
+            module_stats = {}
+            for module in project.all_modules():
+                module_pom = os.path.join(module.path, "pom.xml")
+                try:
+                    module_stat = os.stat(module_pom)
+                except OSError:
+                    continue
+                module_stats[module_pom] = [module_stat.st_mtime_ns, module_stat.st_size]
+            entry["modules"] = module_stats
+        self.entries[pom_path] = entry
+
+class ProjectScanner:
+    """
+    Searches the pom.xml files below base_dir with os.scandir. Every directory is listed
+    by its own task in a bounded thread pool, so the latency of network shares overlaps.
+    Exclude patterns are glob patterns, matched against the directory name or, if they
+    contain a slash, against the path relative to base_dir.
+    """
+
+    def __init__(self, base_dir, exclude_patterns=None, max_workers=None):
         self.base_dir = base_dir
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.name_patterns = []
+        self.path_patterns = []
+        for pattern in exclude_patterns or []:
+            pattern = pattern.strip().replace("\\", "/").strip("/")
+            if not pattern:
+                continue
+            if "/" in pattern:
+                self.path_patterns.append(pattern)
+            else:
+                self.name_patterns.append(pattern)
 
-    def _load_exclude_dirs(self):#
-        config = configparser.ConfigParser()
-        config_file = "config.ini"          
-    
+    def _is_excluded(self, name, path):
+        for pattern in self.name_patterns:
+            if fnmatch.fnmatch(name, pattern):
+                return True
+        if self.path_patterns:
+            rel_path = os.path.relpath(path, self.base_dir).replace("\\", "/")
+            for pattern in self.path_patterns:
+                if fnmatch.fnmatch(rel_path, pattern):
+                    return True
+        return False
+
+    def _scan_dir(self, directory, handle_pom, on_directory=None):
+        # Returns the subdirectories which have to be scanned next
+        subdirs = []
+        pom_entry = None
+        TRACER.count("directories visited")
         try:
-            config.read(config_file)
-            if 'maven' in config and 'exclude_dirs' in config['maven']:
-                return [d.strip() for d in config['maven']['exclude_dirs'].split(',')]
-        except Exception as e:
-            print(f"Error reading config file {self.config_file}: {e}")
-        return [] # Leere Liste, falls keine Konfiguration gefunden oder Fehler aufgetreten ist
-        
-    def run(self):
-        if os.path.isdir(self.base_dir):
-            for root_dir, dirs, files in os.walk(self.base_dir):
-                dirs[:] = [d for d in dirs if d not in self._load_exclude_dirs()]
-                if "pom.xml" in files:
-                    pom_path = os.path.join(root_dir, "pom.xml")
+            with os.scandir(directory) as it:
+                for entry in it:
                     try:
-                        tree = ET.parse(pom_path)
-                        pom_root = tree.getroot()
-                        ns = ""
-                        if "}" in pom_root.tag:
-                            ns = pom_root.tag.split("}")[0] + "}"
-                        
-                        # Do not use projects with parent tag
-                        if pom_root.find(f"{ns}parent") is not None:
-                            # If a parent-Tag is found, continue and search for the next pom.xml
-                            continue 
-                        
-                        project = MavenProject(root_dir)
-                        self.project_found.emit(project)
-                        
-                        # When a project is found, we clear the directory listing to prevent os.walk from running to the subfolders
-                        dirs[:] = []
-                        
-                    except ET.ParseError:
-                        print(f"Error parsing {pom_path}: Not a valid XML file.")
-                        pass
-                    except Exception as e:
-                        print(f"An unexpected error occurred with {pom_path}: {e}")
+                        if entry.is_dir(follow_symlinks=False):
+                            if not self._is_excluded(entry.name, entry.path):
+                                subdirs.append(entry.path)
+                        elif entry.name == "pom.xml":
+                            pom_entry = entry
+                    except OSError:
                         pass
+        except OSError as e:
+            print(f"Error reading directory {directory}: {e}")
+            return []
+        if pom_entry is not None:
+            try:
+                # handle_pom returns True for a root project, then the subfolders are not searched
+                if handle_pom(directory, pom_entry.path, pom_entry.stat()):
+                    return []
+            except OSError as e:
+                print(f"Error reading {pom_entry.path}: {e}")
+        if on_directory:
+            on_directory(directory)
+        return subdirs
 
-class MavenBuildGUI(QtWidgets.QWidget):
-    def __init__(self, config):
-        super().__init__()
-        self.config = config
-        # Saved maven projects
-        self.projects = []
-        # Running build-worker
-        self.worker = None
-        self._initUI()
-        # Load last build options
-        self._loadLastState()
+    def scan(self, handle_pom, start_dir=None, on_directory=None):
+        """
+        Calls handle_pom(directory, pom_path, stat) from the pool threads for every pom.xml found
+        and on_directory(directory) for every directory without root project. start_dir limits
+        the search to a subdirectory of base_dir.
+        """
+        start_dir = start_dir or self.base_dir
+        if not os.path.isdir(start_dir):
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = {pool.submit(self._scan_dir, start_dir, handle_pom, on_directory)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for subdir in future.result():
+                        pending.add(pool.submit(self._scan_dir, subdir, handle_pom, on_directory))
 
-    def _initUI(self):
-        self.setWindowTitle("Maven Build Manager | v.0.17a © 2025 by magicmarcy")
-        self.resize(900, 900)
-        
-        tab_widget = QtWidgets.QTabWidget()
-        
-        # --- Tab 1: maven projects & build optionen ---
-        tab_projects = QtWidgets.QWidget()
-        projects_layout = QtWidgets.QVBoxLayout(tab_projects)
-        
-        lbl_projects = QtWidgets.QLabel("Gefundene Maven Projekte:")
-        projects_layout.addWidget(lbl_projects)
-        
-        # Table for projects (4 columns)
-        self.projectTable = QtWidgets.QTableWidget()
-        self.projectTable.setColumnCount(4)
-        self.projectTable.setHorizontalHeaderLabels(["Projektname (ArtifactId)", "Name (GroupId)", "Java-Version", "Pfad"])
-        self.projectTable.setSortingEnabled(True)
-        self.projectTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.projectTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        projects_layout.addWidget(self.projectTable)
-        
-        # Dropdown for maven-goals ("clean install", "clean", "test", "package")
-        goalOptionsLayout = QtWidgets.QHBoxLayout()
-        goalOptionsLabel = QtWidgets.QLabel("Maven Ziel:")
-        self.goalComboBox = QtWidgets.QComboBox()
-        goal_options_str = self.config.get("maven", "goal_options", fallback="clean install, clean, test")
-        if goal_options_str:
-            for goal in [g.strip() for g in goal_options_str.split(",") if g.strip()]:
-                self.goalComboBox.addItem(goal)
-        goalOptionsLayout.addWidget(goalOptionsLabel)
-        goalOptionsLayout.addWidget(self.goalComboBox)
-        projects_layout.addLayout(goalOptionsLayout)
-        
-        # dynamic generated cheboxes (from "checkbox_options" in config-file)
-        optionsGroup = QtWidgets.QGroupBox("Maven Optionen")
-        optionsGroupLayout = QtWidgets.QHBoxLayout()
-        self.dynamicCheckboxes = []
-        checkbox_options_str = self.config.get("maven", "checkbox_options", fallback="")
-        if checkbox_options_str:
-            for option in [opt.strip() for opt in checkbox_options_str.split(",") if opt.strip()]:
-                chk = QtWidgets.QCheckBox(option)
-                self.dynamicCheckboxes.append(chk)
-                optionsGroupLayout.addWidget(chk)
-        optionsGroup.setLayout(optionsGroupLayout)
-        projects_layout.addWidget(optionsGroup)
-        
-        # Inputfield for further maven options
-        additionalOptionsLayout = QtWidgets.QHBoxLayout()
-        additionalOptionsLabel = QtWidgets.QLabel("Manuelle Maven Optionen:")
-        self.optionsInput = QtWidgets.QLineEdit(self.config.get("maven", "user_options", fallback=""))
-        additionalOptionsLayout.addWidget(additionalOptionsLabel)
-        additionalOptionsLayout.addWidget(self.optionsInput)
-        projects_layout.addLayout(additionalOptionsLayout)
-        
-        # Build-Button
-        self.buildButton = QtWidgets.QPushButton("Projekt bauen")
-        self.buildButton.setStyleSheet("background-color: #007d8f; color: #FFFFFF; font-weight: bold; font-size: 12px;")
-        self.buildButton.clicked.connect(self._buildProject)
-        projects_layout.addWidget(self.buildButton)
-        
-        # Cancel-Button
-        self.cancelButton = QtWidgets.QPushButton("Build abbrechen")
-        self.cancelButton.setStyleSheet("background-color: #ff8c73; color: #000000; font-weight: bold; font-size: 12px;")
-        self.cancelButton.clicked.connect(self._cancelBuild)
-        self.cancelButton.setVisible(True)
-        projects_layout.addWidget(self.cancelButton)
-        
-        # Log (Console)
-        self.outputLog = QtWidgets.QTextEdit()
-        self.outputLog.setReadOnly(True)
-        self.outputLog.setFixedHeight(200)
-        projects_layout.addWidget(self.outputLog)
-        
-        # Button to clear the console
-        self.clearConsoleButton = QtWidgets.QPushButton("Konsole leeren")
-        self.clearConsoleButton.setStyleSheet("background-color: #ff8c73; color: #00000; font-weight: bold; font-size: 12px;")
-        self.clearConsoleButton.clicked.connect(self._clearConsole)
-        projects_layout.addWidget(self.clearConsoleButton)
-        
-        tab_widget.addTab(tab_projects, "Maven Projekte")
-        
-        # --- Tab 2: Java Installations ---
-        tab_java = QtWidgets.QWidget()
-        java_layout = QtWidgets.QVBoxLayout(tab_java)
-        java_label = QtWidgets.QLabel("Installierte Java-Versionen (Installationsverzeichnis):")
-        java_layout.addWidget(java_label)
-        
-        # Table for the Java-Installations (4 columns)
-        self.javaTable = QtWidgets.QTableWidget()
-        self.javaTable.setColumnCount(4)
-        self.javaTable.setHorizontalHeaderLabels(["Name", "Version", "Pfad", "Java-Bin"])
-        self.javaTable.setSortingEnabled(True)
-        self.javaTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.javaTable.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        java_layout.addWidget(self.javaTable)
-        
-        self.refreshJavaButton = QtWidgets.QPushButton("Java Versionen aktualisieren")
-        self.refreshJavaButton.setStyleSheet("background-color: #007d8f; color: #FFFFFF; font-weight: bold; font-size: 12px;")
-        self.refreshJavaButton.clicked.connect(self._refreshJavaList)
-        java_layout.addWidget(self.refreshJavaButton)
-        
-        tab_widget.addTab(tab_java, "Java Installationen")
+class SnapshotStore:
+    """
+    Stores a snapshot of the build inputs (pom.xml, src/ and further configured paths) of
+    each project after a successful build. With include_modules the same paths are taken
+    from every module of an aggregator as well. Every file is recorded with mtime and size
+    and, if use_hash is set, with a SHA-1 of its content. The directories are walked in
+    parallel, hashes of unchanged files are taken over from the previous snapshot.
+    """
 
-        # --- Tab 3: Info-Tab ---
-        tab_hinweise = QtWidgets.QWidget()
-        hinweise_layout = QtWidgets.QVBoxLayout(tab_hinweise)
+    def __init__(self, directory, paths=("pom.xml", "src"), use_hash=False, max_workers=None, exclude_dirs=(),
+                 include_modules=True):
+        self.directory = directory
+        self.paths = [path for path in paths if path]
+        self.use_hash = use_hash
+        self.include_modules = include_modules
+        # Names of directories that are skipped at any depth
+        self.exclude_dirs = set(exclude_dirs)
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
 
-        self.hinweisTextBox = QtWidgets.QTextBrowser()
-        self.hinweisTextBox.setOpenExternalLinks(True)
-        
-        html_content = """
-        <style>
-        p {
-         font-size: 12px;
-        }
-        </style>
-        <h2>Maven Build Manager</h2>
-        <p>Der Maven Build Manager ist ein reines Freizeitprojekt von mir.</p>
-        <p>Solltest du Fragen, Hinweise oder Anregungen haben oder weitere Information zum Projekt benötigen, bitte kontaktiere mich einfach über die GitHub-Projektseite.</p>
-        <h2>ChangeLog</h2>
-        <p>
-          <b>0.17a</b><br/>
-          - Es wird nun nach dem ersten Fund nicht weiter im Verzeichnis gesucht<br/>
-          - Neue Eingeschft exclude_dirs um Verzeichnisse auszuschliessen
-        </p>
-        <p>
-          <b>0.16a</b><br/>
-          - Texte und Infos überarbeitet<br/>
-          - Projekt auf GitHub veröffentlicht
-        </p>
-        <p>
-          <b>0.15a</b><br/>
-          - Vollständig lauffähige Alpha-Version<br/>
-          - Info Tab hinzugefügt
-          - Beschreibungen aktualisiert
-        </p>
-        <p>
-          <b>0.14a</b><br/>
-          - Korrektur der Speicherung der gewählten Einstellunge damit auch nur diese Settings überschrieben werden<br/>
-          - Dynamische Ausgabe der Projekte damit der Anwendungsstart nicht unnötig verzögert wird
-        </p>
-        <p>
-          <b>0.13a</b><br/>
-          - Änderunge der Farben der Buttons<br/>
-          - Größerverhältnise der Anwendung sowie der Konsole angepasst<br/>
-          - Button zum Abbrechen des Builds hinzugefügt<br/>
-          - Anwendungssperre während des Builds hinzugefügt
-        </p>
-        <p>
-          <b>0.12a</b><br/>
-          - Speicherung der gewählten Einstellungen hinzugefügt, damit beim Starten der Anwendung vorgeblendet werden kann<br/>
-        </p>
-        <p>
-          <b>0.11</b><br/>
-          - Dynamische Ausgabe des Build-Outputs hinzugefügt damit nicht erst beim Build-Ende alles angezeigt wird<br/>
-          - Abbrechen Button hinzugefügt um den laufenden Build zu beenden
-        </p>
-        <p>
-          <b>0.10a</b><br/>
-          - Tooltips für die Pfade der Projekte hinzugefügt falls der Platz des Feldes nicht ausreicht<br/>
-          - Anpassung der Ergebnisse (Tabelle statt Liste)
-        </p>
-        <p>
-          <b>0.9a</b><br/>
-          - Anzeige der installierten Java-Versionen aktualisiert<br/>
-        </p>
-        <p>
-          <b>0.8a</b><br/>
-          - Rekursives Einlesen der Projekte und nicht nur auf Base-Path Ebene damit auch Unterprojekte erkannt werden. Hinweis: Es werden nur pom.xml berücksichtigt, die KEIN parent definiert haben!<br/>
-        </p>
-        <p>
-          <b>0.7a</b><br/>
-          - Weitere Informationen zum Projekt hinzugefügt<br/>
-          - Weitere Informationen zu den installierten Java-Versionen hinzugefügt<br/>
-        </p>
-        <p>
-          <b>0.6a</b><br/>
-          - Fefhlerbehebungen
-        </p>
-        <p>
-          <b>0.5a</b><br/>
-          - Dynamische Checkbox-Optionen aus der Config-Datei<br/>
-          - DropeDown Menu für die Maven-Goals<br/>
-          - Kombination der Optionen
-        </p>
-        <p>
-          <b>0.4a</b><br/>
-          - Über eine Config-Datei ist es nun möglich Optionen für die Oberfläche sowie die Pfade der Projekte und installierten Java-Versionen festzulegen
-        </p>
-        <p>
-          <b>0.3a</b><br/>
-          - Fehlerbehebungen
-        </p>
-        <p>
-          <b>0.2a</b><br/>
-          - Anpassung der Maven-/Build-Befehle
-        </p>
-        <p>
-          <b>0.1a</b><br/>
-          - Erstellung des Projekts, erste Blaupause
-        </p>
-        """
-        self.hinweisTextBox.setHtml(html_content)
-        hinweise_layout.addWidget(self.hinweisTextBox)
+    def _file(self, project_path):
+        key = hashlib.sha1(os.path.abspath(project_path).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key + ".json")
 
-        # Adding the new tab
-        tab_widget.addTab(tab_hinweise, "Hinweise")
-        
-        main_layout = QtWidgets.QVBoxLayout()
-        main_layout.addWidget(tab_widget)
-        self.setLayout(main_layout)
-        
-        self._loadProjectsAsync()
-        self._refreshJavaList()
-
-        QtCore.QTimer.singleShot(0, self.set_interactive_mode)
-
-    def set_interactive_mode(self):
-        header = self.projectTable.horizontalHeader()
-        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
-
-    def _loadProjectsAsync(self):
-        self.projectTable.setRowCount(0)
-        self.projects = []
-        base_dir = self.config.get("maven", "projects_directory", fallback=".")
-        self.projectLoaderWorker = ProjectLoaderWorker(base_dir)
-        self.projectLoaderWorker.project_found.connect(self._addProject)
-        self.projectLoaderWorker.start()
-
-    def _addProject(self, project):
-        self.projects.append(project)
-        row = self.projectTable.rowCount()
-        self.projectTable.insertRow(row)
-        # Column 0: ArtifactId with tooltip for the full path
-        item_artifact = QtWidgets.QTableWidgetItem(project.artifactId)
-        item_artifact.setData(QtCore.Qt.UserRole, project)
-        self.projectTable.setItem(row, 0, item_artifact)
-        # Column 1: GroupId
-        item_group = QtWidgets.QTableWidgetItem(project.groupId)
-        self.projectTable.setItem(row, 1, item_group)
-        # Column 2: Java-Version
-        item_version = QtWidgets.QTableWidgetItem(project.java_version)
-        self.projectTable.setItem(row, 2, item_version)
-        # Column 3: Path with tooltip for the full path
-        item_path = QtWidgets.QTableWidgetItem(project.path)
-        item_path.setToolTip(project.path)
-        self.projectTable.setItem(row, 3, item_path)
-
-    def _refreshJavaList(self):
-        self.javaTable.setRowCount(0)
-        java_dir = self.config.get("java", "install_directory", fallback="")
-        if os.path.isdir(java_dir):
-            for entry in os.listdir(java_dir):
-                full_path = os.path.join(java_dir, entry)
+    def load(self, project_path):
+        try:
+            with open(self._file(project_path), "r", encoding="utf-8") as f:
+                return json.load(f).get("files")
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Fehler beim Lesen des Snapshots von {project_path}: {e}")
+            return None
+
+    def save(self, project_path, snapshot):
+        os.makedirs(self.directory, exist_ok=True)
+        filename = self._file(project_path)
+        tmp_file = filename + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump({"path": project_path, "files": snapshot}, f)
+            os.replace(tmp_file, filename)
+        except Exception as e:
+            print(f"Fehler beim Speichern des Snapshots von {project_path}: {e}")
+
+    @staticmethod
+    def _hash(path):
+        sha1 = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                sha1.update(block)
+        return sha1.hexdigest()
+
+    def _record(self, project_path, path, stat, previous):
+        rel_path = os.path.relpath(path, project_path).replace("\\", "/")
+        entry = [stat.st_mtime_ns, stat.st_size, None]
+        if self.use_hash:
+            old = previous.get(rel_path)
+            if old and old[0] == entry[0] and old[1] == entry[1] and old[2]:
+                entry[2] = old[2]
+            else:
+                entry[2] = self._hash(path)
+        return rel_path, entry
+
+    def _scan_dir(self, project_path, directory, previous):
+        files = {}
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.exclude_dirs:
+                                subdirs.append(entry.path)
+                        elif entry.is_file():
+                            rel_path, record = self._record(project_path, entry.path, entry.stat(), previous)
+                            files[rel_path] = record
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+        return files, subdirs
+
+    def take(self, project_path, previous=None):
+        """Returns the current snapshot {relative path: [mtime, size, hash]} of a project."""
+        previous = previous or {}
+        snapshot = {}
+        directories = []
+        roots = [project_path]
+        if self.include_modules:
+            # The module tree is read again, modules can be added or removed since the last build
+            for module in read_module_tree(project_path):
+                roots.extend(child.path for child in module.walk())
+        for root in roots:
+            for path in self.paths:
+                full_path = os.path.join(root, path)
                 if os.path.isdir(full_path):
-                    version_info = "Unbekannt"
-                    release_file = os.path.join(full_path, "release")
-                    if os.path.isfile(release_file):
-                        try:
-                            with open(release_file, "r", encoding="utf-8") as rf:
-                                for line in rf:
-                                    if line.startswith("JAVA_VERSION="):
-                                        parts = line.strip().split("=", 1)
-                                        if len(parts) == 2:
-                                            version_info = parts[1].strip().strip('"')
-                                        break
-                        except Exception as e:
-                            version_info = "Fehler beim Lesen"
-                    bin_path = os.path.join(full_path, "bin", "java")
-                    existenz = "Vorhanden" if (os.path.isfile(bin_path) or os.path.isfile(bin_path + ".exe")) else "Nicht gefunden"
-                    row = self.javaTable.rowCount()
-                    self.javaTable.insertRow(row)
-                    item_name = QtWidgets.QTableWidgetItem(entry)
-                    self.javaTable.setItem(row, 0, item_name)
-                    item_version = QtWidgets.QTableWidgetItem(version_info)
-                    self.javaTable.setItem(row, 1, item_version)
-                    item_path = QtWidgets.QTableWidgetItem(full_path)
-                    self.javaTable.setItem(row, 2, item_path)
-                    item_bin = QtWidgets.QTableWidgetItem(existenz)
-                    self.javaTable.setItem(row, 3, item_bin)
+                    directories.append(full_path)
+                elif os.path.isfile(full_path):
+                    rel_path, record = self._record(project_path, full_path, os.stat(full_path), previous)
+                    snapshot[rel_path] = record
+        if not directories:
+            return snapshot
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = {pool.submit(self._scan_dir, project_path, directory, previous) for directory in directories}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    snapshot.update(files)
+                    for subdir in subdirs:
+                        pending.add(pool.submit(self._scan_dir, project_path, subdir, previous))
+        return snapshot
+
+    def unchanged(self, previous, current):
+        if previous is None or previous.keys() != current.keys():
+            return False
+        for rel_path, (mtime, size, digest) in current.items():
+            old_mtime, old_size, old_digest = previous[rel_path]
+            if size != old_size:
+                return False
+            if mtime != old_mtime and not (digest and digest == old_digest):
+                return False
+        return True
+
+# Plugins of the default lifecycle of a jar project, they are not declared in most poms
+DEFAULT_MAVEN_PLUGINS = ("maven-clean-plugin", "maven-resources-plugin", "maven-compiler-plugin",
+                         "maven-surefire-plugin", "maven-jar-plugin", "maven-install-plugin")
+
+REPOSITORY_METADATA_SUFFIXES = (".xml", ".sha1", ".md5", ".lastUpdated", ".repositories", ".properties")
+
+def default_local_repository():
+    """The local repository from ~/.m2/settings.xml, otherwise ~/.m2/repository."""
+    m2_dir = os.path.join(os.path.expanduser("~"), ".m2")
+    try:
+        for _, elem in ET.iterparse(os.path.join(m2_dir, "settings.xml")):
+            if elem.tag.rsplit("}", 1)[-1] == "localRepository" and (elem.text or "").strip():
+                return os.path.expanduser(elem.text.strip().replace("${user.home}", os.path.expanduser("~")))
+    except (OSError, ET.ParseError):
+        pass
+    return os.path.join(m2_dir, "repository")
+
+def read_pom_coordinates(pom_path, inherited=None):
+    """
+    Reads everything a build needs from the local repository out of a pom.xml: parent,
+    dependencies, imported BOMs, plugins and extensions as (groupId, artifactId, version,
+    extension) and the modules. Unlike read_pom the whole file is read. inherited contains
+    the properties and dependencyManagement of the parent if it is part of the same build.
+    Returns a dict, raises ET.ParseError for invalid files.
+    """
+    inherited = inherited or {}
+    root = ET.parse(pom_path).getroot()
+    namespace = root.tag[:root.tag.index("}") + 1] if root.tag.startswith("{") else ""
+
+    def find(elem, path):
+        return elem.find("/".join(namespace + part for part in path.split("/")))
+
+    def findall(elem, path):
+        return elem.findall("/".join(namespace + part for part in path.split("/")))
+
+    def text(elem, path):
+        child = find(elem, path)
+        return (child.text or "").strip() if child is not None else ""
+
+    properties = dict(inherited.get("properties", {}))
+    for elem in findall(root, "properties/*"):
+        properties[elem.tag.rsplit("}", 1)[-1]] = (elem.text or "").strip()
+    parent = None
+    parent_elem = find(root, "parent")
+    if parent_elem is not None:
+        parent = (text(parent_elem, "groupId"), text(parent_elem, "artifactId"), text(parent_elem, "version"), "pom")
+    group_id = text(root, "groupId") or (parent[0] if parent else "")
+    version = text(root, "version") or (parent[2] if parent else "")
+    properties.update({"project.groupId": group_id, "project.artifactId": text(root, "artifactId"),
+                       "project.version": version, "project.parent.version": parent[2] if parent else ""})
+
+    def coordinate(elem, default_group="", extension="jar"):
+        values = [_interpolate(text(elem, tag), properties) for tag in ("groupId", "artifactId", "version")]
+        values[0] = values[0] or default_group
+        if "${" in values[2] or values[2][:1] in ("[", "("):
+            # Unknown property or version range, any version counts
+            values[2] = ""
+        return (values[0], values[1], values[2], extension)
+
+    managed = dict(inherited.get("managed", {}))
+    artifacts = []
+    for elem in findall(root, "dependencyManagement/dependencies/dependency"):
+        group, artifact, managed_version, _ = coordinate(elem)
+        if text(elem, "scope") == "import":
+            artifacts.append((group, artifact, managed_version, "pom"))
+        elif managed_version:
+            managed[(group, artifact)] = managed_version
+    for elem in findall(root, "dependencies/dependency"):
+        if text(elem, "scope") == "system":
+            continue
+        dependency_type = text(elem, "type") or "jar"
+        group, artifact, dependency_version, _ = coordinate(elem, extension="pom" if dependency_type == "pom" else "jar")
+        artifacts.append((group, artifact, dependency_version or managed.get((group, artifact), ""),
+                          "pom" if dependency_type == "pom" else "jar"))
+    for path in ("build/plugins/plugin", "build/extensions/extension"):
+        for elem in findall(root, path):
+            artifacts.append(coordinate(elem, "org.apache.maven.plugins"))
+    modules = [(elem.text or "").strip() for elem in findall(root, "modules/module") if (elem.text or "").strip()]
+    return {
+        "coordinates": (group_id, text(root, "artifactId")),
+        "parent": parent,
+        "artifacts": artifacts,
+        "modules": modules,
+        "properties": properties,
+        "managed": managed,
+    }
+
+class LocalRepositoryIndex:
+    """
+    Cache of the contents of the local Maven repository (~/.m2/repository). Only the
+    directories of the requested artifacts are read; every directory is stored with its
+    mtime and only read again when the mtime changed, so checking an unchanged
+    coordinate costs one stat. Saved as JSON in cache_file.
+    """
+
+    def __init__(self, repository, cache_file=LOCAL_REPOSITORY_INDEX_FILE):
+        self.repository = repository
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._dirty = False
+        # Relative directory -> [mtime, list of file or directory names]
+        self.entries = {}
+
+    def load(self):
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("repository") == os.path.abspath(self.repository):
+                self.entries = data.get("entries", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Fehler beim Lesen des Repository-Index {self.cache_file}: {e}")
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"repository": os.path.abspath(self.repository), "entries": dict(self.entries)}
+            self._dirty = False
+        tmp_file = self.cache_file + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"Fehler beim Speichern des Repository-Index {self.cache_file}: {e}")
+
+    def _list(self, relative_dir):
+        # Names in the directory, None if it does not exist
+        path = os.path.join(self.repository, relative_dir)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            with self._lock:
+                if self.entries.pop(relative_dir, None) is not None:
+                    self._dirty = True
+            return None
+        with self._lock:
+            entry = self.entries.get(relative_dir)
+        if entry and entry[0] == mtime:
+            return entry[1]
+        try:
+            names = sorted(os.listdir(path))
+        except OSError:
+            return None
+        with self._lock:
+            self.entries[relative_dir] = [mtime, names]
+            self._dirty = True
+        return names
+
+    def contains(self, group_id, artifact_id, version="", extension="jar"):
+        """True if the artifact is in the repository, without version any version counts."""
+        artifact_dir = "/".join(group_id.split(".") + [artifact_id])
+        if version:
+            versions = [version]
         else:
-            self.outputLog.append(f"Java-Installationsverzeichnis '{java_dir}' existiert nicht.")
+            # The artifact directory also contains maven-metadata*.xml and checksums
+            versions = [name for name in self._list(artifact_dir) or []
+                        if not name.startswith(".") and not name.endswith(REPOSITORY_METADATA_SUFFIXES)]
+        for candidate in versions:
+            names = self._list(f"{artifact_dir}/{candidate}")
+            if not names:
+                continue
+            if candidate.endswith("-SNAPSHOT"):
+                # Downloaded snapshots carry a timestamp instead of SNAPSHOT
+                prefix = f"{artifact_id}-{candidate[:-len('SNAPSHOT')]}"
+                if any(name.startswith(prefix) and name.endswith("." + extension) for name in names):
+                    return True
+            elif f"{artifact_id}-{candidate}.{extension}" in names:
+                return True
+        return False
+
+def is_offline_command(command):
+    return "-o" in command or "--offline" in command
 
-    def _buildProject(self):
-        selected_rows = self.projectTable.selectionModel().selectedRows()
-        if not selected_rows:
-            self.outputLog.append("Kein Projekt ausgewählt.")
+class OfflineResolver:
+    """
+    Checks whether a project can be built with -o: the parent, the dependencies, imported
+    BOMs and the plugins of the project and of all its modules have to be in the local
+    repository. Artifacts of the modules of the same build are not required.
+    """
+
+    def __init__(self, index):
+        self.index = index
+
+    def _collect(self, pom_path, inherited, result, seen):
+        pom_path = os.path.normpath(pom_path)
+        if pom_path in seen or not os.path.isfile(pom_path):
             return
-        row = selected_rows[0].row()
-        item = self.projectTable.item(row, 0)
-        project = item.data(QtCore.Qt.UserRole)
-        self.outputLog.append(f"Baue Projekt: {project.artifactId}")
-        
-        # While a build is running disable GUI-Parts
-        self.buildButton.setEnabled(False)
-        self.goalComboBox.setEnabled(False)
-        self.optionsInput.setEnabled(False)
-        for chk in self.dynamicCheckboxes:
-            chk.setEnabled(False)
-        self.projectTable.setEnabled(False)
-        # Show Cancel-Button
-        self.cancelButton.setVisible(True)
-        self.cancelButton.setEnabled(True)
-        
-        if platform.system().lower() == "windows":
-            maven_executable = self.config.get("maven", "maven_executable", fallback="mvn.cmd")
-        else:
-            maven_executable = "mvn"
-        
-        goal_str = self.goalComboBox.currentText().strip()
-        if goal_str:
-            command = [maven_executable] + goal_str.split()
-        else:
-            command = [maven_executable]
-        
-        default_config_options = self.config.get("maven", "default_options", fallback="").split()
-        extra_config_options = self.config.get("maven", "extra_options", fallback="").split()
-        options_from_checkboxes = []
-        for chk in self.dynamicCheckboxes:
-            if chk.isChecked():
-                options_from_checkboxes.extend(chk.text().split())
-        user_options = self.optionsInput.text().strip().split() if self.optionsInput.text().strip() else []
-        
-        command += default_config_options + options_from_checkboxes + user_options + extra_config_options
-        self.outputLog.append("Ausführung: " + " ".join(command))
-        
-        self.worker = MavenBuildWorker(command, project.path)
-        self.worker.build_output.connect(lambda text: self.outputLog.append(text))
-        self.worker.finished.connect(self._buildFinished)
-        self.worker.start()
-
-    def _buildFinished(self):
-        # Enable GUI
-        self.buildButton.setEnabled(True)
-        self.goalComboBox.setEnabled(True)
-        self.optionsInput.setEnabled(True)
-        for chk in self.dynamicCheckboxes:
-            chk.setEnabled(True)
-        self.projectTable.setEnabled(True)
-        self.cancelButton.setVisible(True)
-
-    def _cancelBuild(self):
-        if self.worker:
-            self.worker.cancel()
-            self.cancelButton.setEnabled(False)
-
-    def _clearConsole(self):
-        self.outputLog.clear()
-
-    def _loadLastState(self):
-        # Load saved build options from config
-        last_goal = self.config.get("maven", "last_selected_goal", fallback="")
-        if last_goal:
-            index = self.goalComboBox.findText(last_goal)
-            if index != -1:
-                self.goalComboBox.setCurrentIndex(index)
-        last_checked = self.config.get("maven", "last_checked_options", fallback="")
-        if last_checked:
-            last_checked_list = [s.strip() for s in last_checked.split(",") if s.strip()]
-            for chk in self.dynamicCheckboxes:
-                if chk.text() in last_checked_list:
-                    chk.setChecked(True)
-        last_user_options = self.config.get("maven", "last_user_options", fallback="")
-        if last_user_options:
-            self.optionsInput.setText(last_user_options)
-
-    def closeEvent(self, event):
-        # Reload relevant keys from confog
-        updates = {
-            "last_selected_goal": self.goalComboBox.currentText(),
-            "last_checked_options": ", ".join([chk.text() for chk in self.dynamicCheckboxes if chk.isChecked()]),
-            "last_user_options": self.optionsInput.text()
-        }
-        config_file = "config.ini"
+        seen.add(pom_path)
+        pom = read_pom_coordinates(pom_path, inherited)
+        result["reactor"].add(pom["coordinates"])
+        if pom["parent"]:
+            result["artifacts"].append(pom["parent"])
+        result["artifacts"].extend(pom["artifacts"])
+        for module in pom["modules"]:
+            module_pom = os.path.join(os.path.dirname(pom_path), module)
+            if not module_pom.endswith(".xml"):
+                module_pom = os.path.join(module_pom, "pom.xml")
+            self._collect(module_pom, {"properties": pom["properties"], "managed": pom["managed"]}, result, seen)
+
+    def missing(self, project_path):
+        """Returns the sorted coordinates ("groupId:artifactId:version") that are not in the local repository."""
+        result = {"reactor": set(), "artifacts": []}
+        with TRACER.span("OfflineResolver.missing", "build"):
+            self._collect(os.path.join(project_path, "pom.xml"), None, result, set())
+            artifacts = set(result["artifacts"])
+            artifacts |= {("org.apache.maven.plugins", plugin, "", "jar") for plugin in DEFAULT_MAVEN_PLUGINS}
+            missing = set()
+            for group_id, artifact_id, version, extension in artifacts:
+                if not group_id or not artifact_id or (group_id, artifact_id) in result["reactor"]:
+                    continue
+                if not self.index.contains(group_id, artifact_id, version, extension):
+                    missing.add(":".join(part for part in (group_id, artifact_id, version) if part))
+        self.index.save()
+        return sorted(missing)
+
+# Directories that are no build inputs: outputs, version control and IDE settings
+BUILD_CACHE_IGNORED_DIRS = ("target", ".git", ".svn", ".hg", ".idea", ".vscode", ".settings")
+# Options that do not change the outputs of a build
+BUILD_CACHE_IGNORED_OPTIONS = ("-o", "--offline", "-q", "--quiet", "-X", "--debug", "-B", "--batch-mode", "-e", "--errors")
+# Outputs taken from target/ of the project and its modules
+BUILD_CACHE_OUTPUT_EXTENSIONS = (".jar", ".war", ".ear")
+
+class BuildCache:
+    """
+    Local content-addressed cache of build outputs. The key is a SHA-256 of all inputs of
+    a project (every file except target/, version control and IDE directories, with
+    content hashes), the JDK and the goals and options of the command. An entry holds
+    target/*.jar (also .war/.ear) of the project and its modules and, for install, the
+    files the build installed into the local repository. On a hit the files are copied
+    back instead of running Maven. Entries are evicted least recently used once the
+    cache grows beyond max_size bytes. Hits, misses and the total size of the entries are
+    counted in stats.json, so the entries only have to be listed for the eviction and
+    for stats().
+    """
+
+    def __init__(self, directory, repository, max_size=2 * 1024 ** 3):
+        self.directory = directory
+        self.repository = repository
+        self.max_size = max_size
+        # Reentrant, the eviction and the counters run while the lock is held
+        self._lock = threading.RLock()
+        # Content hashes of the inputs, only files with a new mtime or size are hashed again
+        # The whole project tree is read, the modules are part of it already
+        self.inputs = SnapshotStore(os.path.join(directory, "inputs"), (".",), use_hash=True,
+                                    exclude_dirs=BUILD_CACHE_IGNORED_DIRS, include_modules=False)
+
+    @staticmethod
+    def accepts(command):
+        """
+        Only goals that produce outputs are cached, deploy also changes a remote repository.
+        Builds of single modules (-pl) would store outdated outputs of the other modules.
+        """
+        goals = set(command[1:])
+        return bool(goals & {"package", "verify", "install"}) and "deploy" not in goals and not is_partial_command(command)
+
+    def key(self, project_path, command, env=None):
+        """Hash of the inputs of a build, computed before it runs."""
+        with TRACER.span("BuildCache.key", "cache"):
+            previous = self.inputs.load(project_path)
+            inputs = self.inputs.take(project_path, previous)
+            if inputs != previous:
+                self.inputs.save(project_path, inputs)
+            options = []
+            skip = False
+            for i, token in enumerate(command[1:], 1):
+                if skip:
+                    skip = False
+                elif token == "-T" and i + 1 < len(command):
+                    # The thread count does not change the outputs
+                    skip = True
+                elif token not in BUILD_CACHE_IGNORED_OPTIONS and not token.startswith(("-T", "--threads=")):
+                    options.append(token)
+            sha256 = hashlib.sha256()
+            sha256.update(json.dumps({
+                "jdk": (env or {}).get("JAVA_HOME") or os.environ.get("JAVA_HOME", ""),
+                "options": options,
+            }).encode("utf-8"))
+            for rel_path in sorted(inputs):
+                _, size, digest = inputs[rel_path]
+                sha256.update(f"{rel_path}\0{size}\0{digest}\n".encode("utf-8"))
+            return sha256.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def _modules(self, project_path):
+        # (directory, groupId, artifactId, version) of the project and all its modules
+        result = []
+        todo = [(os.path.join(project_path, "pom.xml"), None)]
+        seen = set()
+        while todo:
+            pom_path, inherited = todo.pop()
+            pom_path = os.path.normpath(pom_path)
+            if pom_path in seen or not os.path.isfile(pom_path):
+                continue
+            seen.add(pom_path)
+            try:
+                pom = read_pom_coordinates(pom_path, inherited)
+            except ET.ParseError:
+                continue
+            directory = os.path.dirname(pom_path)
+            group_id, artifact_id = pom["coordinates"]
+            version = _interpolate(pom["properties"].get("project.version", ""), pom["properties"])
+            result.append((directory, group_id, artifact_id, version))
+            for module in pom["modules"]:
+                module_pom = os.path.join(directory, module)
+                if not module_pom.endswith(".xml"):
+                    module_pom = os.path.join(module_pom, "pom.xml")
+                todo.append((module_pom, {"properties": pom["properties"], "managed": pom["managed"]}))
+        return result
+
+    def _outputs(self, project_path, command, since):
+        """(kind, relative path, absolute path) of the files produced by a build that started at since."""
+        install = "install" in command
+        outputs = []
+        for directory, group_id, artifact_id, version in self._modules(project_path):
+            target = os.path.join(directory, "target")
+            try:
+                names = os.listdir(target)
+            except OSError:
+                names = []
+            for name in names:
+                path = os.path.join(target, name)
+                if name.endswith(BUILD_CACHE_OUTPUT_EXTENSIONS) and os.path.isfile(path):
+                    outputs.append(("project", os.path.relpath(path, project_path).replace("\\", "/"), path))
+            if not install or not group_id or not artifact_id or not version or "${" in version:
+                continue
+            relative_dir = "/".join(group_id.split(".") + [artifact_id, version])
+            try:
+                entries = list(os.scandir(os.path.join(self.repository, relative_dir)))
+            except OSError:
+                continue
+            for entry in entries:
+                # Only what this build installed, not downloaded metadata of older builds
+                if entry.is_file() and entry.stat().st_mtime >= since - 1 and not entry.name.startswith("_"):
+                    outputs.append(("repository", f"{relative_dir}/{entry.name}", entry.path))
+        return outputs
+
+    def store(self, key, project_path, command, since, build_time):
+        """Copies the outputs of a successful build into the cache, returns the number of files."""
+        with TRACER.span("BuildCache.store", "cache"):
+            outputs = self._outputs(project_path, command, since)
+            if not outputs:
+                return 0
+            entry = self._entry(key)
+            tmp_entry = entry + f".tmp{threading.get_ident()}"
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+            files = []
+            size = 0
+            for kind, rel_path, path in outputs:
+                destination = os.path.join(tmp_entry, kind, rel_path)
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                shutil.copy2(path, destination)
+                files.append([kind, rel_path])
+                size += os.path.getsize(destination)
+            with open(os.path.join(tmp_entry, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump({"project": project_path, "files": files, "size": size, "build_time": build_time,
+                           "created": time.time()}, f)
+            with self._lock:
+                # Read before the new entry is added, an older stats.json gets its size from the listing
+                self._counters()
+                replaced = self._entry_size(entry)
+                shutil.rmtree(entry, ignore_errors=True)
+                os.replace(tmp_entry, entry)
+                counters = self._count("stores", size=size - replaced)
+                if counters["size"] > self.max_size:
+                    self._evict()
+            return len(files)
+
+    def restore(self, key, project_path):
+        """Copies the outputs of an entry back, returns the manifest or None on a miss."""
+        with TRACER.span("BuildCache.restore", "cache"):
+            entry = self._entry(key)
+            manifest_file = os.path.join(entry, "manifest.json")
+            try:
+                with open(manifest_file, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+                for kind, rel_path in manifest["files"]:
+                    base = project_path if kind == "project" else self.repository
+                    destination = os.path.join(base, *rel_path.split("/"))
+                    os.makedirs(os.path.dirname(destination), exist_ok=True)
+                    shutil.copy2(os.path.join(entry, kind, rel_path), destination)
+            except (OSError, ValueError, KeyError):
+                self._count("misses")
+                return None
+            # The mtime of the manifest is the last use for the eviction
+            os.utime(manifest_file)
+            self._count("hits", manifest.get("build_time") or 0)
+            return manifest
+
+    @staticmethod
+    def _entry_size(entry):
         try:
-            update_config_file(config_file, "maven", updates)
-        except Exception as e:
-            print("Fehler beim Aktualisieren der Konfiguration:", e)
-        event.accept()
-
-def main():
-    config = configparser.ConfigParser()
-    config_file = "config.ini"
-    if os.path.exists(config_file):
-        config.read(config_file)
+            with open(os.path.join(entry, "manifest.json"), "r", encoding="utf-8") as f:
+                return json.load(f).get("size", 0)
+        except (OSError, ValueError):
+            return 0
+
+    def entries(self):
+        """Returns (manifest file, last use, size) of all entries."""
+        result = []
+        try:
+            prefixes = [entry.path for entry in os.scandir(self.directory) if entry.is_dir() and len(entry.name) == 2]
+        except OSError:
+            return result
+        for prefix in prefixes:
+            for entry in os.scandir(prefix):
+                if ".tmp" in entry.name:
+                    # Entry that is being stored
+                    continue
+                manifest_file = os.path.join(entry.path, "manifest.json")
+                try:
+                    with open(manifest_file, "r", encoding="utf-8") as f:
+                        size = json.load(f).get("size", 0)
+                    result.append((manifest_file, os.stat(manifest_file).st_mtime, size))
+                except (OSError, ValueError):
+                    pass
+        return result
+
+    def _evict(self):
+        entries = sorted(self.entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        for manifest_file, _, size in entries:
+            if total <= self.max_size:
+                break
+            shutil.rmtree(os.path.dirname(manifest_file), ignore_errors=True)
+            total -= size
+            evicted += 1
+        # The listing is exact, the counted size is corrected with it
+        self._count("evictions", increment=evicted, size=total, absolute_size=True)
+
+    def _stats_file(self):
+        return os.path.join(self.directory, "stats.json")
+
+    def _counters(self):
+        try:
+            with open(self._stats_file(), "r", encoding="utf-8") as f:
+                counters = json.load(f)
+        except (OSError, ValueError):
+            counters = {}
+        for name in ("hits", "misses", "stores", "evictions", "saved_seconds"):
+            counters.setdefault(name, 0)
+        if "size" not in counters:
+            # stats.json of an older version without the size, listed once
+            counters["size"] = sum(size for _, _, size in self.entries())
+            self._save_counters(counters)
+        return counters
+
+    def _save_counters(self, counters):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_file = self._stats_file() + ".tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(counters, f)
+            os.replace(tmp_file, self._stats_file())
+        except OSError as e:
+            print(f"Fehler beim Speichern der Build-Cache-Statistik: {e}")
+
+    def stats(self):
+        """Counters (hits, misses, stores, evictions, saved_seconds) plus entries and size."""
+        stats = self._counters()
+        entries = self.entries()
+        stats["entries"] = len(entries)
+        stats["size"] = sum(size for _, _, size in entries)
+        return stats
+
+    def _count(self, name, saved_seconds=0, increment=1, size=0, absolute_size=False):
+        """Updates the counters in stats.json without listing the entries, returns them."""
+        with self._lock:
+            counters = self._counters()
+            counters[name] += increment
+            counters["saved_seconds"] += saved_seconds
+            counters["size"] = size if absolute_size else max(0, counters["size"] + size)
+            self._save_counters(counters)
+            return counters
+
+    def clear(self):
+        with self._lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+def format_cache_stats(stats):
+    lookups = stats["hits"] + stats["misses"]
+    rate = f"{stats['hits'] / lookups * 100:.0f} %" if lookups else "-"
+    return (f"{stats['entries']} Einträge, {format_bytes(stats['size'])}, {stats['hits']} Treffer, "
+            f"{stats['misses']} Fehlversuche (Trefferquote {rate}), {stats['evictions']} verdrängt, "
+            f"ca. {stats['saved_seconds']:.0f} s Build-Zeit gespart")
+
+class ConsoleBuffer:
+    """
+    Thread-safe buffer between the build worker and the console. The worker only appends
+    lines, the GUI takes the collected text in chunks on a timer. So there is no signal
+    per line across the thread boundary.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chunks = []
+
+    def write(self, text):
+        with self._lock:
+            self._chunks.append(text)
+
+    def take(self):
+        with self._lock:
+            chunks = self._chunks
+            self._chunks = []
+        return "".join(chunks)
+
+ANSI_ESCAPE_REGEX = re.compile(r"\x1b\[[0-9;]*m")
+REACTOR_MODULE_REGEX = re.compile(r"^\[INFO\]\s(.+?)\s*\.{2,}\s*(SUCCESS|FAILURE|SKIPPED)(?:\s*\[\s*([^\]]+?)\s*\])?\s*$")
+BUILD_RESULT_REGEX = re.compile(r"^\[INFO\]\s+BUILD (SUCCESS|FAILURE)\s*$")
+TOTAL_TIME_REGEX = re.compile(r"^\[INFO\]\s+Total time:\s*(.+?)\s*$")
+
+def parse_maven_duration(text):
+    """Converts the durations of Maven ("1.234 s", "01:02 min", "01:02 h") to seconds."""
+    text = (text or "").strip().replace(",", ".")
+    match = re.match(r"^([\d.]+)\s*s$", text)
+    if match:
+        return float(match.group(1))
+    match = re.match(r"^(\d+):(\d+)(?:\.(\d+))?\s*min$", text)
+    if match:
+        return int(match.group(1)) * 60 + int(match.group(2))
+    match = re.match(r"^(\d+):(\d+)\s*h$", text)
+    if match:
+        return int(match.group(1)) * 3600 + int(match.group(2)) * 60
+    return None
+
+class BuildSummary:
+    """
+    Collects the result of a build from the Maven output while it arrives: the durations of
+    the modules from the Reactor Summary, BUILD SUCCESS/FAILURE and the total time.
+    """
+
+    def __init__(self):
+        # List of (module, status, seconds or None)
+        self.modules = []
+        self.result = None
+        self.total_time = None
+        self._in_reactor_summary = False
+
+    def feed(self, line):
+        line = ANSI_ESCAPE_REGEX.sub("", line).rstrip()
+        if not line.startswith("[INFO]"):
+            return
+        if "Reactor Summary" in line:
+            self._in_reactor_summary = True
+            self.modules = []
+            return
+        if self._in_reactor_summary:
+            match = REACTOR_MODULE_REGEX.match(line)
+            if match:
+                # Newer Maven versions append the version to the module name
+                name = re.sub(r"\s+\d[\w.\-]*$", "", match.group(1))
+                self.modules.append((name, match.group(2), parse_maven_duration(match.group(3))))
+                return
+        match = BUILD_RESULT_REGEX.match(line)
+        if match:
+            self.result = match.group(1)
+            self._in_reactor_summary = False
+            return
+        match = TOTAL_TIME_REGEX.match(line)
+        if match:
+            self.total_time = parse_maven_duration(match.group(1))
+
+    def module_durations(self, artifact_id):
+        # A build without reactor only has the total time
+        if self.modules:
+            return self.modules
+        if self.result and self.total_time is not None:
+            return [(artifact_id, "SUCCESS" if self.result == "SUCCESS" else "FAILURE", self.total_time)]
+        return []
+
+TEST_REPORT_DIRECTORIES = (("surefire", "surefire-reports"), ("failsafe", "failsafe-reports"))
+# Directories without test reports, not searched for target folders
+TEST_REPORT_IGNORED_DIRS = ("src", "node_modules") + BUILD_CACHE_IGNORED_DIRS
+
+class TestClassResult:
+    """Result of one test class from a surefire or failsafe report (TEST-*.xml)."""
+    __slots__ = ("plugin", "module", "name", "duration", "tests", "failures", "errors", "skipped")
+    PASSED = "PASSED"
+    FAILED = "FAILED"
+    SKIPPED = "SKIPPED"
+
+    def __init__(self, plugin, module, name, duration=0.0, tests=0, failures=0, errors=0, skipped=0):
+        self.plugin = plugin
+        # Module directory relative to the project ("." for the project itself)
+        self.module = module
+        # Fully qualified class name
+        self.name = name
+        self.duration = duration
+        self.tests = tests
+        self.failures = failures
+        self.errors = errors
+        self.skipped = skipped
+
+    @property
+    def status(self):
+        if self.failures or self.errors:
+            return TestClassResult.FAILED
+        if self.tests and self.skipped >= self.tests:
+            return TestClassResult.SKIPPED
+        return TestClassResult.PASSED
+
+def _report_number(attributes, name, convert=int):
+    # Older surefire versions format the time with a thousands separator ("1,234.5")
+    try:
+        return convert((attributes.get(name) or "0").replace(",", ""))
+    except ValueError:
+        return convert(0)
+
+def read_test_report(path, plugin, module):
+    """Reads the <testsuite> attributes of a TEST-*.xml report, returns a TestClassResult or None."""
+    try:
+        for _, elem in ET.iterparse(path, events=("start",)):
+            if elem.tag.rsplit("}", 1)[-1] != "testsuite":
+                return None
+            attributes = elem.attrib
+            return TestClassResult(plugin, module, attributes.get("name") or os.path.basename(path)[5:-4],
+                                   _report_number(attributes, "time", float), _report_number(attributes, "tests"),
+                                   _report_number(attributes, "failures"), _report_number(attributes, "errors"),
+                                   _report_number(attributes, "skipped"))
+    except (OSError, ET.ParseError):
+        return None
+    return None
+
+def read_test_reports(project_path, since=0):
+    """
+    Returns the TestClassResults of all surefire and failsafe reports below project_path
+    (target/surefire-reports, target/failsafe-reports of the project and its modules)
+    written at or after since, older reports belong to earlier builds.
+    """
+    results = []
+    for directory, dirs, _ in os.walk(project_path):
+        if "target" in dirs:
+            module = os.path.relpath(directory, project_path).replace("\\", "/")
+            for plugin, name in TEST_REPORT_DIRECTORIES:
+                report_dir = os.path.join(directory, "target", name)
+                try:
+                    entries = list(os.scandir(report_dir))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if not (entry.name.startswith("TEST-") and entry.name.endswith(".xml")):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < since:
+                            continue
+                    except OSError:
+                        continue
+                    result = read_test_report(entry.path, plugin, module)
+                    if result:
+                        results.append(result)
+        dirs[:] = [name for name in dirs if name not in TEST_REPORT_IGNORED_DIRS and not name.startswith(".")]
+    return results
+
+def _test_pattern_matches(name, pattern):
+    # Surefire patterns: MyTest, My*Test, com.x.MyTest, com/x/MyTest.java, MyTest#method
+    pattern = pattern.strip().split("#", 1)[0].replace("/", ".")
+    for suffix in (".java", ".class"):
+        if pattern.endswith(suffix):
+            pattern = pattern[:-len(suffix)]
+    return fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(name.rsplit(".", 1)[-1], pattern)
+
+def selected_test_results(command, results):
+    """
+    Leaves out the results of the classes a -Dtest/-Dit.test selection of the command does
+    not run. Parallel runs of the same project (shards) write to the same report directories.
+    """
+    selections = {}
+    for token in command:
+        if token.startswith("-Dtest="):
+            selections["surefire"] = token[len("-Dtest="):].split(",")
+        elif token.startswith("-Dit.test="):
+            selections["failsafe"] = token[len("-Dit.test="):].split(",")
+
+    def selected(result):
+        selection = selections.get(result.plugin)
+        if selection is None:
+            return True
+        includes = [pattern for pattern in selection if pattern.strip() and not pattern.startswith("!")]
+        excludes = [pattern[1:] for pattern in selection if pattern.startswith("!")]
+        if includes and not any(_test_pattern_matches(result.name, pattern) for pattern in includes):
+            return False
+        return not any(_test_pattern_matches(result.name, pattern) for pattern in excludes)
+
+    return [result for result in results if selected(result)]
+
+def format_test_results(results):
+    failed = sum(1 for result in results if result.status == TestClassResult.FAILED)
+    tests = sum(result.tests for result in results)
+    duration = sum(result.duration for result in results)
+    return f"{len(results)} Testklassen, {tests} Tests, {failed} Klassen fehlgeschlagen ({duration:.1f} s)"
+
+class BuildHistory:
+    """SQLite history of the builds with the durations of their modules."""
+    ADDED_COLUMNS = (("command", "TEXT"), ("threads", "INTEGER"), ("peak_rss", "INTEGER"), ("cpu_seconds", "REAL"))
+
+    def __init__(self, filename):
+        self.filename = filename
+        with self._connect() as connection:
+            connection.executescript("""
+                CREATE TABLE IF NOT EXISTS builds (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    project_path TEXT NOT NULL,
+                    artifact_id TEXT,
+                    started_at REAL NOT NULL,
+                    wall_time REAL,
+                    maven_time REAL,
+                    status TEXT,
+                    retcode INTEGER,
+                    command TEXT,
+                    threads INTEGER,
+                    peak_rss INTEGER,
+                    cpu_seconds REAL
+                );
+                CREATE TABLE IF NOT EXISTS modules (
+                    build_id INTEGER NOT NULL REFERENCES builds(id) ON DELETE CASCADE,
+                    name TEXT NOT NULL,
+                    status TEXT,
+                    duration REAL
+                );
+                CREATE TABLE IF NOT EXISTS tests (
+                    build_id INTEGER NOT NULL REFERENCES builds(id) ON DELETE CASCADE,
+                    plugin TEXT,
+                    module TEXT,
+                    class_name TEXT NOT NULL,
+                    duration REAL,
+                    tests INTEGER,
+                    failures INTEGER,
+                    errors INTEGER,
+                    skipped INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS builds_project ON builds(project_path, started_at);
+                CREATE INDEX IF NOT EXISTS modules_build ON modules(build_id);
+                CREATE INDEX IF NOT EXISTS tests_build ON tests(build_id);
+            """)
+            # Columns added in later versions
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(builds)")}
+            for column, column_type in BuildHistory.ADDED_COLUMNS:
+                if column not in columns:
+                    connection.execute(f"ALTER TABLE builds ADD COLUMN {column} {column_type}")
+
+    def _connect(self):
+        # One connection per call, the history is written from several threads
+        return sqlite3.connect(self.filename, timeout=10)
+
+    def record(self, job):
+        """Stores a finished job, builds that did not run (skipped, unchanged, canceled) are ignored."""
+        build = job.build
+        if build is None or build.start_time is None or job.status not in (BuildJob.SUCCESS, BuildJob.FAILED):
+            return
+        if isinstance(job, BatchJob):
+            # The aggregator of a batch is temporary and its projects have no build of their own
+            return
+        started_at = time.time() - job.elapsed()
+        wall_time = (build.end_time or time.monotonic()) - build.start_time
+        resources = build.resources
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO builds (project_path, artifact_id, started_at, wall_time, maven_time, status, retcode, command,"
+                " threads, peak_rss, cpu_seconds) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job.project.path, job.project.artifactId, started_at, wall_time,
+                 build.summary.total_time, job.status, build.retcode, " ".join(build.command),
+                 maven_thread_count(build.command), resources.peak_rss if resources else None,
+                 resources.cpu_seconds if resources else None))
+            connection.executemany(
+                "INSERT INTO modules (build_id, name, status, duration) VALUES (?, ?, ?, ?)",
+                [(cursor.lastrowid, name, status, duration)
+                 for name, status, duration in build.summary.module_durations(job.project.artifactId)])
+            connection.executemany(
+                "INSERT INTO tests (build_id, plugin, module, class_name, duration, tests, failures, errors, skipped)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(cursor.lastrowid, result.plugin, result.module, result.name, result.duration, result.tests,
+                  result.failures, result.errors, result.skipped) for result in build.test_results])
+
+    def slowest_modules(self, limit=20):
+        """Returns (artifactId, module, average, maximum, count) of the successful modules, slowest first."""
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT b.artifact_id, m.name, AVG(m.duration), MAX(m.duration), COUNT(*)"
+                " FROM modules m JOIN builds b ON b.id = m.build_id"
+                " WHERE m.status = 'SUCCESS' AND m.duration IS NOT NULL"
+                " GROUP BY b.project_path, m.name ORDER BY AVG(m.duration) DESC LIMIT ?", (limit,)).fetchall()
+
+    def regressions(self, window=10, factor=1.2):
+        """
+        Returns (artifactId, module, last duration, median, ratio) for all modules whose last
+        successful duration is more than factor times the median of the window builds before.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT b.project_path, b.artifact_id, m.name, m.duration"
+                " FROM modules m JOIN builds b ON b.id = m.build_id"
+                " WHERE m.status = 'SUCCESS' AND m.duration IS NOT NULL"
+                " ORDER BY b.started_at").fetchall()
+        durations = {}
+        for project_path, artifact_id, name, duration in rows:
+            durations.setdefault((project_path, artifact_id, name), []).append(duration)
+        result = []
+        for (_, artifact_id, name), values in durations.items():
+            previous = values[-window - 1:-1]
+            if len(previous) < 3:
+                continue
+            median = statistics.median(previous)
+            if median > 0 and values[-1] > median * factor:
+                result.append((artifact_id, name, values[-1], median, values[-1] / median))
+        result.sort(key=lambda row: row[4], reverse=True)
+        return result
+
+    def test_classes(self, project_path, window=5):
+        """
+        Returns the TestClassResults of a project as of their last run, the duration is the
+        median of the last window runs of the class.
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT t.plugin, t.module, t.class_name, t.duration, t.tests, t.failures, t.errors, t.skipped"
+                " FROM tests t JOIN builds b ON b.id = t.build_id WHERE b.project_path = ?"
+                " ORDER BY b.started_at", (project_path,)).fetchall()
+        results = {}
+        durations = {}
+        for plugin, module, name, duration, tests, failures, errors, skipped in rows:
+            results[(plugin, name)] = TestClassResult(plugin, module, name, duration or 0.0, tests or 0, failures or 0,
+                                                      errors or 0, skipped or 0)
+            durations.setdefault((plugin, name), []).append(duration or 0.0)
+        for key, result in results.items():
+            result.duration = statistics.median(durations[key][-window:])
+        return list(results.values())
+
+    def slowest_tests(self, limit=20):
+        """Returns (artifactId, class name, average, maximum, runs, failed runs) of the test classes, slowest first."""
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT MAX(b.artifact_id), t.class_name, AVG(t.duration), MAX(t.duration), COUNT(*),"
+                " SUM(CASE WHEN t.failures + t.errors > 0 THEN 1 ELSE 0 END)"
+                " FROM tests t JOIN builds b ON b.id = t.build_id"
+                " GROUP BY b.project_path, t.plugin, t.class_name ORDER BY AVG(t.duration) DESC LIMIT ?",
+                (limit,)).fetchall()
+
+    def projects(self):
+        """Returns (project_path, artifactId) of all projects with history."""
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT project_path, MAX(artifact_id) FROM builds GROUP BY project_path ORDER BY MAX(artifact_id)").fetchall()
+
+    def resource_usage(self, project_path, limit=5):
+        """Returns (threads, wall_time, cpu_seconds) of the last successful builds of a project, newest first."""
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT threads, wall_time, cpu_seconds FROM builds"
+                " WHERE project_path = ? AND status = ? AND cpu_seconds IS NOT NULL"
+                " ORDER BY started_at DESC LIMIT ?", (project_path, BuildJob.SUCCESS, limit)).fetchall()
+
+    def trend(self, project_path, limit=30):
+        """Returns (started_at, wall_time, status) of the last builds of a project, oldest first."""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT started_at, wall_time, status FROM builds WHERE project_path = ?"
+                " ORDER BY started_at DESC LIMIT ?", (project_path, limit)).fetchall()
+        return list(reversed(rows))
+
+LOG_LEVEL_REGEX = re.compile(r"^\[(ERROR|WARNING|WARN)\]")
+TEST_FAILURE_REGEX = re.compile(r"<<< (FAILURE|ERROR)!")
+
+def new_log_index():
+    return {"version": 1, "lines": 0, "blocks": [], "errors": [], "warnings": [], "failed_modules": [],
+            "test_failures": []}
+
+def index_log_line(index, number, line):
+    """Adds a line of the build output to the index of its log."""
+    if "[" not in line and "<<<" not in line:
+        return
+    plain = ANSI_ESCAPE_REGEX.sub("", line).rstrip()
+    match = LOG_LEVEL_REGEX.match(plain)
+    if match:
+        index["errors" if match.group(1) == "ERROR" else "warnings"].append(number)
+    if TEST_FAILURE_REGEX.search(plain):
+        index["test_failures"].append([number, plain])
+    if "FAILURE" in plain:
+        match = REACTOR_MODULE_REGEX.match(plain)
+        if match and match.group(2) == "FAILURE":
+            index["failed_modules"].append([number, match.group(1)])
+
+class LogArchiveWriter:
+    """
+    Writes the output of a build to a gzip file made of independent blocks (a gzip file
+    with several members, zcat reads it as usual). Next to it an index (.idx) is stored
+    with the offsets of the blocks, the lines with ERROR/WARNING, the failed modules and
+    the test failures. LogArchive reads single pages of the log with the index.
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, path, compresslevel=6):
+        self.path = path
+        self.compresslevel = compresslevel
+        self._file = open(path, "wb")
+        self._offset = 0
+        self._chunks = []
+        self._chunk_size = 0
+        self._block_first_line = 0
+        self._partial = ""
+        self.line_count = 0
+        self.index = new_log_index()
+
+    def write(self, text):
+        if self._partial:
+            text = self._partial + text
+            self._partial = ""
+        if text.endswith("\n") and text.find("\n") == len(text) - 1:
+            # Usually one line per call
+            self._add_line(text)
+            return
+        lines = text.split("\n")
+        for line in lines[:-1]:
+            self._add_line(line + "\n")
+        # Completed by the next write or by close()
+        self._partial = lines[-1]
+
+    def _add_line(self, line):
+        index_log_line(self.index, self.line_count, line)
+        self.line_count += 1
+        data = line.encode("utf-8", errors="replace")
+        self._chunks.append(data)
+        self._chunk_size += len(data)
+        if self._chunk_size >= self.BLOCK_SIZE:
+            self._flush_block()
+
+    def _flush_block(self):
+        if not self._chunks:
+            return
+        with TRACER.span("log block compress", "build"):
+            data = gzip.compress(b"".join(self._chunks), compresslevel=self.compresslevel)
+        self._file.write(data)
+        line_count = self.line_count - self._block_first_line
+        self.index["blocks"].append([self._offset, len(data), self._block_first_line, line_count])
+        self._offset += len(data)
+        self._block_first_line = self.line_count
+        self._chunks = []
+        self._chunk_size = 0
+
+    def close(self):
+        if self._partial:
+            partial = self._partial
+            self._partial = ""
+            self._add_line(partial + "\n")
+        self._flush_block()
+        self._file.close()
+        self.index["lines"] = self.line_count
+        LogArchive.save_index(self.path, self.index)
+
+class LogArchive:
+    """
+    Reads an archived build log page by page. The file is memory mapped and only the
+    blocks of the requested lines are decompressed, so the first error of a large log
+    is shown without reading the whole file. If the index is missing (e.g. the program
+    was terminated during the build) it is rebuilt once from the file.
+    """
+
+    CACHED_BLOCKS = 4
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.index = self.load_index(path)
+        if self.index is None or self.index.get("version") != 1:
+            self.index = self._rebuild_index()
+            self.save_index(path, self.index)
+        self._first_lines = [block[2] for block in self.index["blocks"]]
+        self._cache = {}
+
+    @staticmethod
+    def index_path(path):
+        return path + ".idx"
+
+    @classmethod
+    def load_index(cls, path):
+        try:
+            with open(cls.index_path(path), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def save_index(cls, path, index):
+        tmp_file = cls.index_path(path) + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp_file, cls.index_path(path))
+
+    def _rebuild_index(self):
+        index = new_log_index()
+        offset = 0
+        while offset < len(self._data):
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            position = offset
+            chunks = []
+            try:
+                while not decompressor.eof and position < len(self._data):
+                    piece = self._data[position:position + 65536]
+                    position += len(piece)
+                    chunks.append(decompressor.decompress(piece))
+            except zlib.error:
+                break
+            if not decompressor.eof:
+                # Incomplete last block of an interrupted build
+                break
+            length = position - offset - len(decompressor.unused_data)
+            first_line = index["lines"]
+            for line in b"".join(chunks).decode("utf-8", errors="replace").split("\n")[:-1]:
+                index_log_line(index, index["lines"], line)
+                index["lines"] += 1
+            index["blocks"].append([offset, length, first_line, index["lines"] - first_line])
+            offset += length
+        return index
+
+    @property
+    def line_count(self):
+        return self.index["lines"]
+
+    def _block_lines(self, number):
+        lines = self._cache.pop(number, None)
+        if lines is None:
+            offset, length = self.index["blocks"][number][:2]
+            # Only \n ends a line, the same as in LogArchiveWriter
+            lines = gzip.decompress(self._data[offset:offset + length]).decode("utf-8", errors="replace").split("\n")[:-1]
+        self._cache[number] = lines
+        while len(self._cache) > self.CACHED_BLOCKS:
+            # The oldest entry comes first
+            del self._cache[next(iter(self._cache))]
+        return lines
+
+    def lines(self, start, count):
+        """Returns the lines start to start + count (without line breaks)."""
+        start = max(0, start)
+        end = min(self.line_count, start + count)
+        result = []
+        block = bisect.bisect_right(self._first_lines, start) - 1
+        while start < end and 0 <= block < len(self._first_lines):
+            first_line = self._first_lines[block]
+            block_lines = self._block_lines(block)
+            result.extend(block_lines[start - first_line:end - first_line])
+            start = first_line + len(block_lines)
+            block += 1
+        return result
+
+    def first_error(self):
+        """Line number of the first ERROR line or failed test, None if there is none."""
+        candidates = self.index["errors"][:1] + [line for line, _ in self.index["test_failures"][:1]]
+        return min(candidates) if candidates else None
+
+    def find(self, text, start=0):
+        """Line number of the next line from start containing text (case-insensitive) or None."""
+        text = text.lower()
+        block = max(0, bisect.bisect_right(self._first_lines, start) - 1)
+        for number in range(block, len(self._first_lines)):
+            first_line = self._first_lines[number]
+            for offset, line in enumerate(self._block_lines(number)):
+                if first_line + offset >= start and text in line.lower():
+                    return first_line + offset
+        return None
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def archived_logs(log_dir):
+    """Returns (path, index or None) of all archived logs in log_dir, newest first."""
+    try:
+        entries = [entry for entry in os.scandir(log_dir) if entry.is_file() and entry.name.endswith(".log.gz")]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    return [(entry.path, LogArchive.load_index(entry.path)) for entry in entries]
+
+class LineReader:
+    """
+    Reads the output of a process in its own thread, so readline() can wait with a timeout
+    and a canceled or stalled build is noticed at once. The pipe is read in blocks of
+    whatever is available and split into lines here, which is faster than one readline
+    per line through the queue. Line breaks are translated like in text mode.
+    """
+
+    def __init__(self, stream, encoding=None):
+        self._stream = stream
+        # Bounded, so a fast process waits for the consumer like with a plain pipe
+        self._queue = queue.Queue(maxsize=4)
+        self._lines = collections.deque()
+        self._eof = False
+        decoder = codecs.getincrementaldecoder(encoding or locale.getpreferredencoding(False))(errors="replace")
+        self._decoder = io.IncrementalNewlineDecoder(decoder, translate=True)
+        self._thread = threading.Thread(target=self._run, name="LineReader", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        pending = ""
+        fd = self._stream.fileno()
+        try:
+            while True:
+                try:
+                    data = os.read(fd, 65536)
+                except OSError:
+                    data = b""
+                text = pending + self._decoder.decode(data, final=not data)
+                lines = text.split("\n")
+                pending = lines.pop()
+                if lines:
+                    self._queue.put([line + "\n" for line in lines])
+                if not data:
+                    if pending:
+                        self._queue.put([pending])
+                    break
+        finally:
+            self._queue.put(None)
+
+    def readline(self, timeout=None):
+        """Returns the next line, "" at the end of the output or None if nothing arrived within timeout."""
+        if self._lines:
+            return self._lines.popleft()
+        if self._eof:
+            return ""
+        try:
+            chunk = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if chunk is None:
+            self._eof = True
+            return ""
+        self._lines.extend(chunk)
+        return self._lines.popleft()
+
+class _WindowsJob:
+    """Job object with all processes of a build, so the whole tree can be terminated."""
+
+    def __init__(self, process):
+        import ctypes
+        self._kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._kernel32.CreateJobObjectW.restype = ctypes.c_void_p
+        self._handle = self._kernel32.CreateJobObjectW(None, None)
+        if not self._handle or not self._kernel32.AssignProcessToJobObject(
+                ctypes.c_void_p(self._handle), ctypes.c_void_p(int(process._handle))):
+            raise OSError(ctypes.get_last_error(), "AssignProcessToJobObject")
+
+    def terminate(self):
+        import ctypes
+        self._kernel32.TerminateJobObject(ctypes.c_void_p(self._handle), 1)
+        self._kernel32.CloseHandle(ctypes.c_void_p(self._handle))
+
+def process_group_options():
+    """Popen arguments that start the process with its children in an own process group."""
+    if os.name == "nt":
+        return {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0) | subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+class ProcessTree:
+    """
+    A process started with process_group_options() and all its children (the JVM of Maven,
+    surefire forks, ...). terminate() first asks them to exit (SIGTERM to the group) and
+    kills the whole group after grace_period seconds. On Windows, where a JVM cannot be
+    asked to exit, the job object (or taskkill /T) ends the tree at once.
+    """
+
+    def __init__(self, process):
+        self.process = process
+        self._job = None
+        if os.name == "nt":
+            try:
+                self._job = _WindowsJob(process)
+            except Exception:
+                # Not possible inside some foreign job objects, taskkill /T is used then
+                self._job = None
+
+    def terminate(self, grace_period=10):
+        if os.name == "nt":
+            self.kill()
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGTERM)
+        except OSError:
+            return
+        # The group is killed even if the leader exits earlier, forks may still be running
+        timer = threading.Timer(grace_period, self.kill)
+        timer.daemon = True
+        timer.start()
+
+    def kill(self):
+        if os.name == "nt":
+            if self._job:
+                self._job.terminate()
+                self._job = None
+            else:
+                subprocess.run(["taskkill", "/T", "/F", "/PID", str(self.process.pid)], capture_output=True,
+                               creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+class ProcessRun:
+    """A running Maven process, the interface all executors return."""
+
+    def __init__(self, process):
+        self.process = process
+        self.tree = ProcessTree(process)
+        self.reader = LineReader(process.stdout)
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def readline(self, timeout=None):
+        return self.reader.readline(timeout)
+
+    def wait(self):
+        retcode = self.process.wait()
+        self.process.stdout.close()
+        return retcode
+
+    def cancel(self, grace_period=10):
+        self.tree.terminate(grace_period)
+
+class ProcessExecutor:
+    """Starts a new Maven process (JVM) for every build."""
+    name = "process"
+
+    def start(self, command, cwd, env=None):
+        process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            **process_group_options()
+        )
+        return ProcessRun(process)
+
+    def describe(self):
+        return "neuer Maven-Prozess"
+
+    def shutdown(self):
+        pass
+
+class MvndExecutor(ProcessExecutor):
+    """Runs the build with the Maven Daemon (mvnd), which keeps its JVMs warm by itself."""
+    name = "mvnd"
+
+    def __init__(self, mvnd_executable):
+        self.mvnd_executable = mvnd_executable
+
+    def start(self, command, cwd, env=None):
+        return super().start([self.mvnd_executable] + list(command[1:]), cwd, env)
+
+    def describe(self):
+        return f"Maven Daemon ({self.mvnd_executable})"
+
+class DaemonRun:
+    """A build running in a warm daemon, see WarmDaemonExecutor for the protocol."""
+
+    def __init__(self, executor, key, daemon):
+        self.executor = executor
+        self.key = key
+        self.daemon = daemon
+        self.retcode = None
+
+    @property
+    def pid(self):
+        # The daemon runs one build at a time, its tree is the build
+        return self.daemon.pid
+
+    def readline(self, timeout=None):
+        if self.retcode is not None:
+            return ""
+        line = self.daemon.readline(timeout)
+        if line is None:
+            return None
+        if line.startswith(WarmDaemonExecutor.EXIT_MARKER):
+            try:
+                self.retcode = int(line[len(WarmDaemonExecutor.EXIT_MARKER):].strip())
+            except ValueError:
+                self.retcode = 1
+            return ""
+        if not line:
+            # The daemon died during the build
+            self.retcode = self.daemon.process.wait() or 1
+        return line
+
+    def wait(self):
+        while self.retcode is None:
+            self.readline()
+        if self.daemon.process.poll() is None:
+            self.executor._release(self.key, self.daemon)
+        return self.retcode
+
+    def cancel(self, grace_period=10):
+        # A canceled daemon is not reused, its output ends when it was terminated
+        self.daemon.cancel(grace_period)
+
+class WarmDaemonExecutor:
+    """
+    Keeps a warm daemon process per JDK (JAVA_HOME) and reuses it for the next builds, so
+    JVM and Maven only start once. daemon_command is started once per JDK and concurrently
+    running build. Protocol: for each build one JSON line {"cwd": ..., "args": [...]} is
+    written to stdin, the daemon writes the output of the build to stdout, followed by the
+    line "@@MBM-EXIT <exit code>". A daemon that exits is replaced by a new one.
+    """
+    name = "daemon"
+    EXIT_MARKER = "@@MBM-EXIT"
+
+    def __init__(self, daemon_command):
+        self.daemon_command = daemon_command
+        self._lock = threading.Lock()
+        # JAVA_HOME -> idle daemon processes
+        self._idle = {}
+        self._closed = False
+
+    def start(self, command, cwd, env=None):
+        key = (env if env is not None else os.environ).get("JAVA_HOME", "")
+        daemon = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle and daemon is None:
+                candidate = idle.pop()
+                if candidate.process.poll() is None:
+                    daemon = candidate
+        if daemon is None:
+            daemon = ProcessRun(subprocess.Popen(
+                self.daemon_command,
+                env=env,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+                **process_group_options()
+            ))
+        request = json.dumps({"cwd": os.path.abspath(cwd), "args": list(command[1:])}) + "\n"
+        daemon.process.stdin.write(request.encode(locale.getpreferredencoding(False)))
+        daemon.process.stdin.flush()
+        return DaemonRun(self, key, daemon)
+
+    def _release(self, key, daemon):
+        with self._lock:
+            if not self._closed:
+                self._idle.setdefault(key, []).append(daemon)
+                return
+        # A build that was still running during shutdown, its daemon is not kept
+        self._stop(daemon)
+
+    def describe(self):
+        return "warmer Daemon (" + " ".join(self.daemon_command) + ")"
+
+    def shutdown(self):
+        with self._lock:
+            daemons = [daemon for idle in self._idle.values() for daemon in idle]
+            self._idle = {}
+            self._closed = True
+        for daemon in daemons:
+            self._stop(daemon)
+
+    @staticmethod
+    def _stop(daemon):
+        try:
+            daemon.process.stdin.close()
+            daemon.process.wait(timeout=5)
+        except Exception:
+            daemon.tree.kill()
+
+class ExecutorRegistry:
+    """
+    Chooses the executor of a project from the [executors] section of the config: the key is
+    the artifactId (or "default"), the value process, mvnd or daemon. If mvnd_executable or
+    daemon_command are not configured, the plain Maven process is used.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.process = ProcessExecutor()
+        self.mvnd = None
+        self.daemon = None
+        mvnd_executable = config.get("maven", "mvnd_executable", fallback="").strip()
+        if mvnd_executable and (os.path.isfile(mvnd_executable) or shutil.which(mvnd_executable)):
+            self.mvnd = MvndExecutor(mvnd_executable)
+        daemon_command = config.get("maven", "daemon_command", fallback="").strip()
+        if daemon_command:
+            self.daemon = WarmDaemonExecutor(daemon_command.split())
+
+    def for_project(self, project):
+        """Returns (executor, note), note explains a fallback to the plain process."""
+        name = self.config.get("executors", project.artifactId,
+                               fallback=self.config.get("executors", "default", fallback="process")).strip().lower()
+        if name == "mvnd":
+            if self.mvnd:
+                return self.mvnd, None
+            return self.process, "mvnd ist nicht konfiguriert oder nicht gefunden (mvnd_executable), verwende mvn"
+        if name == "daemon":
+            if self.daemon:
+                return self.daemon, None
+            return self.process, "Kein daemon_command konfiguriert, verwende mvn"
+        if name != "process":
+            return self.process, f"Unbekannter Executor '{name}', verwende mvn"
+        return self.process, None
+
+    def shutdown(self):
+        for executor in (self.process, self.mvnd, self.daemon):
+            if executor:
+                executor.shutdown()
+
+def _proc_tree_usage(pid):
+    # One pass over /proc: parent of every process, then the tree below pid
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    ticks = os.sysconf("SC_CLK_TCK")
+    stats = {}
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "rb") as f:
+                # The command name in parentheses may contain spaces
+                fields = f.read().rsplit(b")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        child = int(name)
+        stats[child] = fields
+        children.setdefault(int(fields[1]), []).append(child)
+    if pid not in stats:
+        return None
+    rss = 0
+    cpu = 0
+    todo = [pid]
+    while todo:
+        current = todo.pop()
+        fields = stats[current]
+        # utime, stime, cutime, cstime (the children already waited for), rss in pages
+        cpu += int(fields[11]) + int(fields[12]) + int(fields[13]) + int(fields[14])
+        rss += int(fields[21]) * page_size
+        todo.extend(children.get(current, ()))
+    return rss, cpu / ticks
+
+def _psutil_tree_usage(pid):
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    rss = 0
+    cpu = 0.0
+    for process in processes:
+        try:
+            times = process.cpu_times()
+            cpu += times.user + times.system + getattr(times, "children_user", 0) + getattr(times, "children_system", 0)
+            rss += process.memory_info().rss
+        except psutil.Error:
+            pass
+    return rss, cpu
+
+def process_tree_usage(pid):
+    """Returns (RSS in bytes, CPU seconds) of a process and all its children or None if not available."""
+    if os.path.isdir("/proc/self"):
+        return _proc_tree_usage(pid)
+    if psutil is not None:
+        return _psutil_tree_usage(pid)
+    return None
+
+def format_bytes(value):
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+class ResourceSampler:
+    """
+    Samples the process tree of a build (Maven, surefire forks, ...) in its own thread:
+    current and peak RSS, CPU seconds and the average number of busy cores.
+    """
+    interval = 1.0
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.available = True
+        self.peak_rss = 0
+        self.current_rss = 0
+        self.cpu_seconds = 0.0
+        # Busy cores since the last sample
+        self.current_parallelism = 0.0
+        self._baseline = None
+        self._last = None
+        self._start = time.monotonic()
+        self._end = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ResourceSampler", daemon=True)
+
+    def start(self):
+        self.sample()
+        if self.available:
+            self._thread.start()
+        return self
+
+    def sample(self):
+        with TRACER.span("resource sample", "build"):
+            try:
+                usage = process_tree_usage(self.pid)
+            except Exception:
+                usage = None
+        now = time.monotonic()
+        if usage is None:
+            if self._baseline is None:
+                self.available = False
+            self.current_rss = 0
+            return
+        rss, cpu = usage
+        if self._baseline is None:
+            # A warm daemon already used CPU before the build
+            self._baseline = cpu
+        # Exited children only count once their parent waited for them
+        cpu = max(self.cpu_seconds, cpu - self._baseline)
+        if self._last is not None and now > self._last[0]:
+            self.current_parallelism = (cpu - self._last[1]) / (now - self._last[0])
+        self._last = (now, cpu)
+        self.cpu_seconds = cpu
+        self.current_rss = rss
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        """Stops the thread after a last sample."""
+        if self._end is None:
+            self._stop.set()
+            if self._thread.is_alive():
+                self._thread.join()
+            self.sample()
+            self._end = time.monotonic()
+
+    def wall_time(self):
+        return (self._end or time.monotonic()) - self._start
+
+    def parallelism(self):
+        """Average number of busy cores."""
+        wall_time = self.wall_time()
+        return self.cpu_seconds / wall_time if wall_time > 0 else 0.0
+
+    def describe(self):
+        return (f"Spitze {format_bytes(self.peak_rss)} RSS, {self.cpu_seconds:.1f} s CPU, "
+                f"Ø {self.parallelism():.1f} Kerne")
+
+class BuildLimits:
+    """Time limits of a build in seconds, 0 means no limit."""
+    __slots__ = ("build_timeout", "stall_timeout", "grace_period")
+
+    def __init__(self, build_timeout=0, stall_timeout=0, grace_period=10):
+        # Maximum duration of the whole build
+        self.build_timeout = build_timeout
+        # Maximum time without any output
+        self.stall_timeout = stall_timeout
+        # Time the processes get to exit after a cancel before they are killed
+        self.grace_period = grace_period
+
+class MavenBuild:
+    """
+    Runs one Maven command in the project directory. The output is collected in the
+    ConsoleBuffer and written to the log archive. Used by the GUI in a QThread and by the
+    command line directly in a thread.
+    """
+
+    def __init__(self, command, project_path, log_path=None, snapshot_store=None, only_changed=False, executor=None,
+                 env=None, offline_resolver=None, limits=None, build_cache=None):
+        self.command = command
+        self.project_path = project_path
+        # Environment of the build (JAVA_HOME/PATH of the JDK), None inherits the environment
+        self.env = env
+        # Adds -o if everything is in the local repository, None never adds it
+        self.offline_resolver = offline_resolver
+        # The full output is archived in this file, the console only keeps the last lines
+        self.log_path = log_path
+        # The snapshot of the sources is stored after a successful build
+        self.snapshot_store = snapshot_store
+        # Skip the build if the sources did not change since the last successful build
+        self.only_changed = only_changed
+        self.up_to_date = False
+        # Restores the outputs of an earlier build with the same inputs, None disables it
+        self.build_cache = build_cache
+        self.from_cache = False
+        # Starts the Maven process, a plain new process by default
+        self.executor = executor or ProcessExecutor()
+        self.limits = limits or BuildLimits()
+        # Message if the build was stopped by a time limit
+        self.timed_out = None
+        self.console = ConsoleBuffer()
+        # Durations and result parsed from the output
+        self.summary = BuildSummary()
+        # Assigns the output lines to the projects of a batch build (BatchOutputSplitter)
+        self.splitter = None
+        # TestClassResults of the surefire/failsafe reports written by the build
+        self.test_results = []
+        self.process = None
+        # ResourceSampler of the process tree, None until the process runs or if not available
+        self.resources = None
+        self.retcode = None
+        self.line_count = 0
+        self.start_time = None
+        self.end_time = None
+        self._isCanceled = False
+
+    def is_canceled(self):
+        return self._isCanceled
+
+    def lines_per_second(self):
+        if self.start_time is None:
+            return 0.0
+        elapsed = (self.end_time or time.monotonic()) - self.start_time
+        return self.line_count / elapsed if elapsed > 0 else 0.0
+
+    def _output(self, text, log_file=None):
+        self.console.write(text)
+        if log_file:
+            log_file.write(text)
+
+    def _exceeded_limit(self, last_output):
+        now = time.monotonic()
+        if self.limits.build_timeout and now - self.start_time > self.limits.build_timeout:
+            return f"Zeitlimit überschritten ({self.limits.build_timeout / 60:g} min)"
+        if self.limits.stall_timeout and now - last_output > self.limits.stall_timeout:
+            return f"Keine Ausgabe seit {self.limits.stall_timeout / 60:g} min"
+        return None
+
+    def _restore_from_cache(self, log_file):
+        """Returns the cache key, sets from_cache if the outputs were restored."""
+        try:
+            start = time.monotonic()
+            cache_key = self.build_cache.key(self.project_path, self.command, self.env)
+            manifest = self.build_cache.restore(cache_key, self.project_path)
+        except Exception as e:
+            self._output(f"Build-Cache nicht verfügbar: {e}\n", log_file)
+            return None
+        if manifest:
+            self.from_cache = True
+            self.retcode = 0
+            self._output(f"Unveränderte Eingaben, {len(manifest['files'])} Dateien aus dem Build-Cache wiederhergestellt "
+                         f"in {time.monotonic() - start:.1f} s (Build dauerte {manifest.get('build_time', 0):.0f} s).\n",
+                         log_file)
+        return cache_key
+
+    def _store_in_cache(self, cache_key, started_at, log_file):
+        try:
+            count = self.build_cache.store(cache_key, self.project_path, self.command, started_at,
+                                           self.end_time - self.start_time)
+        except Exception as e:
+            self._output(f"Fehler beim Speichern im Build-Cache: {e}\n", log_file)
+            return
+        if count:
+            self._output(f"{count} Dateien im Build-Cache gespeichert.\n", log_file)
+
+    def _read_test_reports(self, started_at, log_file):
+        try:
+            self.test_results = selected_test_results(self.command, read_test_reports(self.project_path, started_at))
+        except Exception as e:
+            self._output(f"Test-Reports konnten nicht gelesen werden: {e}\n", log_file)
+            return
+        if self.test_results:
+            self._output(f"Tests: {format_test_results(self.test_results)}\n", log_file)
+
+    def _check_offline(self, log_file):
+        try:
+            missing = self.offline_resolver.missing(self.project_path)
+        except Exception as e:
+            self._output(f"Lokales Repository konnte nicht geprüft werden: {e}\n", log_file)
+            return
+        if not missing:
+            self.command = self.command + ["-o"]
+            self._output("Alle Abhängigkeiten und Plugins sind lokal vorhanden, Build offline (-o).\n", log_file)
+            return
+        shown = ", ".join(missing[:20])
+        if len(missing) > 20:
+            shown += f" und {len(missing) - 20} weitere"
+        self._output(f"Nicht im lokalen Repository, Build online: {shown}\n", log_file)
+
+    def run(self):
+        log_file = None
+        try:
+            if self.log_path:
+                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                log_file = LogArchiveWriter(self.log_path)
+                log_file.write("Ausführung: " + " ".join(self.command) + "\n")
+            snapshot = None
+            # A build of single modules does not make the whole project up to date
+            if self.snapshot_store and not is_partial_command(self.command):
+                # Taken before the build, changes during the build are detected next time
+                previous = self.snapshot_store.load(self.project_path)
+                snapshot = self.snapshot_store.take(self.project_path, previous)
+                if self.only_changed and self.snapshot_store.unchanged(previous, snapshot):
+                    if snapshot != previous:
+                        # Only touched files, remember the new mtimes so they are not hashed again
+                        self.snapshot_store.save(self.project_path, snapshot)
+                    self.up_to_date = True
+                    self.retcode = 0
+                    self._output("Keine Änderungen seit dem letzten erfolgreichen Build, Build übersprungen.\n", log_file)
+                    return
+            cache_key = None
+            if self.build_cache and BuildCache.accepts(self.command):
+                cache_key = self._restore_from_cache(log_file)
+                if self.from_cache:
+                    if snapshot is not None:
+                        self.snapshot_store.save(self.project_path, snapshot)
+                    return
+            if self.offline_resolver and not is_offline_command(self.command):
+                self._check_offline(log_file)
+            if self._isCanceled:
+                self._output("Build abgebrochen.\n", log_file)
+                return
+            started_at = time.time()
+            self.start_time = time.monotonic()
+            with TRACER.span("process spawn", "build", executor=self.executor.name):
+                self.process = self.executor.start(self.command, self.project_path, self.env)
+            if self._isCanceled:
+                # Canceled while the process was started
+                self.process.cancel(self.limits.grace_period)
+            sampler = ResourceSampler(self.process.pid).start()
+            if sampler.available:
+                self.resources = sampler
+            last_output = self.start_time
+            while True:
+                # Waits at most a moment, so cancel and the time limits take effect at once
+                line = self.process.readline(0.2)
+                if line is None:
+                    if self._isCanceled:
+                        break
+                    self.timed_out = self._exceeded_limit(last_output)
+                    if self.timed_out:
+                        self.process.cancel(self.limits.grace_period)
+                        break
+                    continue
+                if not line:
+                    break
+                last_output = time.monotonic()
+                self.line_count += 1
+                TRACER.count("lines emitted")
+                self.summary.feed(line)
+                if self.splitter:
+                    self.splitter.feed(line)
+                self._output(line, log_file)
+                if self._isCanceled:
+                    break
+            if self.resources:
+                # Before the children are reaped with the process
+                self.resources.stop()
+            self.retcode = self.process.wait()
+            self.end_time = time.monotonic()
+            if self.resources:
+                self._output(f"Ressourcen: {self.resources.describe()}\n", log_file)
+            if not self._isCanceled:
+                with TRACER.span("read test reports", "build"):
+                    self._read_test_reports(started_at, log_file)
+            summary = f"({self.line_count} Zeilen, {self.lines_per_second():.0f} Zeilen/s)"
+            if self._isCanceled:
+                self._output(f"Build abgebrochen. {summary}\n", log_file)
+            elif self.timed_out:
+                self._output(f"Build abgebrochen: {self.timed_out}. {summary}\n", log_file)
+            elif self.retcode == 0:
+                self._output(f"Build erfolgreich abgeschlossen. {summary}\n", log_file)
+            else:
+                self._output(f"Build fehlgeschlagen (Exit-Code {self.retcode}). {summary}\n", log_file)
+            if not self._isCanceled and not self.timed_out and self.retcode == 0:
+                if snapshot is not None:
+                    self.snapshot_store.save(self.project_path, snapshot)
+                if cache_key:
+                    self._store_in_cache(cache_key, started_at, log_file)
+        except Exception as e:
+            self._output(f"Fehler beim Build: {e}\n", log_file)
+        finally:
+            if log_file:
+                log_file.close()
+
+    def cancel(self):
+        """Terminates the whole process tree, returns at once (the grace period runs in the background)."""
+        self._isCanceled = True
+        if self.process:
+            try:
+                self.process.cancel(self.limits.grace_period)
+            except Exception:
+                pass
+
+def maven_thread_count(command, cpu_count=None):
+    """Returns the number of threads a Maven command uses with its -T option (1 without -T)."""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    value = None
+    for i, token in enumerate(command):
+        if token == "-T" and i + 1 < len(command):
+            value = command[i + 1]
+        elif token.startswith("-T") and len(token) > 2:
+            value = token[2:]
+        elif token.startswith("--threads="):
+            value = token.split("=", 1)[1]
+    if not value:
+        return 1
+    try:
+        if value.upper().endswith("C"):
+            return max(1, int(float(value[:-1]) * cpu_count))
+        return max(1, int(value))
+    except ValueError:
+        return 1
+
+def with_thread_count(command, threads):
+    """Returns the command with -T threads instead of its own -T option."""
+    result = []
+    skip = False
+    for i, token in enumerate(command):
+        if skip:
+            skip = False
+        elif token == "-T" and i + 1 < len(command):
+            skip = True
+        elif not (token.startswith("-T") and len(token) > 2) and not token.startswith("--threads="):
+            result.append(token)
+    return result + ["-T", str(threads)]
+
+def suggest_thread_count(builds, max_threads):
+    """
+    Suggests a -T value from (threads, wall time, CPU seconds) of the last builds of a
+    project, newest first: a build that kept its threads busy gets one more, otherwise as
+    many as it used at most. Never more than max_threads, None without history.
+    """
+    builds = [(threads, cpu_seconds / wall_time) for threads, wall_time, cpu_seconds in builds
+              if threads and wall_time and cpu_seconds is not None]
+    if not builds:
+        return None
+    threads, parallelism = builds[0]
+    if parallelism >= threads * 0.9:
+        suggestion = threads + 1
+    else:
+        suggestion = math.ceil(max(parallelism for _, parallelism in builds))
+    return max(1, min(max_threads, suggestion))
+
+def default_parallel_builds(command, cpu_count=None):
+    # As many builds as cores are available for the -T value of a single build
+    cpu_count = cpu_count or os.cpu_count() or 1
+    return max(1, cpu_count // maven_thread_count(command, cpu_count))
+
+TEST_MODES = ("all", "failed", "failed_first", "shards")
+# The shards only run surefire on the classes compiled before, so the parallel runs
+# never write to target/classes of the same project at the same time
+TEST_SHARD_PREPARE_GOALS = ("test-compile",)
+TEST_SHARD_GOALS = ("surefire:test",)
+# Goals the shards cover, for any other goal (package, install, ...) the selected goals run
+# once more with -DskipTests after the shards succeeded
+TEST_SHARD_COVERED_GOALS = ("clean", "validate", "initialize", "generate-sources", "process-sources",
+                            "generate-resources", "process-resources", "compile", "process-classes",
+                            "generate-test-sources", "process-test-sources", "generate-test-resources",
+                            "process-test-resources", "test-compile", "process-test-classes", "test")
+# -Dtest pattern without a matching class, surefire runs no tests if only failsafe tests are selected
+NO_TEST_PATTERN = "MavenBuildManagerNoTest"
+
+def command_goals(command):
+    """The goals after the executable (as build_command puts them)."""
+    position = 1
+    while position < len(command) and not command[position].startswith("-"):
+        position += 1
+    return command[1:position]
+
+def with_goals(command, goals):
+    """Replaces the goals after the executable (as build_command puts them) by goals."""
+    return command[:1] + list(goals) + command[1 + len(command_goals(command)):]
+
+def test_selection_options(tests):
+    """Maven options that only run the given test classes (TestClassResults) with surefire and failsafe."""
+    unit = [test.name for test in tests if test.plugin == "surefire"]
+    integration = [test.name for test in tests if test.plugin == "failsafe"]
+    options = ["-Dtest=" + ",".join(unit or [NO_TEST_PATTERN]), "-Dsurefire.failIfNoSpecifiedTests=false"]
+    if integration:
+        options += ["-Dit.test=" + ",".join(integration), "-Dit.failIfNoSpecifiedTests=false"]
+    else:
+        options.append("-DskipITs")
+    return options
+
+def balanced_shards(tests, count):
+    """
+    Splits test classes into at most count shards of about the same duration, the longest
+    class always goes to the shard with the least duration so far. Returns lists of tests.
+    """
+    shards = [[] for _ in range(max(1, min(count, len(tests))))]
+    totals = [0.0] * len(shards)
+    for test in sorted(tests, key=lambda test: test.duration, reverse=True):
+        index = totals.index(min(totals))
+        shards[index].append(test)
+        totals[index] += test.duration
+    return shards
+
+def test_run_plan(command, mode, tests, shards=2):
+    """
+    Splits a build into the Maven runs of a test mode (TEST_MODES), tests are the
+    TestClassResults of the last builds (BuildHistory.test_classes). Returns (runs, note),
+    runs is a list of (label, command, indexes of the runs that have to succeed first),
+    label is None for the build as selected.
+    """
+    if mode in ("failed", "failed_first"):
+        failed = [test for test in tests if test.status == TestClassResult.FAILED]
+        if not failed:
+            return [(None, command, [])], "Keine fehlgeschlagenen Tests in der Historie, alle Tests werden ausgeführt"
+        run = (f"{len(failed)} fehlgeschlagene Testklassen", command + test_selection_options(failed), [])
+        if mode == "failed":
+            return [run], None
+        # The full build only starts if the failed tests pass now
+        return [run, (None, command, [0])], None
+    if mode == "shards":
+        unit = [test for test in tests if test.plugin == "surefire"]
+        if shards < 2:
+            return [(None, command, [])], "Nur ein Shard (test_shards bzw. max_parallel_builds), alle Tests werden ausgeführt"
+        if len(unit) < 2:
+            return [(None, command, [])], "Zu wenige Testklassen in der Historie für Shards, alle Tests werden ausgeführt"
+        groups = balanced_shards(unit, shards)
+        totals = [sum(test.duration for test in group) for group in groups]
+        # The shard with the least work also runs the classes without history by excluding the other shards
+        rest = totals.index(min(totals))
+        goals = command_goals(command)
+        # clean runs before the compilation, not after the shards
+        prepare_goals = (["clean"] if "clean" in goals else []) + list(TEST_SHARD_PREPARE_GOALS)
+        runs = [("Testklassen kompilieren", with_goals(command, prepare_goals), [])]
+        for index, group in enumerate(groups):
+            if index == rest:
+                selection = ",".join("!" + test.name for other in groups if other is not group for test in other)
+            else:
+                selection = ",".join(test.name for test in group)
+            runs.append((f"Shard {index + 1}/{len(groups)}, ca. {totals[index]:.0f} s",
+                         with_goals(command, TEST_SHARD_GOALS) + ["-Dtest=" + selection, "-Dsurefire.failIfNoSpecifiedTests=false"],
+                         [0]))
+        remaining = [goal for goal in goals if goal != "clean"]
+        if any(goal not in TEST_SHARD_COVERED_GOALS for goal in remaining):
+            # The shards do not package or install anything, later builds need the artifacts
+            runs.append((" ".join(remaining) + " ohne Tests", with_goals(command, remaining) + ["-DskipTests"],
+                         list(range(1, len(runs)))))
+            return runs, ("Nach den Shards läuft " + " ".join(remaining) + " mit -DskipTests,"
+                          " Integrationstests (failsafe) laufen nicht mit")
+        return runs, "Integrationstests (failsafe) laufen in den Shards nicht mit"
+    return [(None, command, [])], None
+
+def final_runs(runs):
+    """Indexes of the runs of a test_run_plan no other run waits for, the project is built when they are done."""
+    waited_for = {index for _, _, dependencies in runs for index in dependencies}
+    return [index for index in range(len(runs)) if index not in waited_for]
+
+class DependencyGraph:
+    """
+    Dependency graph between the discovered projects, built from the coordinates of their
+    <dependencies> and <parent> and of the <dependencies> of their modules. A dependency on
+    a module counts as a dependency on the project it belongs to. Dependencies on projects
+    outside the workspace are ignored.
+    """
+
+    def __init__(self, projects):
+        self.projects = {project.path: project for project in projects}
+        by_coordinates = {}
+        for project in projects:
+            for module in project.all_modules():
+                if module.groupId:
+                    by_coordinates.setdefault((module.groupId, module.artifactId), project.path)
+        # A root project wins over a module with the same coordinates
+        by_coordinates.update((project.coordinates(), project.path) for project in projects)
+        # path -> set of paths the project depends on (upstream) / that depend on it (downstream)
+        self.upstream_edges = {path: set() for path in self.projects}
+        self.downstream_edges = {path: set() for path in self.projects}
+        for project in projects:
+            references = list(project.dependencies)
+            for module in project.all_modules():
+                references.extend(module.dependencies)
+            if project.parent:
+                references.append(project.parent[:2])
+            for coordinates in references:
+                target = by_coordinates.get(tuple(coordinates))
+                if target and target != project.path:
+                    self.upstream_edges[project.path].add(target)
+                    self.downstream_edges[target].add(project.path)
+
+    def _closure(self, paths, edges):
+        result = set()
+        pending = [path for path in paths if path in self.projects]
+        while pending:
+            path = pending.pop()
+            if path in result:
+                continue
+            result.add(path)
+            pending.extend(edges[path] - result)
+        return result
+
+    def with_upstream(self, paths):
+        """The given projects and all projects they (transitively) depend on."""
+        return self._closure(paths, self.upstream_edges)
+
+    def with_downstream(self, paths):
+        """The given projects and all projects that (transitively) depend on them."""
+        return self._closure(paths, self.downstream_edges)
+
+    def build_order(self, paths):
+        """
+        Returns the projects of paths in topological order (upstream first) together with
+        the dependencies of each project inside paths. Raises ValueError on a cycle.
+        """
+        paths = set(paths)
+        dependencies = {path: self.upstream_edges[path] & paths for path in paths}
+        remaining = {path: len(deps) for path, deps in dependencies.items()}
+        ready = sorted((path for path, count in remaining.items() if count == 0),
+                       key=lambda path: self.projects[path].artifactId)
+        order = []
+        while ready:
+            path = ready.pop(0)
+            order.append(path)
+            for dependent in sorted(self.downstream_edges[path] & paths, key=lambda p: self.projects[p].artifactId):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(paths):
+            cycle = sorted(self.projects[path].artifactId for path in paths if path not in order)
+            raise ValueError("Zyklische Abhängigkeit zwischen: " + ", ".join(cycle))
+        return [(self.projects[path], dependencies[path]) for path in order]
+
+class BuildJob:
+    WAITING = "Wartend"
+    RUNNING = "Läuft"
+    SUCCESS = "Erfolgreich"
+    FAILED = "Fehlgeschlagen"
+    CANCELED = "Abgebrochen"
+    SKIPPED = "Übersprungen"
+    UP_TO_DATE = "Unverändert"
+    FROM_CACHE = "Aus dem Cache"
+
+    def __init__(self, project, command, log_path=None, depends_on=None, only_changed=False, executor=None, env=None,
+                 label=None):
+        self.project = project
+        self.command = command
+        # Run of a test mode (e.g. "Shard 1/2"), None for a normal build
+        self.label = label
+        # BatchJob that builds the project in its reactor, None for a build of its own
+        self.batch = None
+        self.log_path = log_path
+        self.only_changed = only_changed
+        self.executor = executor
+        self.env = env
+        # Jobs that have to finish successfully before this job may start
+        self.depends_on = list(depends_on or [])
+        self.status = BuildJob.WAITING
+        # MavenBuild of the job, created when the job starts
+        self.build = None
+        # Thread running the build (QThread in the GUI)
+        self.worker = None
+        self.start_time = None
+        self.end_time = None
+
+    def start(self, snapshot_store=None, offline_resolver=None, limits=None, build_cache=None):
+        self.build = MavenBuild(self.command, self.project.path, self.log_path, snapshot_store, self.only_changed,
+                                self.executor, self.env, offline_resolver, limits, build_cache)
+        self.status = BuildJob.RUNNING
+        self.start_time = time.monotonic()
+        return self.build
+
+    def finish(self):
+        self.end_time = time.monotonic()
+        if self.build.is_canceled():
+            self.status = BuildJob.CANCELED
+        elif self.build.up_to_date:
+            self.status = BuildJob.UP_TO_DATE
+        elif self.build.from_cache:
+            self.status = BuildJob.FROM_CACHE
+        elif self.build.retcode == 0 and not self.build.timed_out:
+            self.status = BuildJob.SUCCESS
+        else:
+            self.status = BuildJob.FAILED
+
+    def name(self):
+        return f"{self.project.artifactId} ({self.label})" if self.label else self.project.artifactId
+
+    def elapsed(self):
+        if self.start_time is None:
+            return 0.0
+        return (self.end_time or time.monotonic()) - self.start_time
+
+    def is_done(self):
+        return self.status in (BuildJob.SUCCESS, BuildJob.FAILED, BuildJob.CANCELED, BuildJob.SKIPPED, BuildJob.UP_TO_DATE,
+                               BuildJob.FROM_CACHE)
+
+    def is_successful(self):
+        return self.status in (BuildJob.SUCCESS, BuildJob.UP_TO_DATE, BuildJob.FROM_CACHE)
+
+def take_ready_job(jobs):
+    """
+    Removes and returns the first job of jobs whose dependencies were all successful.
+    Jobs with a failed, canceled or skipped dependency are removed and marked as skipped.
+    Returns (job or None, list of skipped jobs).
+    """
+    skipped = []
+    changed = True
+    while changed:
+        changed = False
+        for job in list(jobs):
+            if any(dep.status in (BuildJob.FAILED, BuildJob.CANCELED, BuildJob.SKIPPED) for dep in job.depends_on):
+                jobs.remove(job)
+                job.status = BuildJob.SKIPPED
+                skipped.append(job)
+                # Dependents of the skipped job are checked again
+                changed = True
+                break
+            if all(dep.is_successful() for dep in job.depends_on):
+                jobs.remove(job)
+                return job, skipped
+    return None, skipped
+
+REACTOR_PROJECT_REGEX = re.compile(r"^\[INFO\] -+< ([^:\s]+):(\S+) >-+$")
+REACTOR_BUILDING_REGEX = re.compile(r"^\[INFO\] Building (.+?) \S+\s+\[\d+/\d+\]$")
+MOJO_EXECUTION_REGEX = re.compile(r"^\[INFO\] --- .* @ (\S+) ---$")
+FAILED_GOAL_REGEX = re.compile(r"Failed to execute goal .* on project ([^:\s]+):")
+
+def write_batch_pom(directory, projects):
+    """
+    Writes an aggregator pom.xml to directory whose <modules> are the root projects, so
+    Maven builds them in one reactor. Raises ValueError if the projects cannot be built
+    in one reactor.
+    """
+    owners = {}
+    for project in projects:
+        for coordinates in [project.coordinates()] + [(module.groupId, module.artifactId) for module in project.all_modules()]:
+            # Maven refuses a reactor with the same groupId:artifactId twice
+            if coordinates[0] and owners.setdefault(coordinates, project.path) != project.path:
+                raise ValueError(f"{coordinates[0]}:{coordinates[1]} ist in {owners[coordinates]} und {project.path} enthalten")
+    root = ET.Element("project", xmlns="http://maven.apache.org/POM/4.0.0")
+    for tag, text in (("modelVersion", "4.0.0"), ("groupId", "maven-build-manager"), ("artifactId", "batch"),
+                      ("version", "1"), ("packaging", "pom")):
+        ET.SubElement(root, tag).text = text
+    # The aggregator itself is never installed or deployed, the properties are not inherited by the projects
+    properties = ET.SubElement(root, "properties")
+    ET.SubElement(properties, "maven.install.skip").text = "true"
+    ET.SubElement(properties, "maven.deploy.skip").text = "true"
+    modules = ET.SubElement(root, "modules")
+    for project in projects:
+        try:
+            # Maven only accepts module paths relative to the aggregator
+            ET.SubElement(modules, "module").text = os.path.relpath(project.path, directory).replace("\\", "/")
+        except ValueError:
+            raise ValueError(f"{project.path} liegt nicht auf demselben Laufwerk wie {directory}")
+    ET.ElementTree(root).write(os.path.join(directory, "pom.xml"), encoding="UTF-8", xml_declaration=True)
+
+class BatchOutputSplitter:
+    """
+    Assigns the output of a reactor build of several root projects to the projects. The
+    reactor headers ("--< groupId:artifactId >--") and the mojo lines ("--- ... @ artifactId
+    ---") name the module, all lines up to the next one belong to its project. With -T the
+    output of parallel modules is interleaved, single lines may land at the wrong project.
+    """
+
+    def __init__(self, projects):
+        self.consoles = {project.path: ConsoleBuffer() for project in projects}
+        # Project path -> LogArchiveWriter of the project, see open_logs
+        self.logs = {}
+        self._by_coordinates = {}
+        # artifactId -> project path, None if several projects have a module with this artifactId
+        self._by_artifact = {}
+        for project in projects:
+            for group_id, artifact_id in [project.coordinates()] + [(module.groupId, module.artifactId)
+                                                                     for module in project.all_modules()]:
+                self._by_coordinates[(group_id, artifact_id)] = project.path
+                if self._by_artifact.setdefault(artifact_id, project.path) != project.path:
+                    self._by_artifact[artifact_id] = None
+        # Module names of the Reactor Summary (<name> or artifactId) -> project path
+        self._by_name = {}
+        # Project paths with a failed goal
+        self.failed = set()
+        self._current = None
+        self._header = None
+
+    def _owner(self, artifact_id):
+        return self._by_artifact.get(artifact_id) or self._current
+
+    def feed(self, line):
+        text = ANSI_ESCAPE_REGEX.sub("", line).rstrip()
+        match = REACTOR_PROJECT_REGEX.match(text)
+        if match:
+            self._current = self._by_coordinates.get(match.groups()) or self._owner(match.group(2))
+            self._header = self._current
+        elif "Reactor Summary" in text:
+            self._current = None
+        else:
+            match = REACTOR_BUILDING_REGEX.match(text)
+            if match and self._header:
+                self._by_name[match.group(1)] = self._header
+                self._header = None
+            match = MOJO_EXECUTION_REGEX.match(text)
+            if match:
+                self._current = self._owner(match.group(1))
+            match = FAILED_GOAL_REGEX.search(text)
+            if match:
+                owner = self._by_artifact.get(match.group(1))
+                if owner:
+                    self.failed.add(owner)
+                    # The error lines after the Reactor Summary also belong to the failed project
+                    self._current = owner
+        if self._current:
+            self.consoles[self._current].write(line)
+            log_file = self.logs.get(self._current)
+            if log_file:
+                log_file.write(line)
+
+    def open_logs(self, log_paths, header):
+        """Archives the output of each project in its own log ({project path: log path}), header is the first line."""
+        for path, log_path in log_paths.items():
+            try:
+                os.makedirs(os.path.dirname(log_path), exist_ok=True)
+                self.logs[path] = LogArchiveWriter(log_path)
+                self.logs[path].write(header)
+            except OSError as e:
+                print(f"Log {log_path} kann nicht geschrieben werden: {e}")
+
+    def close_logs(self, statuses):
+        for path, log_file in self.logs.items():
+            log_file.write(f"Status im Batch-Build: {statuses[path]}\n")
+            log_file.close()
+        self.logs = {}
+
+    def statuses(self, summary, batch_status):
+        """Returns the BuildJob status of each project path from the Reactor Summary and the failed goals."""
+        found = {}
+        for name, status, _ in summary.modules:
+            owner = self._by_name.get(name) or self._by_artifact.get(name)
+            if owner:
+                found.setdefault(owner, []).append(status)
+        result = {}
+        for path in self.consoles:
+            statuses = found.get(path, [])
+            if path in self.failed or "FAILURE" in statuses:
+                result[path] = BuildJob.FAILED
+            elif "SKIPPED" in statuses:
+                result[path] = BuildJob.SKIPPED
+            elif statuses:
+                result[path] = BuildJob.SUCCESS
+            else:
+                # No Reactor Summary (canceled, Maven did not start the reactor)
+                result[path] = batch_status
+        return result
+
+class BatchJob(BuildJob):
+    """
+    Builds several root projects in one Maven invocation through a generated aggregator
+    pom, so the JVM, the plugins and the resolved repository metadata are shared. members
+    holds a BuildJob per project that gets the output and the status of its project, the
+    output of a member is also archived in its own log (member_log_paths by project path).
+    """
+
+    def __init__(self, projects, command, log_path=None, executor=None, env=None, member_log_paths=None):
+        os.makedirs(BATCH_DIRECTORY, exist_ok=True)
+        directory = tempfile.mkdtemp(prefix="batch-", dir=BATCH_DIRECTORY)
+        try:
+            write_batch_pom(directory, projects)
+        except Exception:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+        project = MavenProject(directory, read_pom=False)
+        project.artifactId = f"Batch ({len(projects)} Projekte)"
+        super().__init__(project, command, log_path, executor=executor, env=env)
+        self.splitter = BatchOutputSplitter(projects)
+        member_log_paths = member_log_paths or {}
+        self.members = [BuildJob(member, command, member_log_paths.get(member.path)) for member in projects]
+        for member in self.members:
+            member.batch = self
+
+    def start(self, snapshot_store=None, offline_resolver=None, limits=None, build_cache=None):
+        # The generated aggregator has neither a snapshot nor cache entries
+        build = super().start(None, offline_resolver, limits, None)
+        build.splitter = self.splitter
+        self.splitter.open_logs({member.project.path: member.log_path for member in self.members if member.log_path},
+                                f"Ausführung im Batch-Build ({self.log_path}): " + " ".join(self.command) + "\n")
+        for member in self.members:
+            member.status = BuildJob.RUNNING
+            member.start_time = self.start_time
+        return build
+
+    def member_output(self, member):
+        return self.splitter.consoles[member.project.path].take()
+
+    def update_members(self):
+        """Sets the status of the projects once the batch is done (also if it never ran) and removes the aggregator."""
+        if self.build is None:
+            statuses = {member.project.path: self.status for member in self.members}
+        else:
+            statuses = self.splitter.statuses(self.build.summary, self.status)
+        for member in self.members:
+            member.status = statuses[member.project.path]
+            member.end_time = self.end_time
+        self.splitter.close_logs(statuses)
+        shutil.rmtree(self.project.path, ignore_errors=True)
+
+def batch_command(config, command):
+    """The command of a batch build: with -T (batch_threads) unless it has one, and --fail-at-end."""
+    if not any(token.startswith(("-T", "--threads")) for token in command):
+        command = command + ["-T", config.get("maven", "batch_threads", fallback="1C").strip() or "1C"]
+    # Independent projects are still built when one of them fails
+    if not any(token in ("-fae", "--fail-at-end", "-ff", "--fail-fast", "-fn", "--fail-never") for token in command):
+        command = command + ["-fae"]
+    return command
+
+def is_below(path, directory):
+    """True if path is directory itself or below it."""
+    return path == directory or path.startswith(directory.rstrip("/\\") + os.sep)
+
+class ProjectDiscovery:
+    """
+    Finds the root projects below base_dir: the search stops at the first pom.xml without
+    parent tag, poms with a parent tag are skipped. Unchanged poms are taken from the index.
+    The callbacks are called from the scanner threads: on_found(list of MavenProject) in
+    batches, on_updated(MavenProject) and on_removed(path).
+    """
+    
+    def __init__(self, base_dir, index=None, on_found=None, on_updated=None, on_removed=None):
+        self.base_dir = base_dir
+        # Without an index every pom is parsed and reported as found
+        self.index = index
+        self.on_found = on_found or (lambda projects: None)
+        self.on_updated = on_updated or (lambda project: None)
+        self.on_removed = on_removed or (lambda path: None)
+        # Seconds between two batches of found projects
+        self.batch_interval = 0.1
+
+    def _load_scan_config(self):
+        # Parsed and split by the ConfigService only when the file changed
+        config = load_config()
+        return list(config.exclude_dirs()), config.scan_threads()
+
+    def _parse_pom(self, root_dir, pom_path):
+        # Returns the project or None if the pom has a parent tag
+        with TRACER.span("read_pom", "scan"):
+            project = read_pom(pom_path, stop_at_parent=True, read_dependencies=True)
+        TRACER.count("poms parsed")
+        
+        # Do not use projects with parent tag
+        if project.parent is not None:
+            return None
+        with TRACER.span("read_module_tree", "scan"):
+            project.modules = read_module_tree(project.path)
+        return project
+
+    def _handle_pom(self, root_dir, pom_path, stat):
+        # Called from the scanner threads, returns True if the subfolders should not be searched
+        with self._lock:
+            self._seen.add(pom_path)
+            entry = self.index.lookup(pom_path, stat) if self.index else None
+        if entry is not None:
+            # Unchanged since the last scan, the row is already in the table
+            return entry.get("project") is not None
+
+        try:
+            project = self._parse_pom(root_dir, pom_path)
+        except ET.ParseError:
+            print(f"Error parsing {pom_path}: Not a valid XML file.")
+            return False
+        except Exception as e:
+            print(f"An unexpected error occurred with {pom_path}: {e}")
+            return False
+
+        was_project = bool(self._known.get(pom_path, {}).get("project"))
+        if self.index:
+            with self._lock:
+                self.index.store(pom_path, stat, project)
+        if project is None:
+            # If a parent-Tag is found, continue and search for the next pom.xml
+            if was_project:
+                self.on_removed(root_dir)
+            return False
+
+        if was_project:
+            self.on_updated(project)
+        else:
+            self._queue_project(project)
+        # When a project is found, the subfolders are not searched
+        return True
+
+    def _queue_project(self, project):
+        with self._lock:
+            self._batch.append(project)
+            if time.monotonic() - self._last_flush < self.batch_interval:
+                return
+        self._flush_batch()
+
+    def _flush_batch(self):
+        with self._lock:
+            batch = self._batch
+            self._batch = []
+            self._last_flush = time.monotonic()
+        if batch:
+            self.on_found(batch)
+        
+    def _add_directory(self, directory):
+        with self._lock:
+            self.directories.add(directory)
+
+    def run(self, subtree=None):
+        """
+        Scans base_dir, or only the directory subtree below it (used by ProjectWatcher).
+        Afterwards directories contains the searched directories without root project.
+        """
+        self._known = dict(self.index.entries) if self.index else {}
+        if subtree:
+            self._known = {pom_path: entry for pom_path, entry in self._known.items() if is_below(pom_path, subtree)}
+        self._seen = set()
+        self._lock = threading.Lock()
+        self._batch = []
+        self._last_flush = time.monotonic()
+        self.directories = set()
+        exclude_dirs, scan_threads = self._load_scan_config()
+        scanner = ProjectScanner(self.base_dir, exclude_dirs, scan_threads)
+        with TRACER.span("ProjectDiscovery.run", "scan", subtree=subtree or self.base_dir):
+            scanner.scan(self._handle_pom, subtree, self._add_directory)
+            self._flush_batch()
+
+        if self.index:
+            # Poms that were not visited anymore have been deleted (or excluded)
+            for pom_path, entry in self._known.items():
+                if pom_path not in self._seen:
+                    self.index.entries.pop(pom_path, None)
+                    if entry.get("project"):
+                        self.on_removed(entry["project"]["path"])
+            self.index.save()
+
+class ProjectWatcher:
+    """
+    Keeps the project list current after the first scan. Only the directories without root
+    project (where new projects can appear), the project directories and their pom.xml
+    files are watched, not the sources, so the number of watches grows with the number of
+    projects and not with the size of the tree. Changes are reported with changed(path),
+    e.g. by a QFileSystemWatcher; paths in polled are checked every poll_interval seconds
+    instead. After debounce seconds without further changes the affected directories are
+    scanned again with ProjectDiscovery and the differences are reported by the callbacks.
+    """
+
+    def __init__(self, base_dir, index, directories, on_found=None, on_updated=None, on_removed=None,
+                 debounce=1.0, poll_interval=5.0):
+        self.base_dir = base_dir
+        self.index = index
+        # Directories without root project, from ProjectDiscovery.directories
+        self.directories = set(directories)
+        self.on_found = on_found
+        self.on_updated = on_updated
+        self.on_removed = on_removed
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pending = set()
+        self._last_change = 0.0
+        self._polled = {}
+        self._by_normpath = {}
+        self._stopped = False
+
+    def watch_paths(self):
+        """Returns the directories and pom.xml files that have to be watched, the most important first."""
+        project_dirs = sorted(project.path for project in self.index.projects())
+        # Most important first, new projects appear in the directories without root project
+        paths = sorted(self.directories) + project_dirs + [os.path.join(path, "pom.xml") for path in project_dirs]
+        with self._lock:
+            self._by_normpath = {os.path.normcase(os.path.normpath(path)): path for path in paths}
+        return paths
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def set_polled(self, paths):
+        """Sets the paths that are not watched natively and have to be polled (all for polling only)."""
+        polled = {path: self._stat(path) for path in paths}
+        with self._lock:
+            self._polled = polled
+
+    def changed(self, path):
+        """Reports a change of a watched path, can be called from any thread."""
+        with self._lock:
+            path = self._by_normpath.get(os.path.normcase(os.path.normpath(path)), path)
+            self._pending.add(path)
+            self._last_change = time.monotonic()
+        self._wakeup.set()
+
+    def stop(self):
+        self._stopped = True
+        self._wakeup.set()
+
+    def _poll(self):
+        with self._lock:
+            polled = dict(self._polled)
+        changes = {}
+        for path, previous in polled.items():
+            current = self._stat(path)
+            if current != previous:
+                changes[path] = current
+        if changes:
+            with self._lock:
+                for path, current in changes.items():
+                    if path in self._polled:
+                        self._polled[path] = current
+            for path in changes:
+                self.changed(path)
+
+    def _take_pending(self):
+        with self._lock:
+            if not self._pending or time.monotonic() - self._last_change < self.debounce:
+                return []
+            pending = self._pending
+            self._pending = set()
+        directories = set()
+        for path in pending:
+            directories.add(os.path.dirname(path) if os.path.basename(path) == "pom.xml" else path)
+        # A directory below another changed directory is scanned with it
+        return [directory for directory in directories
+                if not any(other != directory and is_below(directory, other) for other in directories)]
+
+    def process_pending(self):
+        """Scans the changed directories once the debounce time has passed. Returns True if something was scanned."""
+        subtrees = self._take_pending()
+        for subtree in subtrees:
+            discovery = ProjectDiscovery(self.base_dir, self.index, self.on_found, self.on_updated, self.on_removed)
+            discovery.run(subtree)
+            self.directories = {directory for directory in self.directories if not is_below(directory, subtree)}
+            self.directories |= discovery.directories
+        return bool(subtrees)
+
+    def run(self, on_paths_changed=None):
+        """
+        Loop until stop(): polls, scans after changes and then calls on_paths_changed(paths)
+        with the new list of watch_paths().
+        """
+        next_poll = time.monotonic() + self.poll_interval
+        while not self._stopped:
+            with self._lock:
+                pending = bool(self._pending)
+                wait_time = max(0.0, self._last_change + self.debounce - time.monotonic()) if pending else None
+            poll_wait = max(0.0, next_poll - time.monotonic()) if self._polled else None
+            timeouts = [t for t in (wait_time, poll_wait) if t is not None]
+            self._wakeup.wait(min(timeouts) if timeouts else None)
+            self._wakeup.clear()
+            if self._stopped:
+                break
+            if self._polled and time.monotonic() >= next_poll:
+                self._poll()
+                next_poll = time.monotonic() + self.poll_interval
+            if self.process_pending() and on_paths_changed:
+                on_paths_changed(self.watch_paths())
+
+class ConfigService:
+    """
+    Central access to the config file. The file is parsed once and kept in memory, the
+    typed and pre-split values are cached. At most every check_interval seconds the
+    modification time is compared, a changed file is reloaded without a restart. Updates
+    apply at once in memory and are written write_delay seconds after the last update in
+    one atomic replace. Offers get/getint/getfloat/getboolean like ConfigParser.
+    """
+
+    def __init__(self, filename, check_interval=1.0, write_delay=0.5):
+        self.filename = filename
+        self.check_interval = check_interval
+        self.write_delay = write_delay
+        # Incremented on every reload, users of the values can see whether they are outdated
+        self.generation = 0
+        self._lock = threading.RLock()
+        self._parser = configparser.ConfigParser()
+        self._stat = None
+        self._checked = 0.0
+        self._cache = {}
+        # {section: {key: value}} not yet written
+        self._pending = {}
+        self._timer = None
+        self._load()
+
+    def _file_stat(self):
+        try:
+            stat = os.stat(self.filename)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def _load(self):
+        parser = configparser.ConfigParser()
+        stat = self._file_stat()
+        if stat is not None:
+            try:
+                parser.read(self.filename, encoding="utf-8")
+            except (configparser.Error, UnicodeDecodeError) as e:
+                # Keep the last valid values while the file is being edited
+                print(f"Fehler beim Lesen der Konfiguration {self.filename}: {e}")
+                self._stat = stat
+                return False
+        # Updates that are not written yet stay in effect
+        for section, updates in self._pending.items():
+            if not parser.has_section(section):
+                parser.add_section(section)
+            for key, value in updates.items():
+                parser.set(section, key, value)
+        self._parser = parser
+        self._stat = stat
+        self._cache = {}
+        self.generation += 1
+        return True
+
+    def reload_if_changed(self):
+        """Reloads the file if it changed since it was read, returns True after a reload."""
+        with self._lock:
+            self._checked = time.monotonic()
+            if self._file_stat() == self._stat:
+                return False
+            return self._load()
+
+    def _current(self):
+        if time.monotonic() - self._checked >= self.check_interval:
+            self.reload_if_changed()
+        return self._parser
+
+    def _cached(self, key, compute):
+        parser = self._current()
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value = compute(parser)
+        with self._lock:
+            if parser is self._parser:
+                self._cache[key] = value
+        return value
+
+    def get(self, section, option, **kwargs):
+        return self._current().get(section, option, **kwargs)
+
+    def getint(self, section, option, **kwargs):
+        return self._current().getint(section, option, **kwargs)
+
+    def getfloat(self, section, option, **kwargs):
+        return self._current().getfloat(section, option, **kwargs)
+
+    def getboolean(self, section, option, **kwargs):
+        return self._current().getboolean(section, option, **kwargs)
+
+    def get_list(self, section, option, fallback=""):
+        """Comma separated value as tuple, split once per version of the file."""
+        return self._cached(("list", section, option, fallback),
+                            lambda parser: tuple(split_config_list(parser.get(section, option, fallback=fallback))))
+
+    def goal_options(self):
+        return self.get_list("maven", "goal_options", "clean install, clean, test")
+
+    def checkbox_options(self):
+        return self.get_list("maven", "checkbox_options")
+
+    def exclude_dirs(self):
+        return self.get_list("maven", "exclude_dirs")
+
+    def scan_threads(self):
+        """Number of scanner threads or None for the default."""
+        def compute(parser):
+            value = parser.get("maven", "scan_threads", fallback="").strip()
+            try:
+                return int(value) if value else None
+            except ValueError:
+                print(f"Ungültiger Wert für scan_threads: {value}")
+                return None
+        return self._cached(("scan_threads",), compute)
+
+    def update(self, section, updates):
+        """Applies the updates ({key: value}) at once, the file is written after write_delay."""
+        with self._lock:
+            if not self._parser.has_section(section):
+                self._parser.add_section(section)
+            changed = False
+            for key, value in updates.items():
+                # The parser interpolates %(name)s, a plain % is escaped in memory and in the file
+                escaped = str(value).replace("%", "%%")
+                if self._parser.get(section, key, raw=True, fallback=None) == escaped:
+                    continue
+                self._pending.setdefault(section, {})[key] = escaped
+                self._parser.set(section, key, escaped)
+                changed = True
+            if not changed:
+                return
+            self._cache = {}
+            # Several updates in a row are written once
+            if self._timer:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.write_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Writes the pending updates now."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            pending = self._pending
+            self._pending = {}
+            changed_by_others = self._file_stat() != self._stat
+            write_config_updates(self.filename, pending)
+            if changed_by_others:
+                # The file was edited since it was read, the written file contains these changes
+                self._load()
+            else:
+                # The values in memory are what was written, nothing to reload
+                self._stat = self._file_stat()
+
+_config_services = {}
+_config_services_lock = threading.Lock()
+
+def load_config(config_file=None):
+    """Shared ConfigService of the config file (CONFIG_FILE by default)."""
+    filename = os.path.abspath(config_file or CONFIG_FILE)
+    with _config_services_lock:
+        service = _config_services.get(filename)
+        if service is None:
+            service = _config_services[filename] = ConfigService(filename)
+        return service
+
+def split_config_list(value):
+    # Comma separated list from the config file
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+def build_command(config, goal, checked_options=(), user_options=""):
+    """Assembles the Maven command: goal, default_options, checkbox options, user options and extra_options."""
+    if platform.system().lower() == "windows":
+        maven_executable = config.get("maven", "maven_executable", fallback="mvn.cmd")
+    else:
+        maven_executable = "mvn"
+    
+    goal_str = (goal or "").strip()
+    if goal_str:
+        command = [maven_executable] + goal_str.split()
+    else:
+        command = [maven_executable]
+    
+    default_config_options = config.get("maven", "default_options", fallback="").split()
+    extra_config_options = config.get("maven", "extra_options", fallback="").split()
+    options_from_checkboxes = []
+    for option in checked_options:
+        options_from_checkboxes.extend(option.split())
+    user_options = user_options.strip().split() if user_options and user_options.strip() else []
+    
+    command += default_config_options + options_from_checkboxes + user_options + extra_config_options
+    return command
+
+def max_parallel_builds(config, command):
+    max_parallel = config.get("maven", "max_parallel_builds", fallback="").strip()
+    if max_parallel:
+        try:
+            return max(1, int(max_parallel))
+        except ValueError:
+            print(f"Ungültiger Wert für max_parallel_builds: {max_parallel}")
+    return default_parallel_builds(command)
+
+def thread_advice(config, history, project, command, max_parallel, cpu_count=None):
+    """
+    Returns (command, note) with the -T value suggested from the resource history of the
+    project (adaptive_threads): "auto" applies it, "suggest" only names it in the note.
+    """
+    mode = config.get("maven", "adaptive_threads", fallback="suggest").strip().lower()
+    if mode not in ("suggest", "auto"):
+        return command, None
+    cpu_count = cpu_count or os.cpu_count() or 1
+    try:
+        builds = history.resource_usage(project.path)
+    except Exception:
+        return command, None
+    # The cores are shared by the builds running side by side
+    suggestion = suggest_thread_count(builds, max(1, cpu_count // max(1, max_parallel)))
+    current = maven_thread_count(command, cpu_count)
+    if suggestion is None or suggestion == current:
+        return command, None
+    if mode == "auto":
+        return with_thread_count(command, suggestion), f"Verwende -T {suggestion} statt {current} Threads (aus der Ressourcen-Historie)"
+    return command, f"Empfehlung aus der Ressourcen-Historie: -T {suggestion} statt {current} Threads"
+
+def test_shard_count(config, max_parallel):
+    # 0 = as many shards as builds may run in parallel
+    shards = config.getint("maven", "test_shards", fallback=0)
+    return shards if shards > 0 else max_parallel
+
+def log_directory(config):
+    log_dir = config.get("maven", "log_directory", fallback="logs")
+    if not os.path.isabs(log_dir):
+        log_dir = os.path.join(os.path.dirname(os.path.abspath(CONFIG_FILE)), log_dir)
+    return log_dir
+
+def build_log_path(config, project, suffix=""):
+    # suffix keeps the logs of several runs of a project started in the same second apart
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return os.path.join(log_directory(config), f"{project.artifactId}_{timestamp}{suffix}.log.gz")
+
+def create_snapshot_store(config):
+    paths = split_config_list(config.get("maven", "change_detection_paths", fallback="pom.xml, src"))
+    use_hash = config.getboolean("maven", "change_detection_hash", fallback=False)
+    return SnapshotStore(SNAPSHOT_DIRECTORY, paths, use_hash)
+
+def build_environment(config, jdks, project):
+    """
+    Returns (env, note) for the build of a project: JAVA_HOME and PATH of the best JDK for
+    its Java version, or (None, note) to use the environment as it is.
+    """
+    if not config.getboolean("java", "auto_java_home", fallback=True):
+        return None, None
+    if java_feature_version(project.java_version) is None:
+        return None, None
+    jdk = select_jdk(jdks or [], project.java_version)
+    if jdk is None:
+        return None, f"Kein passendes JDK für Java {project.java_version} gefunden, verwende das JDK aus PATH"
+    return jdk_environment(jdk), f"JDK: {jdk.name} ({jdk.version}) für Java {project.java_version}"
+
+def build_limits(config):
+    return BuildLimits(config.getfloat("maven", "build_timeout_minutes", fallback=0) * 60,
+                       config.getfloat("maven", "stall_timeout_minutes", fallback=0) * 60,
+                       config.getfloat("maven", "cancel_grace_period", fallback=10))
+
+def create_offline_resolver(config):
+    """OfflineResolver for the builds or None if auto_offline is switched off."""
+    if not config.getboolean("maven", "auto_offline", fallback=True):
+        return None
+    repository = config.get("maven", "local_repository", fallback="").strip() or default_local_repository()
+    index = LocalRepositoryIndex(repository)
+    index.load()
+    return OfflineResolver(index)
+
+def create_build_cache(config):
+    """BuildCache for the builds or None if build_cache is switched off."""
+    if not config.getboolean("maven", "build_cache", fallback=False):
+        return None
+    repository = config.get("maven", "local_repository", fallback="").strip() or default_local_repository()
+    max_size = config.getfloat("maven", "build_cache_size_mb", fallback=2048) * 1024 * 1024
+    return BuildCache(BUILD_CACHE_DIRECTORY, repository, max_size)
+
+def create_batch_job(config, projects, command, executors, jdks):
+    """
+    BatchJob for the projects with the JDK for the highest Java version among them,
+    returns (job, notes). Raises ValueError if they cannot be built in one reactor.
+    """
+    newest = max(projects, key=lambda project: java_feature_version(project.java_version) or 0)
+    env, jdk_note = build_environment(config, jdks, newest)
+    log_path = os.path.join(log_directory(config), f"batch_{time.strftime('%Y%m%d_%H%M%S')}.log.gz")
+    job = BatchJob(projects, batch_command(config, command), log_path, env=env,
+                   member_log_paths={project.path: build_log_path(config, project) for project in projects})
+    job.executor, note = executors.for_project(job.project)
+    return job, [text for text in (note, jdk_note) if text]
+
+def discover_jdks(config, force=False):
+    install_dir = config.get("java", "install_directory", fallback="")
+    try:
+        return JdkDiscovery(install_dir).discover(force)
+    except FileNotFoundError:
+        return []
+
+def run_builds(jobs, max_parallel, snapshot_store=None, on_output=None, on_finished=None, offline_resolver=None,
+               limits=None, build_cache=None):
+    """
+    Runs the build jobs without Qt, at most max_parallel at the same time and each in its
+    own thread. on_output(job, text) receives the output in chunks, on_finished(job) is
+    called for every finished or skipped job. Returns the jobs.
+    """
+    pending = list(jobs)
+    running = []
+    finished = queue.Queue()
+    on_output = on_output or (lambda job, text: None)
+    on_finished = on_finished or (lambda job: None)
+
+    def run(job):
+        try:
+            job.build.run()
+        finally:
+            finished.put(job)
+
+    try:
+        while pending or running:
+            while pending and len(running) < max_parallel:
+                job, skipped = take_ready_job(pending)
+                for skipped_job in skipped:
+                    on_finished(skipped_job)
+                if job is None:
+                    break
+                job.start(snapshot_store, offline_resolver, limits, build_cache)
+                job.worker = threading.Thread(target=run, args=(job,), daemon=True)
+                running.append(job)
+                job.worker.start()
+            if not running:
+                # Remaining jobs depend on jobs that are not part of this run
+                for job in pending:
+                    job.status = BuildJob.SKIPPED
+                    on_finished(job)
+                break
+            try:
+                done = finished.get(timeout=0.1)
+            except queue.Empty:
+                done = None
+            for job in running:
+                text = job.build.console.take()
+                if text:
+                    on_output(job, text)
+            if done is not None:
+                done.finish()
+                running.remove(done)
+                on_finished(done)
+    except KeyboardInterrupt:
+        for job in running:
+            job.build.cancel()
+        for job in running:
+            job.worker.join()
+            job.finish()
+            on_finished(job)
+        raise
+    return jobs
+
+def _cli_projects(config, rescan=False):
+    base_dir = config.get("maven", "projects_directory", fallback=".")
+    index = ProjectIndex(PROJECT_INDEX_FILE, base_dir)
+    index.load()
+    stats = {"added": 0, "updated": 0, "removed": 0}
+    if rescan or not index.entries:
+        def found(projects):
+            stats["added"] += len(projects)
+        def updated(project):
+            stats["updated"] += 1
+        def removed(path):
+            stats["removed"] += 1
+        ProjectDiscovery(base_dir, index, found, updated, removed).run()
+    return index.projects(), stats
+
+def _cli_scan(config, args):
+    start = time.monotonic()
+    projects, stats = _cli_projects(config, rescan=True)
+    result = dict(stats, projects=len(projects), seconds=round(time.monotonic() - start, 3))
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"{result['projects']} Projekte ({result['added']} neu, {result['updated']} geändert, "
+              f"{result['removed']} entfernt) in {result['seconds']} s")
+    return 0
+
+def _cli_list(config, args):
+    projects, _ = _cli_projects(config, args.rescan)
+    projects.sort(key=lambda project: (project.artifactId or "").lower())
+    if args.json:
+        print(json.dumps([project.to_dict() for project in projects]))
+    else:
+        for project in projects:
+            print(f"{project.artifactId}\t{project.groupId}\t{project.java_version}\t{project.path}")
+            if args.modules:
+                for module in project.all_modules():
+                    indent = "  " * (module.selector.count("/") + 1)
+                    profile = f"\t(Profil {module.profile})" if module.profile else ""
+                    print(f"{indent}{module.artifactId}\t{module.selector}{profile}")
+    return 0
+
+def _cli_build(config, args):
+    projects, _ = _cli_projects(config, args.rescan)
+    by_name = {}
+    for project in projects:
+        by_name.setdefault(project.artifactId, []).append(project)
+        by_name.setdefault(os.path.abspath(project.path), []).append(project)
+    selected = []
+    for name in args.projects:
+        matches = by_name.get(name) or by_name.get(os.path.abspath(name))
+        if not matches:
+            print(f"Projekt nicht gefunden: {name}", file=sys.stderr)
+            return 2
+        if len(matches) > 1:
+            print(f"Projekt nicht eindeutig: {name} (" + ", ".join(p.path for p in matches) + ")", file=sys.stderr)
+            return 2
+        selected.append(matches[0])
+
+    goal = args.goal if args.goal is not None else config.get("maven", "last_selected_goal", fallback="clean install")
+    command = build_command(config, goal, args.option, args.user_options)
+    graph = DependencyGraph(projects)
+    paths = [project.path for project in selected]
+    if args.upstream:
+        paths = graph.with_upstream(paths)
+    elif args.downstream:
+        paths = graph.with_downstream(paths)
+    try:
+        order = graph.build_order(paths)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    # Selected modules per root project, by artifactId or path relative to the project
+    module_options = {}
+    for name in split_config_list(args.modules):
+        matches = [(project, module) for project in selected for module in project.all_modules()
+                   if name in (module.artifactId, module.selector)]
+        if not matches:
+            print(f"Modul nicht gefunden: {name}", file=sys.stderr)
+            return 2
+        for project, module in matches:
+            module_options.setdefault(project.path, []).append(module)
+    module_options = {path: module_build_options(modules, args.module_mode) for path, modules in module_options.items()}
+
+    executors = ExecutorRegistry(config)
+    jdks = discover_jdks(config)
+    history = BuildHistory(HISTORY_DATABASE)
+    max_parallel = args.jobs or max_parallel_builds(config, command)
+    shards = test_shard_count(config, max_parallel)
+    jobs = []
+    # Project path -> jobs the project is done with
+    jobs_by_path = {}
+    batch = None
+    if args.batch and len(order) > 1:
+        if module_options or args.test_mode != "all":
+            print("--batch kann nicht mit --modules oder --test-mode kombiniert werden", file=sys.stderr)
+            return 2
+        try:
+            # The reactor orders the projects itself
+            batch, notes = create_batch_job(config, [project for project, _ in order], command, executors, jdks)
+        except (OSError, ValueError) as e:
+            print(f"Batch-Build nicht möglich: {e}", file=sys.stderr)
+            return 2
+        for text in notes:
+            if not args.json:
+                print(f"{batch.project.artifactId}: {text}", file=sys.stderr)
+        jobs.append(batch)
+        order = []
+    for project, dependencies in order:
+        depends_on = [job for path in dependencies for job in jobs_by_path[path]]
+        project_command, thread_note = thread_advice(config, history, project, command, max_parallel)
+        project_command = project_command + module_options.get(project.path, [])
+        executor, note = executors.for_project(project)
+        env, jdk_note = build_environment(config, jdks, project)
+        tests = history.test_classes(project.path) if args.test_mode != "all" else []
+        runs, test_note = test_run_plan(project_command, args.test_mode, tests, shards)
+        for text in (note, jdk_note, thread_note, test_note):
+            if text and not args.json:
+                print(f"{project.artifactId}: {text}", file=sys.stderr)
+        project_jobs = []
+        for index, (label, run_command, run_dependencies) in enumerate(runs):
+            if not args.json:
+                # The command of the job, with the module options and the adapted -T
+                print(f"{project.artifactId}: {label or 'Ausführung'}: " + " ".join(run_command), file=sys.stderr)
+            log_path = build_log_path(config, project, f"_{index + 1}" if len(runs) > 1 else "")
+            project_jobs.append(BuildJob(project, run_command, log_path,
+                                         depends_on + [project_jobs[dependency] for dependency in run_dependencies],
+                                         args.only_changed, executor, env, label))
+        jobs += project_jobs
+        jobs_by_path[project.path] = [project_jobs[index] for index in final_runs(runs)]
+
+    def write_output(job, text):
+        if args.output and text:
+            prefix = f"[{job.name()}] "
+            sys.stderr.write("".join(prefix + line + "\n" for line in text.splitlines()))
+
+    def output(job, text):
+        if job is not batch:
+            write_output(job, text)
+            return
+        # The output of a batch build is shown per project
+        for member in batch.members:
+            write_output(member, batch.member_output(member))
+
+    def finished(job):
+        if job is batch:
+            batch.update_members()
+            for member in batch.members:
+                finished(member)
+            return
+        history.record(job)
+        if not args.json:
+            print(f"{job.name()}: {job.status} ({job.elapsed():.1f} s)", flush=True)
+
+    if batch and not args.json:
+        print("Ausführung: " + " ".join(batch.command), flush=True)
+    try:
+        run_builds(jobs, max_parallel, create_snapshot_store(config), output, finished, create_offline_resolver(config),
+                   build_limits(config), create_build_cache(config))
+    finally:
+        executors.shutdown()
+    if batch:
+        jobs = batch.members
+    success = all(job.is_successful() for job in jobs)
+    if args.json:
+        print(json.dumps({
+            "success": success,
+            "command": batch.command if batch else command,
+            "batch": {"retcode": batch.build.retcode if batch.build else None, "log": batch.log_path} if batch else None,
+            "jobs": [{
+                "artifactId": job.project.artifactId,
+                "label": job.label,
+                "path": job.project.path,
+                "status": job.status,
+                "retcode": job.build.retcode if job.build else None,
+                "seconds": round(job.elapsed(), 3),
+                # The members of a batch have a log once the batch build ran
+                "log": job.log_path if job.build or (job.batch and job.batch.build) else None,
+                "command": job.command,
+                "peak_rss": job.build.resources.peak_rss if job.build and job.build.resources else None,
+                "cpu_seconds": round(job.build.resources.cpu_seconds, 3) if job.build and job.build.resources else None,
+                "test_classes": len(job.build.test_results) if job.build else 0,
+                "failed_tests": [result.name for result in job.build.test_results
+                                 if result.status == TestClassResult.FAILED] if job.build else [],
+            } for job in jobs],
+        }))
+    return 0 if success else 1
+
+def _cli_logs(config, args):
+    if not args.file:
+        for path, index in archived_logs(log_directory(config)):
+            if index:
+                print(f"{path}\t{index['lines']} Zeilen\t{len(index['errors'])} Fehler\t{len(index['warnings'])} Warnungen")
+            else:
+                print(f"{path}\tohne Index")
+        return 0
+    try:
+        archive = LogArchive(args.file)
+    except OSError as e:
+        print(f"Log kann nicht geöffnet werden: {e}", file=sys.stderr)
+        return 2
+    with archive:
+        if args.errors:
+            for number, name in archive.index["failed_modules"]:
+                print(f"{number + 1}: Modul fehlgeschlagen: {name}")
+            for number, text in archive.index["test_failures"]:
+                print(f"{number + 1}: {text}")
+            for number in archive.index["errors"]:
+                print(f"{number + 1}: {archive.lines(number, 1)[0]}")
+            return 0
+        start = 0
+        if args.start:
+            start = args.start - 1
+        elif args.first_error:
+            start = archive.first_error() or 0
+        for offset, line in enumerate(archive.lines(start, args.count)):
+            print(f"{start + offset + 1}: {line}")
+    return 0
+
+def _cli_cache(config, args):
+    build_cache = create_build_cache(config)
+    if build_cache is None:
+        print("Der Build-Cache ist ausgeschaltet (build_cache = false)", file=sys.stderr)
+        return 2
+    if args.clear:
+        build_cache.clear()
+    stats = build_cache.stats()
+    if args.json:
+        print(json.dumps(stats))
+    else:
+        print(format_cache_stats(stats))
+    return 0
+
+def _cli_daemon_check(config, args):
+    if args.command:
+        daemon_command = args.command.split()
+    else:
+        daemon_command = config.get("maven", "daemon_command", fallback="").split()
+    if not daemon_command:
+        # Without daemon_command the reference implementation next to this file is checked
+        daemon_command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_daemon.py")]
+    executor = WarmDaemonExecutor(daemon_command)
+    print(f"Prüfe {executor.describe()}")
+    command = ["mvn"] + args.args.split()
+    pids = []
+    ok = True
+    try:
+        for number in range(1, args.builds + 1):
+            run = executor.start(command, os.path.abspath(args.directory))
+            lines = 0
+            while True:
+                line = run.readline(timeout=args.timeout)
+                if line is None:
+                    print(f"Build {number}: keine Antwort innerhalb von {args.timeout} s", file=sys.stderr)
+                    run.cancel()
+                    return 1
+                if not line:
+                    break
+                lines += 1
+                if args.output:
+                    print(line.rstrip("\r\n"), file=sys.stderr)
+            retcode = run.wait()
+            # Without the exit marker the daemon has ended, the build was not answered by the protocol
+            answered = run.daemon.process.poll() is None
+            pids.append(run.pid)
+            print(f"Build {number}: Daemon {run.pid}, {lines} Zeilen, Exit-Code {retcode}"
+                  + ("" if answered else ", Daemon beendet ohne " + WarmDaemonExecutor.EXIT_MARKER))
+            ok = ok and answered
+    finally:
+        executor.shutdown()
+    reused = len(set(pids)) == 1
+    print("Daemon wurde wiederverwendet" if reused else "Daemon wurde nicht wiederverwendet")
+    return 0 if ok and reused else 1
+
+def run_cli(config, argv):
+    parser = argparse.ArgumentParser(prog="maven_build_manager",
+                                     description="Maven Build Manager ohne Oberfläche (ohne Argumente startet die GUI)")
+    parser.add_argument("--trace", metavar="DATEI", help="Tracing aktivieren und als Chrome-Trace (JSON) speichern")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = subparsers.add_parser("scan", help="Projekte suchen und den Projekt-Index aktualisieren")
+    scan_parser.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    scan_parser.set_defaults(func=_cli_scan)
+
+    list_parser = subparsers.add_parser("list", help="Gefundene Projekte auflisten")
+    list_parser.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    list_parser.add_argument("--rescan", action="store_true", help="Vorher nach geänderten Projekten suchen")
+    list_parser.add_argument("--modules", action="store_true", help="Auch die Module der Projekte auflisten")
+    list_parser.set_defaults(func=_cli_list)
+
+    build_parser = subparsers.add_parser("build", help="Projekte bauen (Exit-Code 0 nur wenn alle Builds erfolgreich waren)")
+    build_parser.add_argument("projects", nargs="+", metavar="artifactId", help="ArtifactId oder Pfad der Projekte")
+    build_parser.add_argument("--jobs", "-j", type=int, default=None, help="Anzahl paralleler Builds (Standard: max_parallel_builds)")
+    build_parser.add_argument("--goal", default=None, help="Maven Ziel (Standard: last_selected_goal)")
+    build_parser.add_argument("--option", action="append", default=[], help="Option wie eine Checkbox, z. B. --option=\"-T 1C\" (mehrfach möglich)")
+    build_parser.add_argument("--user-options", default="", help="Weitere Maven Optionen")
+    dependency_group = build_parser.add_mutually_exclusive_group()
+    dependency_group.add_argument("--upstream", action="store_true", help="Auch alle Projekte bauen, von denen die Projekte abhängen")
+    dependency_group.add_argument("--downstream", action="store_true", help="Auch alle Projekte bauen, die von den Projekten abhängen")
+    build_parser.add_argument("--modules", default="", help="Nur diese Module bauen (artifactId oder Pfad, kommasepariert)")
+    build_parser.add_argument("--module-mode", choices=("am", "amd", "none"), default="am",
+                              help="Mit den Modulen, von denen sie abhängen (am, Standard), die von ihnen abhängen (amd) oder nur die Module")
+    build_parser.add_argument("--test-mode", choices=TEST_MODES, default="all",
+                              help="Alle Tests (Standard), nur die zuletzt fehlgeschlagenen (failed), diese zuerst (failed_first)"
+                                   " oder die Testklassen nach Dauer auf parallele Shards verteilt (shards)")
+    build_parser.add_argument("--batch", action="store_true",
+                              help="Alle Projekte über einen generierten Aggregator in einem Maven-Aufruf bauen (mit -T und -fae)")
+    build_parser.add_argument("--only-changed", action="store_true", help="Unveränderte Projekte überspringen")
+    build_parser.add_argument("--rescan", action="store_true", help="Vorher nach geänderten Projekten suchen")
+    build_parser.add_argument("--output", action="store_true", help="Build-Ausgabe auf stderr ausgeben")
+    build_parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    build_parser.set_defaults(func=_cli_build)
+
+    logs_parser = subparsers.add_parser("logs", help="Archivierte Build-Logs auflisten oder lesen")
+    logs_parser.add_argument("file", nargs="?", help="Log-Datei (.log.gz), ohne Angabe werden alle Logs aufgelistet")
+    logs_parser.add_argument("--errors", action="store_true", help="Nur Fehler, fehlgeschlagene Module und Tests ausgeben")
+    logs_parser.add_argument("--first-error", action="store_true", help="Ab dem ersten Fehler ausgeben")
+    logs_parser.add_argument("--start", type=int, default=None, help="Erste Zeile (ab 1)")
+    logs_parser.add_argument("--count", type=int, default=100, help="Anzahl Zeilen (Standard: 100)")
+    logs_parser.set_defaults(func=_cli_logs)
+
+    cache_parser = subparsers.add_parser("cache", help="Statistik des Build-Caches anzeigen")
+    cache_parser.add_argument("--clear", action="store_true", help="Build-Cache vorher leeren")
+    cache_parser.add_argument("--json", action="store_true", help="Ausgabe als JSON")
+    cache_parser.set_defaults(func=_cli_cache)
+
+    daemon_parser = subparsers.add_parser("daemon-check", help="Protokoll und Wiederverwendung des Build-Daemons prüfen")
+    daemon_parser.add_argument("--command", default=None,
+                               help="Befehl des Daemons (Standard: daemon_command, sonst fake_daemon.py)")
+    daemon_parser.add_argument("--args", default="validate", help="Maven Argumente der Builds (Standard: validate)")
+    daemon_parser.add_argument("--builds", type=int, default=2, help="Anzahl Builds nacheinander (Standard: 2)")
+    daemon_parser.add_argument("--directory", default=".", help="Arbeitsverzeichnis der Builds (Standard: aktuelles Verzeichnis)")
+    daemon_parser.add_argument("--timeout", type=float, default=60, help="Sekunden ohne Ausgabe bis zum Abbruch (Standard: 60)")
+    daemon_parser.add_argument("--output", action="store_true", help="Ausgabe der Builds auf stderr ausgeben")
+    daemon_parser.set_defaults(func=_cli_daemon_check)
+
+    args = parser.parse_args(argv)
+    if not args.trace:
+        return args.func(config, args)
+    TRACER.enabled = True
+    try:
+        return args.func(config, args)
+    finally:
+        TRACER.export(args.trace)
+        print(format_trace_summary(TRACER), file=sys.stderr)
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    config = load_config()
+    if argv:
+        sys.exit(run_cli(config, argv))
     
-    app = QtWidgets.QApplication(sys.argv)
-    window = MavenBuildGUI(config)
-    window.show()
-    sys.exit(app.exec_())
+    # PyQt is only imported for the GUI
+    from maven_build_gui import run_gui
+    sys.exit(run_gui(config))
 
 if __name__ == '__main__':
     main()